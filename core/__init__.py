@@ -3,152 +3,240 @@
 Complete suite for world-class legal AI prompting in South Africa
 """
 
-from .advanced_frameworks import (
-    ALL_FRAMEWORKS,
-    get_frameworks_by_category,
-    get_frameworks_by_difficulty,
-    get_framework_by_acronym as recommend_framework,
-    generate_combined_prompt,
-    FrameworkCategory,
-    PromptingFramework
-)
-
-from .specialist_courts import (
-    ALL_SPECIALIST_COURTS as ALL_COURTS,
-    get_courts_by_category,
-    generate_court_prompt_guidance as generate_court_prompt,
-    CourtCategory,
-    JurisdictionType,
-    SpecialistCourt
-)
-
-from .sa_legislation import (
-    ALL_LEGISLATION,
-    generate_legislation_prompt,
-    LegislationCategory,
-    KeyProvision,
-    SALegislation
-)
-
-from .legal_ethics import (
-    ALL_GUIDELINES as ALL_ETHICAL_GUIDELINES,
-    AI_USE_SCENARIOS as ALL_AI_USE_SCENARIOS,
-    assess_ai_use_risk,
-    generate_ethics_checklist,
-    EthicsCategory,
-    RiskLevel,
-    EthicalGuideline,
-    AIUseScenario
-)
-
-from .practice_area_prompts import (
-    ALL_PRACTICE_PROMPTS,
-    get_prompts_by_area,
-    get_prompts_by_type,
-    generate_practice_prompt,
-    PracticeArea,
-    PromptType,
-    PracticeAreaPrompt
-)
-
-from .document_templates import (
-    ALL_DOCUMENT_TEMPLATES,
-    get_templates_by_category,
-    get_template_structure,
-    generate_document_prompt,
-    DocumentCategory,
-    Court,
-    DocumentSection,
-    DocumentTemplate
-)
-
-from .workflow_pipelines import (
-    ALL_WORKFLOWS,
-    get_workflows_by_category,
-    get_workflow_summary,
-    get_step_prompt,
-    WorkflowCategory,
-    StepType,
-    WorkflowStep,
-    LegalWorkflow
-)
-
-from .prompt_optimizer import (
-    OptimizationMode,
-    LegalOutputFormat,
-    PracticeAreaPreset,
-    OptimizedPrompt,
-    PresetConfiguration,
-    optimize_legal_prompt,
-    optimize_with_preset,
-    optimize_with_crispe,
-    optimize_with_co_star,
-    optimize_with_chain_of_thought,
-    optimize_with_rise,
-    optimize_with_o1_style,
-    optimize_with_meta_prompt,
-    optimize_with_hybrid_legal,
-    optimize_with_claude_style,
+import importlib
+
+# Public name -> (submodule, attribute). Submodules build their registries at
+# import time, so they are only imported when one of their names is first used
+# (PEP 562 module __getattr__).
+_LAZY_EXPORTS = {
+    # Frameworks
+    "ALL_FRAMEWORKS": ("advanced_frameworks", "ALL_FRAMEWORKS"),
+    "FRAMEWORK_OPTIONS": ("advanced_frameworks", "FRAMEWORK_OPTIONS"),
+    "N_FRAMEWORKS": ("advanced_frameworks", "N_FRAMEWORKS"),
+    "FRAMEWORK_CATEGORY_LABELS": ("advanced_frameworks", "FRAMEWORK_CATEGORY_LABELS"),
+    "get_frameworks_by_category": ("advanced_frameworks", "get_frameworks_by_category"),
+    "get_frameworks_by_difficulty": ("advanced_frameworks", "get_frameworks_by_difficulty"),
+    "recommend_framework": ("advanced_frameworks", "get_framework_by_acronym"),
+    "FRAMEWORKS_BY_ACRONYM": ("advanced_frameworks", "FRAMEWORKS_BY_ACRONYM"),
+    "FRAMEWORKS_BY_CATEGORY": ("advanced_frameworks", "FRAMEWORKS_BY_CATEGORY"),
+    "FRAMEWORKS_BY_DIFFICULTY": ("advanced_frameworks", "FRAMEWORKS_BY_DIFFICULTY"),
+    "get_frameworks_by_prefix": ("advanced_frameworks", "get_frameworks_by_prefix"),
+    "generate_combined_prompt": ("advanced_frameworks", "generate_combined_prompt"),
+    "FrameworkCategory": ("advanced_frameworks", "FrameworkCategory"),
+    "PromptingFramework": ("advanced_frameworks", "PromptingFramework"),
+    "Component": ("advanced_frameworks", "Component"),
+
+    # Courts
+    "ALL_COURTS": ("specialist_courts", "ALL_SPECIALIST_COURTS"),
+    "COURT_OPTIONS": ("specialist_courts", "COURT_OPTIONS"),
+    "N_COURTS": ("specialist_courts", "N_COURTS"),
+    "COURT_CATEGORY_LABELS": ("specialist_courts", "COURT_CATEGORY_LABELS"),
+    "get_courts_by_category": ("specialist_courts", "get_courts_by_category"),
+    "generate_court_prompt": ("specialist_courts", "generate_court_prompt_guidance"),
+    "CourtCategory": ("specialist_courts", "CourtCategory"),
+    "JurisdictionType": ("specialist_courts", "JurisdictionType"),
+    "SpecialistCourt": ("specialist_courts", "SpecialistCourt"),
+
+    # Legislation
+    "ALL_LEGISLATION": ("sa_legislation", "ALL_LEGISLATION"),
+    "LEGISLATION_OPTIONS": ("sa_legislation", "LEGISLATION_OPTIONS"),
+    "LEGISLATION_LABELS": ("sa_legislation", "LEGISLATION_LABELS"),
+    "N_LEGISLATION": ("sa_legislation", "N_LEGISLATION"),
+    "generate_legislation_prompt": ("sa_legislation", "generate_legislation_prompt"),
+    "LegislationCategory": ("sa_legislation", "LegislationCategory"),
+    "KeyProvision": ("sa_legislation", "KeyProvision"),
+    "SALegislation": ("sa_legislation", "SALegislation"),
+
+    # Ethics
+    "ALL_ETHICAL_GUIDELINES": ("legal_ethics", "ALL_GUIDELINES"),
+    "ALL_AI_USE_SCENARIOS": ("legal_ethics", "AI_USE_SCENARIOS"),
+    "AI_USE_SCENARIOS_BY_NAME": ("legal_ethics", "AI_USE_SCENARIOS_BY_NAME"),
+    "GUIDELINE_OPTIONS": ("legal_ethics", "GUIDELINE_OPTIONS"),
+    "N_GUIDELINES": ("legal_ethics", "N_GUIDELINES"),
+    "GUIDELINES_BY_CATEGORY": ("legal_ethics", "GUIDELINES_BY_CATEGORY"),
+    "get_guidelines_by_categories": ("legal_ethics", "get_guidelines_by_categories"),
+    "SCENARIOS_BY_RISK": ("legal_ethics", "SCENARIOS_BY_RISK"),
+    "get_scenarios_by_risk": ("legal_ethics", "get_scenarios_by_risk"),
+    "assess_ai_use_risk": ("legal_ethics", "assess_ai_use_risk"),
+    "generate_ethics_checklist": ("legal_ethics", "generate_ethics_checklist"),
+    "get_ethics_checklist": ("legal_ethics", "get_ethics_checklist"),
+    "EthicsCategory": ("legal_ethics", "EthicsCategory"),
+    "RiskLevel": ("legal_ethics", "RiskLevel"),
+    "EthicalGuideline": ("legal_ethics", "EthicalGuideline"),
+    "Example": ("legal_ethics", "Example"),
+    "AIUseScenario": ("legal_ethics", "AIUseScenario"),
+
+    # Practice Areas
+    "ALL_PRACTICE_PROMPTS": ("practice_area_prompts", "ALL_PRACTICE_PROMPTS"),
+    "PRACTICE_PROMPT_OPTIONS": ("practice_area_prompts", "PRACTICE_PROMPT_OPTIONS"),
+    "PRACTICE_PROMPT_LABELS": ("practice_area_prompts", "PRACTICE_PROMPT_LABELS"),
+    "N_PRACTICE_PROMPTS": ("practice_area_prompts", "N_PRACTICE_PROMPTS"),
+    "PRACTICE_AREA_LABELS": ("practice_area_prompts", "PRACTICE_AREA_LABELS"),
+    "get_prompts_by_area": ("practice_area_prompts", "get_prompts_by_area"),
+    "get_prompts_by_type": ("practice_area_prompts", "get_prompts_by_type"),
+    "generate_practice_prompt": ("practice_area_prompts", "generate_practice_prompt"),
+    "PracticeArea": ("practice_area_prompts", "PracticeArea"),
+    "PromptType": ("practice_area_prompts", "PromptType"),
+    "PracticeAreaPrompt": ("practice_area_prompts", "PracticeAreaPrompt"),
+
+    # Documents
+    "ALL_DOCUMENT_TEMPLATES": ("document_templates", "ALL_DOCUMENT_TEMPLATES"),
+    "DOCUMENT_TEMPLATE_OPTIONS": ("document_templates", "DOCUMENT_TEMPLATE_OPTIONS"),
+    "DOCUMENT_TEMPLATE_LABELS": ("document_templates", "DOCUMENT_TEMPLATE_LABELS"),
+    "N_DOCUMENT_TEMPLATES": ("document_templates", "N_DOCUMENT_TEMPLATES"),
+    "DOCUMENT_CATEGORY_LABELS": ("document_templates", "DOCUMENT_CATEGORY_LABELS"),
+    "get_document_templates_by_category": ("document_templates", "get_templates_by_category"),
+    # get_templates_by_category resolves to the prompt_optimizer version below
+    "DOCUMENT_TEMPLATES_BY_CATEGORY": ("document_templates", "DOCUMENT_TEMPLATES_BY_CATEGORY"),
+    "get_template_structure": ("document_templates", "get_template_structure"),
+    "generate_document_prompt": ("document_templates", "generate_document_prompt"),
+    "DocumentCategory": ("document_templates", "DocumentCategory"),
+    "Court": ("document_templates", "Court"),
+    "DocumentSection": ("document_templates", "DocumentSection"),
+    "DocumentTemplate": ("document_templates", "DocumentTemplate"),
+
+    # Workflows
+    "ALL_WORKFLOWS": ("workflow_pipelines", "ALL_WORKFLOWS"),
+    "WORKFLOW_OPTIONS": ("workflow_pipelines", "WORKFLOW_OPTIONS"),
+    "WORKFLOW_LABELS": ("workflow_pipelines", "WORKFLOW_LABELS"),
+    "N_WORKFLOWS": ("workflow_pipelines", "N_WORKFLOWS"),
+    "WORKFLOW_CATEGORY_LABELS": ("workflow_pipelines", "WORKFLOW_CATEGORY_LABELS"),
+    "get_workflows_by_category": ("workflow_pipelines", "get_workflows_by_category"),
+    "get_workflow_summary": ("workflow_pipelines", "get_workflow_summary"),
+    "get_step_prompt": ("workflow_pipelines", "get_step_prompt"),
+    "WorkflowCategory": ("workflow_pipelines", "WorkflowCategory"),
+    "StepType": ("workflow_pipelines", "StepType"),
+    "WorkflowStep": ("workflow_pipelines", "WorkflowStep"),
+    "LegalWorkflow": ("workflow_pipelines", "LegalWorkflow"),
+
+    # Prompt Optimizer
+    "OptimizationMode": ("prompt_optimizer", "OptimizationMode"),
+    "N_OPTIMIZATION_MODES": ("prompt_optimizer", "N_OPTIMIZATION_MODES"),
+    "LegalOutputFormat": ("prompt_optimizer", "LegalOutputFormat"),
+    "PracticeAreaPreset": ("prompt_optimizer", "PracticeAreaPreset"),
+    "OptimizedPrompt": ("prompt_optimizer", "OptimizedPrompt"),
+    "PresetConfiguration": ("prompt_optimizer", "PresetConfiguration"),
+    "optimize_legal_prompt": ("prompt_optimizer", "optimize_legal_prompt"),
+    "optimize_with_preset": ("prompt_optimizer", "optimize_with_preset"),
+    "optimize_with_crispe": ("prompt_optimizer", "optimize_with_crispe"),
+    "optimize_with_co_star": ("prompt_optimizer", "optimize_with_co_star"),
+    "optimize_with_chain_of_thought": ("prompt_optimizer", "optimize_with_chain_of_thought"),
+    "optimize_with_rise": ("prompt_optimizer", "optimize_with_rise"),
+    "optimize_with_o1_style": ("prompt_optimizer", "optimize_with_o1_style"),
+    "optimize_with_meta_prompt": ("prompt_optimizer", "optimize_with_meta_prompt"),
+    "optimize_with_hybrid_legal": ("prompt_optimizer", "optimize_with_hybrid_legal"),
+    "optimize_with_claude_style": ("prompt_optimizer", "optimize_with_claude_style"),
     # SP2 New Optimizers
-    optimize_with_expert_witness,
-    optimize_with_mediation_adr,
-    optimize_with_compliance_audit,
+    "optimize_with_expert_witness": ("prompt_optimizer", "optimize_with_expert_witness"),
+    "optimize_with_mediation_adr": ("prompt_optimizer", "optimize_with_mediation_adr"),
+    "optimize_with_compliance_audit": ("prompt_optimizer", "optimize_with_compliance_audit"),
     # SP2 New Features
-    PromptComparison,
-    BatchResult,
-    QualityScoreDetails,
-    QuickTemplate,
-    compare_optimization_modes,
-    batch_optimize_prompts,
-    export_prompt_to_json,
-    export_prompt_to_markdown,
-    calculate_detailed_quality_score,
-    get_quick_templates,
-    get_template_by_name,
-    get_templates_by_category,
+    "PromptComparison": ("prompt_optimizer", "PromptComparison"),
+    "BatchResult": ("prompt_optimizer", "BatchResult"),
+    "QualityScoreDetails": ("prompt_optimizer", "QualityScoreDetails"),
+    "QuickTemplate": ("prompt_optimizer", "QuickTemplate"),
+    "N_QUICK_TEMPLATES": ("prompt_optimizer", "N_QUICK_TEMPLATES"),
+    "compare_optimization_modes": ("prompt_optimizer", "compare_optimization_modes"),
+    "batch_optimize_prompts": ("prompt_optimizer", "batch_optimize_prompts"),
+    "export_prompt_to_json": ("prompt_optimizer", "export_prompt_to_json"),
+    "export_prompt_to_markdown": ("prompt_optimizer", "export_prompt_to_markdown"),
+    "calculate_detailed_quality_score": ("prompt_optimizer", "calculate_detailed_quality_score"),
+    "get_quick_templates": ("prompt_optimizer", "get_quick_templates"),
+    "get_template_by_name": ("prompt_optimizer", "get_template_by_name"),
+    "get_templates_by_category": ("prompt_optimizer", "get_templates_by_category"),
+    "get_quick_templates_by_category": ("prompt_optimizer", "get_templates_by_category"),
     # Utilities
-    get_optimization_modes_for_ui,
-    get_presets_for_ui,
-    get_preset_configuration,
-    detect_practice_area,
-    calculate_prompt_quality_score,
-    estimate_token_count
-)
+    "get_optimization_modes_for_ui": ("prompt_optimizer", "get_optimization_modes_for_ui"),
+    "get_presets_for_ui": ("prompt_optimizer", "get_presets_for_ui"),
+    "get_preset_configuration": ("prompt_optimizer", "get_preset_configuration"),
+    "detect_practice_area": ("prompt_optimizer", "detect_practice_area"),
+    "calculate_prompt_quality_score": ("prompt_optimizer", "calculate_prompt_quality_score"),
+    "estimate_token_count": ("prompt_optimizer", "estimate_token_count"),
+    "estimate_token_counts": ("prompt_optimizer", "estimate_token_counts"),
+}
+
+# Short aliases for whole submodules, e.g. core.courts.ALL_SPECIALIST_COURTS
+_SUBMODULE_ALIASES = {
+    "frameworks": "advanced_frameworks",
+    "courts": "specialist_courts",
+    "legislation": "sa_legislation",
+    "ethics": "legal_ethics",
+    "practice": "practice_area_prompts",
+    "documents": "document_templates",
+    "workflows": "workflow_pipelines",
+    "optimizer": "prompt_optimizer",
+}
+
+
+def __getattr__(name):
+    """Import the owning submodule on first access to a re-exported name or alias"""
+    if name in _SUBMODULE_ALIASES:
+        value = importlib.import_module(f".{_SUBMODULE_ALIASES[name]}", __name__)
+    else:
+        try:
+            module_name, attr = _LAZY_EXPORTS[name]
+        except KeyError:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+        value = getattr(importlib.import_module(f".{module_name}", __name__), attr)
+    # Bind it on the package so later lookups skip __getattr__ entirely
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS) | set(_SUBMODULE_ALIASES))
+
 
 __all__ = [
+    # Submodules
+    "frameworks", "courts", "legislation", "ethics", "practice", "documents",
+    "workflows", "optimizer",
+    
     # Frameworks
     "ALL_FRAMEWORKS", "get_frameworks_by_category", "get_frameworks_by_difficulty",
     "recommend_framework", "generate_combined_prompt", "FrameworkCategory", 
-    "PromptingFramework",
+    "PromptingFramework", "Component",
+    "FRAMEWORK_OPTIONS", "FRAMEWORK_CATEGORY_LABELS", "N_FRAMEWORKS",
+    "FRAMEWORKS_BY_ACRONYM", "FRAMEWORKS_BY_CATEGORY", "FRAMEWORKS_BY_DIFFICULTY",
+    "get_frameworks_by_prefix",
     
     # Courts
     "ALL_COURTS", "get_courts_by_category", "generate_court_prompt",
     "CourtCategory", "JurisdictionType", "SpecialistCourt",
+    "COURT_OPTIONS", "COURT_CATEGORY_LABELS", "N_COURTS",
     
     # Legislation
     "ALL_LEGISLATION", "generate_legislation_prompt", "LegislationCategory",
     "KeyProvision", "SALegislation",
+    "LEGISLATION_OPTIONS", "LEGISLATION_LABELS", "N_LEGISLATION",
     
     # Ethics
     "ALL_ETHICAL_GUIDELINES", "ALL_AI_USE_SCENARIOS", "assess_ai_use_risk",
     "generate_ethics_checklist", "EthicsCategory", "RiskLevel",
-    "EthicalGuideline", "AIUseScenario",
+    "EthicalGuideline", "AIUseScenario", "Example",
+    "AI_USE_SCENARIOS_BY_NAME", "GUIDELINE_OPTIONS", "N_GUIDELINES", "get_ethics_checklist",
+    "GUIDELINES_BY_CATEGORY", "get_guidelines_by_categories",
+    "SCENARIOS_BY_RISK", "get_scenarios_by_risk",
     
     # Practice Areas
     "ALL_PRACTICE_PROMPTS", "get_prompts_by_area", "get_prompts_by_type",
     "generate_practice_prompt", "PracticeArea", "PromptType", "PracticeAreaPrompt",
+    "PRACTICE_PROMPT_OPTIONS", "PRACTICE_PROMPT_LABELS", "PRACTICE_AREA_LABELS", "N_PRACTICE_PROMPTS",
     
     # Documents
     "ALL_DOCUMENT_TEMPLATES", "get_templates_by_category", "get_template_structure",
     "generate_document_prompt", "DocumentCategory", "Court", "DocumentSection",
     "DocumentTemplate",
+    "DOCUMENT_TEMPLATE_OPTIONS", "DOCUMENT_TEMPLATE_LABELS", "DOCUMENT_CATEGORY_LABELS",
+    "N_DOCUMENT_TEMPLATES", "DOCUMENT_TEMPLATES_BY_CATEGORY", "get_document_templates_by_category",
     
     # Workflows
     "ALL_WORKFLOWS", "get_workflows_by_category", "get_workflow_summary",
     "get_step_prompt", "WorkflowCategory", "StepType", "WorkflowStep", "LegalWorkflow",
+    "WORKFLOW_OPTIONS", "WORKFLOW_LABELS", "WORKFLOW_CATEGORY_LABELS", "N_WORKFLOWS",
     
     # Prompt Optimizer (Enhanced AI Optimization) - SP2 Update
-    "OptimizationMode", "LegalOutputFormat", "PracticeAreaPreset",
+    "OptimizationMode", "N_OPTIMIZATION_MODES", "LegalOutputFormat", "PracticeAreaPreset",
     "OptimizedPrompt", "PresetConfiguration",
     "optimize_legal_prompt", "optimize_with_preset",
     "optimize_with_crispe", "optimize_with_co_star",
@@ -156,13 +244,13 @@ __all__ = [
     "optimize_with_meta_prompt", "optimize_with_hybrid_legal", "optimize_with_claude_style",
     # SP2 New Exports
     "optimize_with_expert_witness", "optimize_with_mediation_adr", "optimize_with_compliance_audit",
-    "PromptComparison", "BatchResult", "QualityScoreDetails", "QuickTemplate",
+    "PromptComparison", "BatchResult", "QualityScoreDetails", "QuickTemplate", "N_QUICK_TEMPLATES",
     "compare_optimization_modes", "batch_optimize_prompts",
     "export_prompt_to_json", "export_prompt_to_markdown",
     "calculate_detailed_quality_score", "get_quick_templates", "get_template_by_name",
-    "get_templates_by_category",
+    "get_templates_by_category", "get_quick_templates_by_category",
     "get_optimization_modes_for_ui", "get_presets_for_ui", "get_preset_configuration",
-    "detect_practice_area", "calculate_prompt_quality_score", "estimate_token_count"
+    "detect_practice_area", "calculate_prompt_quality_score", "estimate_token_count", "estimate_token_counts"
 ]
 
 __version__ = "4.2.0"
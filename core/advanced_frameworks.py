@@ -3,11 +3,16 @@
 World-Class Prompt Engineering Frameworks Adapted for South African Legal Practice
 """
 
-from dataclasses import dataclass, field
-from enum import Enum
-from typing import List, Dict, Optional
-
-class FrameworkCategory(Enum):
+import re
+import sys
+from bisect import bisect_left
+from dataclasses import dataclass
+from enum import StrEnum
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Dict, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+class FrameworkCategory(StrEnum):
     """Categories of prompting frameworks"""
     STRUCTURAL = "Structural Frameworks"
     ITERATIVE = "Iterative Refinement"
@@ -15,7 +20,7 @@ class FrameworkCategory(Enum):
     VERIFICATION = "Verification & Safety"
     SPECIALIZED = "Specialized Legal"
 
-class PracticeArea(Enum):
+class PracticeArea(StrEnum):
     """SA Legal Practice Areas"""
     CONSTITUTIONAL = "Constitutional Law"
     CRIMINAL = "Criminal Law"
@@ -33,20 +38,38 @@ class PracticeArea(Enum):
     POPIA = "Data Protection & POPIA"
     ENVIRONMENTAL = "Environmental Law"
 
-@dataclass
+class Component(NamedTuple):
+    """One lettered component of a framework acronym"""
+    letter: str
+    component: str
+    description: str
+    example: str
+
+@dataclass(slots=True, frozen=True)
 class PromptingFramework:
     """Advanced Prompting Framework for SA Legal Practice"""
     name: str
     acronym: str
     category: FrameworkCategory
     description: str
-    components: List[Dict[str, str]]
-    sa_adaptations: List[str]
+    components: Tuple[Component, ...]
+    sa_adaptations: Tuple[str, ...]
     example_prompt: str
-    best_for: List[str]
+    best_for: Tuple[str, ...]
     difficulty: str  # Beginner, Intermediate, Advanced
     source: str
 
+    def __post_init__(self):
+        """Intern the short, heavily repeated strings shared across frameworks"""
+        object.__setattr__(self, "acronym", sys.intern(self.acronym))
+        object.__setattr__(self, "name", sys.intern(self.name))
+        object.__setattr__(self, "components", tuple(
+            Component(sys.intern(c.letter), sys.intern(c.component), sys.intern(c.description), c.example)
+            for c in self.components
+        ))
+        object.__setattr__(self, "sa_adaptations", tuple(sys.intern(s) for s in self.sa_adaptations))
+        object.__setattr__(self, "best_for", tuple(sys.intern(s) for s in self.best_for))
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # STRUCTURAL FRAMEWORKS
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -56,39 +79,39 @@ RICE_FRAMEWORK = PromptingFramework(
     acronym="RICE",
     category=FrameworkCategory.STRUCTURAL,
     description="Foundation framework structuring prompts with clear role definition, specific instructions, contextual information, and illustrative examples for consistent SA legal output.",
-    components=[
-        {
-            "letter": "R",
-            "component": "Role",
-            "description": "Define the SA legal persona",
-            "example": "You are a Senior Advocate SC at the Johannesburg Bar with 20 years of constitutional law experience, having appeared in the Constitutional Court multiple times."
-        },
-        {
-            "letter": "I", 
-            "component": "Instructions",
-            "description": "Specific task directives",
-            "example": "Analyse the constitutionality of this statutory provision under sections 9, 10, and 36 of the Constitution. Apply the Harksen v Lane rationality test and the limitations analysis."
-        },
-        {
-            "letter": "C",
-            "component": "Context",
-            "description": "SA legal context and constraints",
-            "example": "The client is challenging regulations promulgated under the Disaster Management Act during the COVID-19 pandemic. Previous challenges include De Beer v Minister of Cooperative Governance."
-        },
-        {
-            "letter": "E",
-            "component": "Examples",
-            "description": "Sample outputs or precedents",
-            "example": "Structure your analysis similar to the Constitutional Court's approach in Mistry v Interim Medical and Dental Council, addressing each right separately before conducting limitations analysis."
-        }
-    ],
-    sa_adaptations=[
+    components=(
+        Component(
+            letter="R",
+            component="Role",
+            description="Define the SA legal persona",
+            example="You are a Senior Advocate SC at the Johannesburg Bar with 20 years of constitutional law experience, having appeared in the Constitutional Court multiple times."
+        ),
+        Component(
+            letter="I", 
+            component="Instructions",
+            description="Specific task directives",
+            example="Analyse the constitutionality of this statutory provision under sections 9, 10, and 36 of the Constitution. Apply the Harksen v Lane rationality test and the limitations analysis."
+        ),
+        Component(
+            letter="C",
+            component="Context",
+            description="SA legal context and constraints",
+            example="The client is challenging regulations promulgated under the Disaster Management Act during the COVID-19 pandemic. Previous challenges include De Beer v Minister of Cooperative Governance."
+        ),
+        Component(
+            letter="E",
+            component="Examples",
+            description="Sample outputs or precedents",
+            example="Structure your analysis similar to the Constitutional Court's approach in Mistry v Interim Medical and Dental Council, addressing each right separately before conducting limitations analysis."
+        )
+    ),
+    sa_adaptations=(
         "Specify SA court hierarchy (Constitutional Court, SCA, High Court divisions)",
         "Reference SAFLII neutral citation format",
         "Include ubuntu and transformative constitutionalism principles",
         "Reference relevant SA legislation by Act number",
         "Consider bilingual legal terminology (English/Afrikaans)"
-    ],
+    ),
     example_prompt="""[ROLE]
 You are a Senior Counsel (SC) specialising in labour law with extensive CCMA and Labour Court experience.
 
@@ -103,7 +126,7 @@ The employee was dismissed after participating in a protected strike under secti
 
 [EXAMPLES]
 Reference the approach in NUMSA v Bader Bop for protected strike analysis and SACWU v Afrox for automatically unfair dismissal principles.""",
-    best_for=["Complex legal analysis", "Structured opinions", "Court preparation"],
+    best_for=("Complex legal analysis", "Structured opinions", "Court preparation"),
     difficulty="Intermediate",
     source="North Carolina Bar Association"
 )
@@ -113,45 +136,45 @@ ABCDE_FRAMEWORK = PromptingFramework(
     acronym="ABCDE",
     category=FrameworkCategory.STRUCTURAL,
     description="Comprehensive framework emphasizing audience awareness crucial for SA legal practice where documents serve multiple stakeholders from clients to Constitutional Court justices.",
-    components=[
-        {
-            "letter": "A",
-            "component": "Audience",
-            "description": "Define the target reader",
-            "example": "This opinion is for a sophisticated commercial client who is a CEO with some legal knowledge, and will also be reviewed by instructing attorneys."
-        },
-        {
-            "letter": "B",
-            "component": "Behaviour",
-            "description": "Expected output behaviour",
-            "example": "Provide a balanced analysis that identifies risks while also showing commercial pragmatism. Use confident but qualified language."
-        },
-        {
-            "letter": "C",
-            "component": "Context",
-            "description": "Situational background",
-            "example": "This relates to a proposed acquisition of a Johannesburg-based fintech company. CIPC approval and Competition Commission notification are pending."
-        },
-        {
-            "letter": "D",
-            "component": "Details",
-            "description": "Specific requirements",
-            "example": "Focus on MOI provisions, Companies Act 71 of 2008 compliance, s163 oppression remedy risks, and director liability under s77."
-        },
-        {
-            "letter": "E",
-            "component": "Examples",
-            "description": "Sample format or precedents",
-            "example": "Structure the opinion as per Deneys Reitz format: Executive Summary, Background, Issues for Opinion, Analysis, Recommendations, Caveats."
-        }
-    ],
-    sa_adaptations=[
+    components=(
+        Component(
+            letter="A",
+            component="Audience",
+            description="Define the target reader",
+            example="This opinion is for a sophisticated commercial client who is a CEO with some legal knowledge, and will also be reviewed by instructing attorneys."
+        ),
+        Component(
+            letter="B",
+            component="Behaviour",
+            description="Expected output behaviour",
+            example="Provide a balanced analysis that identifies risks while also showing commercial pragmatism. Use confident but qualified language."
+        ),
+        Component(
+            letter="C",
+            component="Context",
+            description="Situational background",
+            example="This relates to a proposed acquisition of a Johannesburg-based fintech company. CIPC approval and Competition Commission notification are pending."
+        ),
+        Component(
+            letter="D",
+            component="Details",
+            description="Specific requirements",
+            example="Focus on MOI provisions, Companies Act 71 of 2008 compliance, s163 oppression remedy risks, and director liability under s77."
+        ),
+        Component(
+            letter="E",
+            component="Examples",
+            description="Sample format or precedents",
+            example="Structure the opinion as per Deneys Reitz format: Executive Summary, Background, Issues for Opinion, Analysis, Recommendations, Caveats."
+        )
+    ),
+    sa_adaptations=(
         "Consider the legal sophistication level of SA clients",
         "Account for different audiences: judges, masters, registrars, commissioners",
         "Adapt language for lay clients using plain language principles",
         "Consider cultural context and ubuntu in client relations",
         "Reference appropriate SA law firm formats and styles"
-    ],
+    ),
     example_prompt="""[AUDIENCE]
 Constitutional Court justices who require rigorous legal analysis with clear constitutional values orientation. Secondary audience: amici curiae and law reporters.
 
@@ -166,7 +189,7 @@ Address: (1) Constitutional jurisdiction threshold, (2) s25 internal limitations
 
 [EXAMPLES]
 Follow the structure of successful heads in Daniels v Scribante and Minister of Land Affairs v Slamdien.""",
-    best_for=["Client communications", "Court documents", "Multi-stakeholder outputs"],
+    best_for=("Client communications", "Court documents", "Multi-stakeholder outputs"),
     difficulty="Intermediate",
     source="ContractPod AI / Leah AI"
 )
@@ -176,57 +199,57 @@ SEVEN_PS_FRAMEWORK = PromptingFramework(
     acronym="7 Ps",
     category=FrameworkCategory.STRUCTURAL,
     description="Comprehensive seven-step framework ensuring thorough prompt preparation from initial purpose through final refinement, ideal for complex SA litigation matters.",
-    components=[
-        {
-            "letter": "1",
-            "component": "Purpose",
-            "description": "Define the objective",
-            "example": "To prepare heads of argument for an urgent interdict application in the High Court, Gauteng Division, Johannesburg."
-        },
-        {
-            "letter": "2",
-            "component": "Persona",
-            "description": "Assign appropriate role",
-            "example": "You are an experienced High Court advocate with expertise in urgent applications and interim relief."
-        },
-        {
-            "letter": "3",
-            "component": "Prompt",
-            "description": "Core instruction",
-            "example": "Draft heads of argument addressing the requirements for interim interdicts per Setlogelo v Setlogelo."
-        },
-        {
-            "letter": "4",
-            "component": "Parameters",
-            "description": "Constraints and specifications",
-            "example": "Maximum 15 pages. Must address all Setlogelo requirements. Include at least 5 SA authorities. Reference applicant's urgency affidavit."
-        },
-        {
-            "letter": "5",
-            "component": "Proof",
-            "description": "Verification requirements",
-            "example": "Cite only cases from SAFLII or official law reports. Provide full neutral citations. Flag any authorities you are uncertain about."
-        },
-        {
-            "letter": "6",
-            "component": "Preview",
-            "description": "Draft review stage",
-            "example": "Provide an outline first for approval before drafting full heads. List all authorities to be cited."
-        },
-        {
-            "letter": "7",
-            "component": "Polish",
-            "description": "Refinement instructions",
-            "example": "After approval of outline, refine for High Court formal register. Ensure proper paragraph numbering and court form compliance."
-        }
-    ],
-    sa_adaptations=[
+    components=(
+        Component(
+            letter="1",
+            component="Purpose",
+            description="Define the objective",
+            example="To prepare heads of argument for an urgent interdict application in the High Court, Gauteng Division, Johannesburg."
+        ),
+        Component(
+            letter="2",
+            component="Persona",
+            description="Assign appropriate role",
+            example="You are an experienced High Court advocate with expertise in urgent applications and interim relief."
+        ),
+        Component(
+            letter="3",
+            component="Prompt",
+            description="Core instruction",
+            example="Draft heads of argument addressing the requirements for interim interdicts per Setlogelo v Setlogelo."
+        ),
+        Component(
+            letter="4",
+            component="Parameters",
+            description="Constraints and specifications",
+            example="Maximum 15 pages. Must address all Setlogelo requirements. Include at least 5 SA authorities. Reference applicant's urgency affidavit."
+        ),
+        Component(
+            letter="5",
+            component="Proof",
+            description="Verification requirements",
+            example="Cite only cases from SAFLII or official law reports. Provide full neutral citations. Flag any authorities you are uncertain about."
+        ),
+        Component(
+            letter="6",
+            component="Preview",
+            description="Draft review stage",
+            example="Provide an outline first for approval before drafting full heads. List all authorities to be cited."
+        ),
+        Component(
+            letter="7",
+            component="Polish",
+            description="Refinement instructions",
+            example="After approval of outline, refine for High Court formal register. Ensure proper paragraph numbering and court form compliance."
+        )
+    ),
+    sa_adaptations=(
         "Include practice directive compliance checks",
         "Reference specific court division requirements (GPJHC vs WCHC)",
         "Add Rule 6(12) urgent application requirements",
         "Include SAFLII citation format verification",
         "Address pagination and indexing requirements"
-    ],
+    ),
     example_prompt="""[PURPOSE]
 Prepare a Rule 53 review application to review and set aside a CCMA arbitration award.
 
@@ -252,7 +275,7 @@ First provide: (1) Summary of review grounds, (2) List of authorities, (3) Propo
 
 [POLISH]
 Ensure compliance with Labour Court practice directions. Format for e-filing.""",
-    best_for=["Complex litigation", "Urgent applications", "Formal court documents"],
+    best_for=("Complex litigation", "Urgent applications", "Formal court documents"),
     difficulty="Advanced",
     source="Wisconsin State Bar"
 )
@@ -262,39 +285,39 @@ PROMPT_SANDWICH_FRAMEWORK = PromptingFramework(
     acronym="SANDWICH",
     category=FrameworkCategory.STRUCTURAL,
     description="Places critical instructions between context layers to combat the 'lost middle' phenomenon where AI forgets information in long prompts—essential for complex SA legal briefs.",
-    components=[
-        {
-            "letter": "1",
-            "component": "Opening Context",
-            "description": "Background and setup",
-            "example": "This matter involves a constitutional challenge to municipal by-laws regulating informal trading in the Cape Town CBD."
-        },
-        {
-            "letter": "2",
-            "component": "Critical Instructions",
-            "description": "Core requirements (most important)",
-            "example": "CRITICAL: Apply the Camps Bay Ratepayers test for by-law validity. Address both procedural fairness (PAJA) and substantive constitutional challenges."
-        },
-        {
-            "letter": "3",
-            "component": "Supporting Details",
-            "description": "Additional context",
-            "example": "The by-laws were promulgated under s156 municipal powers. Affected traders were not consulted. Similar by-laws were struck down in eThekwini."
-        },
-        {
-            "letter": "4",
-            "component": "Reinforced Instructions",
-            "description": "Repeat key requirements",
-            "example": "REMEMBER: Focus on (1) ultra vires analysis, (2) PAJA procedural fairness, (3) s22 right to trade, (4) s9 equality. Cite at least 3 Constitutional Court authorities."
-        }
-    ],
-    sa_adaptations=[
+    components=(
+        Component(
+            letter="1",
+            component="Opening Context",
+            description="Background and setup",
+            example="This matter involves a constitutional challenge to municipal by-laws regulating informal trading in the Cape Town CBD."
+        ),
+        Component(
+            letter="2",
+            component="Critical Instructions",
+            description="Core requirements (most important)",
+            example="CRITICAL: Apply the Camps Bay Ratepayers test for by-law validity. Address both procedural fairness (PAJA) and substantive constitutional challenges."
+        ),
+        Component(
+            letter="3",
+            component="Supporting Details",
+            description="Additional context",
+            example="The by-laws were promulgated under s156 municipal powers. Affected traders were not consulted. Similar by-laws were struck down in eThekwini."
+        ),
+        Component(
+            letter="4",
+            component="Reinforced Instructions",
+            description="Repeat key requirements",
+            example="REMEMBER: Focus on (1) ultra vires analysis, (2) PAJA procedural fairness, (3) s22 right to trade, (4) s9 equality. Cite at least 3 Constitutional Court authorities."
+        )
+    ),
+    sa_adaptations=(
         "Place constitutional analysis requirements prominently",
         "Sandwich SAFLII citation requirements in critical section",
         "Reinforce jurisdiction-specific requirements at end",
         "Use for complex multi-issue constitutional matters",
         "Combat tendency to miss transformative constitutionalism analysis"
-    ],
+    ),
     example_prompt="""[OPENING CONTEXT]
 A community organisation challenges the constitutionality of the Traditional Courts Bill as violating customary law and gender equality rights.
 
@@ -315,7 +338,7 @@ The Bill provides for traditional leaders to adjudicate disputes without legal r
 - Shilubana v Nwamitwa for gender equality in customary context
 - At least 5 Constitutional Court citations
 - Recommendations for constitutional amendments""",
-    best_for=["Long complex prompts", "Multi-issue analysis", "Constitutional matters"],
+    best_for=("Long complex prompts", "Multi-issue analysis", "Constitutional matters"),
     difficulty="Intermediate",
     source="Prompt Engineering Research"
 )
@@ -325,57 +348,57 @@ JUST_ASK_FRAMEWORK = PromptingFramework(
     acronym="JUST ASK",
     category=FrameworkCategory.SPECIALIZED,
     description="Legal-specific framework ensuring all critical elements for SA legal research are addressed, from jurisdiction through to specific keyword requirements.",
-    components=[
-        {
-            "letter": "J",
-            "component": "Jurisdiction",
-            "description": "Specify court/forum",
-            "example": "South African Constitutional Court; alternatively High Court, Gauteng Division, Pretoria"
-        },
-        {
-            "letter": "U",
-            "component": "Underlying Facts",
-            "description": "Key factual background",
-            "example": "State entity expropriated property without following proper procedures. No compensation offered. Property used for RDP housing."
-        },
-        {
-            "letter": "S",
-            "component": "Specific Issue",
-            "description": "Precise legal question",
-            "example": "Whether s25(2) 'just and equitable compensation' applies when expropriation is for land reform purposes under s25(4)."
-        },
-        {
-            "letter": "T",
-            "component": "Timeframe",
-            "description": "Temporal constraints",
-            "example": "Focus on post-2018 Constitutional Court decisions following the Expropriation Bill parliamentary debates."
-        },
-        {
-            "letter": "A",
-            "component": "Authorities",
-            "description": "Source requirements",
-            "example": "Constitutional Court judgments, SCA decisions, and academic commentary from SALJ and Constitutional Court Review."
-        },
-        {
-            "letter": "S",
-            "component": "Structure",
-            "description": "Output format",
-            "example": "IRAC format with separate sections for historical development, current position, and future implications."
-        },
-        {
-            "letter": "K",
-            "component": "Keywords",
-            "description": "Search terms",
-            "example": "Expropriation, compensation, land reform, s25, Agri SA, Florence, deprivation vs expropriation"
-        }
-    ],
-    sa_adaptations=[
+    components=(
+        Component(
+            letter="J",
+            component="Jurisdiction",
+            description="Specify court/forum",
+            example="South African Constitutional Court; alternatively High Court, Gauteng Division, Pretoria"
+        ),
+        Component(
+            letter="U",
+            component="Underlying Facts",
+            description="Key factual background",
+            example="State entity expropriated property without following proper procedures. No compensation offered. Property used for RDP housing."
+        ),
+        Component(
+            letter="S",
+            component="Specific Issue",
+            description="Precise legal question",
+            example="Whether s25(2) 'just and equitable compensation' applies when expropriation is for land reform purposes under s25(4)."
+        ),
+        Component(
+            letter="T",
+            component="Timeframe",
+            description="Temporal constraints",
+            example="Focus on post-2018 Constitutional Court decisions following the Expropriation Bill parliamentary debates."
+        ),
+        Component(
+            letter="A",
+            component="Authorities",
+            description="Source requirements",
+            example="Constitutional Court judgments, SCA decisions, and academic commentary from SALJ and Constitutional Court Review."
+        ),
+        Component(
+            letter="S",
+            component="Structure",
+            description="Output format",
+            example="IRAC format with separate sections for historical development, current position, and future implications."
+        ),
+        Component(
+            letter="K",
+            component="Keywords",
+            description="Search terms",
+            example="Expropriation, compensation, land reform, s25, Agri SA, Florence, deprivation vs expropriation"
+        )
+    ),
+    sa_adaptations=(
         "Specify SA court division precisely (e.g., WCHC vs GPJHC)",
         "Include SAFLII as authoritative source",
         "Reference SA law reports (SA, BCLR, All SA)",
         "Add relevant SA legislation by Act number",
         "Include both English and Afrikaans case names where relevant"
-    ],
+    ),
     example_prompt="""[JURISDICTION]
 Labour Court of South Africa, held at Johannesburg; appealable to Labour Appeal Court
 
@@ -401,7 +424,7 @@ LAC and Labour Court judgments on SAFLII; ILJ and BLLR reports; Grogan's Workpla
 
 [KEYWORDS]
 Retrenchment, s189, s189A, operational requirements, LIFO, facilitated process, automatically unfair, procedurally unfair, compensation""",
-    best_for=["Legal research", "Case preparation", "Opinion writing"],
+    best_for=("Legal research", "Case preparation", "Opinion writing"),
     difficulty="Intermediate",
     source="North Carolina Bar Association"
 )
@@ -411,39 +434,39 @@ CASE_FRAMEWORK = PromptingFramework(
     acronym="C.A.S.E.",
     category=FrameworkCategory.STRUCTURAL,
     description="Streamlined four-component framework ideal for quick SA legal queries while maintaining sufficient structure for accurate outputs.",
-    components=[
-        {
-            "letter": "C",
-            "component": "Context",
-            "description": "Background situation",
-            "example": "Commercial landlord in Sandton seeking to evict defaulting tenant from office premises."
-        },
-        {
-            "letter": "A",
-            "component": "Action",
-            "description": "Required task",
-            "example": "Advise on the procedure for commercial eviction and draft letter of demand."
-        },
-        {
-            "letter": "S",
-            "component": "Specifics",
-            "description": "Key details",
-            "example": "3 months arrears. Lease expires in 6 months. Tenant disputes rental increases. No cancellation clause invoked yet."
-        },
-        {
-            "letter": "E",
-            "component": "Examples",
-            "description": "Format guidance",
-            "example": "Follow Occupiers of Erven 87 and 88 procedure. Letter should follow Norton Rose style."
-        }
-    ],
-    sa_adaptations=[
+    components=(
+        Component(
+            letter="C",
+            component="Context",
+            description="Background situation",
+            example="Commercial landlord in Sandton seeking to evict defaulting tenant from office premises."
+        ),
+        Component(
+            letter="A",
+            component="Action",
+            description="Required task",
+            example="Advise on the procedure for commercial eviction and draft letter of demand."
+        ),
+        Component(
+            letter="S",
+            component="Specifics",
+            description="Key details",
+            example="3 months arrears. Lease expires in 6 months. Tenant disputes rental increases. No cancellation clause invoked yet."
+        ),
+        Component(
+            letter="E",
+            component="Examples",
+            description="Format guidance",
+            example="Follow Occupiers of Erven 87 and 88 procedure. Letter should follow Norton Rose style."
+        )
+    ),
+    sa_adaptations=(
         "Distinguish PIE Act evictions from commercial evictions",
         "Reference relevant High Court division practices",
         "Include sheriff and registrar requirements",
         "Address CPA implications for consumer contracts",
         "Consider RCJ requirements for specific claim values"
-    ],
+    ),
     example_prompt="""[CONTEXT]
 First-time homebuyer in Johannesburg discovered defects in property 3 months after transfer. Seller was a private individual (not estate agent).
 
@@ -459,7 +482,7 @@ Analyse the buyer's remedies under voetstoots clause and advise on prospects of
 
 [EXAMPLES]
 Apply Odendaal v Ferraris and Van der Merwe v Meades latent defects principles. Structure as brief opinion with recommendations.""",
-    best_for=["Quick queries", "Initial consultations", "Focused research"],
+    best_for=("Quick queries", "Initial consultations", "Focused research"),
     difficulty="Beginner",
     source="Legal Prompt Engineering Best Practices"
 )
@@ -473,45 +496,45 @@ CHAIN_OF_THOUGHT_LEGAL = PromptingFramework(
     acronym="CoT-LEGAL",
     category=FrameworkCategory.REASONING,
     description="Explicit step-by-step reasoning framework adapted for SA legal analysis, making AI's logical process visible and verifiable.",
-    components=[
-        {
-            "letter": "1",
-            "component": "Problem Identification",
-            "description": "State the legal problem",
-            "example": "The issue is whether the administrative action meets the requirements of lawfulness, reasonableness, and procedural fairness under PAJA."
-        },
-        {
-            "letter": "2",
-            "component": "Rule Statement",
-            "description": "Identify applicable law",
-            "example": "Section 6 of PAJA provides grounds for judicial review. The Bato Star test establishes the standard for reasonableness review."
-        },
-        {
-            "letter": "3",
-            "component": "Step-by-Step Application",
-            "description": "Apply law to facts incrementally",
-            "example": "First, I consider lawfulness... Next, I analyse reasonableness... Then, I examine procedural fairness... Finally, I consider appropriate remedy..."
-        },
-        {
-            "letter": "4",
-            "component": "Uncertainty Flagging",
-            "description": "Acknowledge limitations",
-            "example": "Note: The application of the rule in Merafong is uncertain here because the facts differ in that..."
-        },
-        {
-            "letter": "5",
-            "component": "Reasoned Conclusion",
-            "description": "Reach supported conclusion",
-            "example": "Based on the above analysis, the administrative action is likely reviewable on the ground of procedural unfairness, with medium confidence."
-        }
-    ],
-    sa_adaptations=[
+    components=(
+        Component(
+            letter="1",
+            component="Problem Identification",
+            description="State the legal problem",
+            example="The issue is whether the administrative action meets the requirements of lawfulness, reasonableness, and procedural fairness under PAJA."
+        ),
+        Component(
+            letter="2",
+            component="Rule Statement",
+            description="Identify applicable law",
+            example="Section 6 of PAJA provides grounds for judicial review. The Bato Star test establishes the standard for reasonableness review."
+        ),
+        Component(
+            letter="3",
+            component="Step-by-Step Application",
+            description="Apply law to facts incrementally",
+            example="First, I consider lawfulness... Next, I analyse reasonableness... Then, I examine procedural fairness... Finally, I consider appropriate remedy..."
+        ),
+        Component(
+            letter="4",
+            component="Uncertainty Flagging",
+            description="Acknowledge limitations",
+            example="Note: The application of the rule in Merafong is uncertain here because the facts differ in that..."
+        ),
+        Component(
+            letter="5",
+            component="Reasoned Conclusion",
+            description="Reach supported conclusion",
+            example="Based on the above analysis, the administrative action is likely reviewable on the ground of procedural unfairness, with medium confidence."
+        )
+    ),
+    sa_adaptations=(
         "Structure around SA legal principles (e.g., ubuntu, transformative constitutionalism)",
         "Reference Constitutional Court methodology",
         "Include statutory interpretation principles (Jaga v Dönges)",
         "Apply proportionality analysis (s36 limitations)",
         "Use SA burden and standard of proof language"
-    ],
+    ),
     example_prompt="""Analyse step-by-step whether this conduct constitutes unfair discrimination under PEPUDA (Act 4 of 2000).
 
 THINK THROUGH EACH STEP EXPLICITLY:
@@ -527,7 +550,7 @@ Step 4: Now, consider whether the discrimination is unfair (s14 factors). Examin
 Step 5: Finally, if unfair, consider available remedies under s21. Evaluate...
 
 IMPORTANT: Show your reasoning at each step. Flag any uncertainties. Cite SA authorities for each proposition.""",
-    best_for=["Complex legal analysis", "Discrimination claims", "Constitutional matters"],
+    best_for=("Complex legal analysis", "Discrimination claims", "Constitutional matters"),
     difficulty="Advanced",
     source="Adapted from AI Legal Research Best Practices"
 )
@@ -537,39 +560,39 @@ PROMPT_CHAINING = PromptingFramework(
     acronym="CHAIN",
     category=FrameworkCategory.ITERATIVE,
     description="Breaking complex SA legal tasks into sequential linked prompts, each building on the previous output for comprehensive analysis.",
-    components=[
-        {
-            "letter": "1",
-            "component": "Foundation Prompt",
-            "description": "Establish base analysis",
-            "example": "Prompt 1: Summarise the key facts and identify all potential legal issues in this commercial dispute."
-        },
-        {
-            "letter": "2",
-            "component": "Deep Dive Prompts",
-            "description": "Analyse each issue",
-            "example": "Prompt 2: Now focus on the breach of contract issue. Analyse under SA contract law principles. Prompt 3: Separately analyse the delictual claim."
-        },
-        {
-            "letter": "3",
-            "component": "Synthesis Prompt",
-            "description": "Combine analyses",
-            "example": "Prompt 4: Based on the above analyses, which cause of action offers the best prospects of success and why?"
-        },
-        {
-            "letter": "4",
-            "component": "Practical Prompt",
-            "description": "Actionable recommendations",
-            "example": "Prompt 5: Draft a letter of demand incorporating the strongest legal arguments identified."
-        }
-    ],
-    sa_adaptations=[
+    components=(
+        Component(
+            letter="1",
+            component="Foundation Prompt",
+            description="Establish base analysis",
+            example="Prompt 1: Summarise the key facts and identify all potential legal issues in this commercial dispute."
+        ),
+        Component(
+            letter="2",
+            component="Deep Dive Prompts",
+            description="Analyse each issue",
+            example="Prompt 2: Now focus on the breach of contract issue. Analyse under SA contract law principles. Prompt 3: Separately analyse the delictual claim."
+        ),
+        Component(
+            letter="3",
+            component="Synthesis Prompt",
+            description="Combine analyses",
+            example="Prompt 4: Based on the above analyses, which cause of action offers the best prospects of success and why?"
+        ),
+        Component(
+            letter="4",
+            component="Practical Prompt",
+            description="Actionable recommendations",
+            example="Prompt 5: Draft a letter of demand incorporating the strongest legal arguments identified."
+        )
+    ),
+    sa_adaptations=(
         "Chain should address multiple SA law sources (common law, statute, Constitution)",
         "Include separate prompts for different forums (court vs arbitration vs CCMA)",
         "Build from legal analysis to practical SA court procedure",
         "Chain citation verification as separate step",
         "Include costs and fee considerations in final chain"
-    ],
+    ),
     example_prompt="""PROMPT CHAIN FOR UNFAIR DISMISSAL MATTER:
 
 [PROMPT 1 - CLASSIFICATION]
@@ -586,7 +609,7 @@ If dismissal is unfair, calculate appropriate remedy: reinstatement, re-employme
 
 [PROMPT 5 - STRATEGY]
 Synthesise above into CCMA referral strategy. Recommend evidence needed and witnesses to call.""",
-    best_for=["Complex multi-issue matters", "Building comprehensive opinions", "Litigation strategy"],
+    best_for=("Complex multi-issue matters", "Building comprehensive opinions", "Litigation strategy"),
     difficulty="Advanced",
     source="ContractPod AI Legal Prompting Guide"
 )
@@ -600,45 +623,45 @@ HOSTILE_WITNESS_TECHNIQUE = PromptingFramework(
     acronym="HOSTILE",
     category=FrameworkCategory.VERIFICATION,
     description="Treating AI like a hostile witness—demanding proof, challenging assertions, and cross-examining outputs to prevent hallucinations in SA legal work.",
-    components=[
-        {
-            "letter": "1",
-            "component": "Demand Proof",
-            "description": "Require evidence for claims",
-            "example": "For every legal proposition, cite the specific case, paragraph number, and quote the relevant passage."
-        },
-        {
-            "letter": "2",
-            "component": "Challenge Assumptions",
-            "description": "Question AI's reasoning",
-            "example": "What is the basis for your assertion that this falls under s25? Show me the specific wording that supports this."
-        },
-        {
-            "letter": "3",
-            "component": "Seek Contrary Authority",
-            "description": "Actively find counterarguments",
-            "example": "Now identify any cases that contradict your conclusion. What arguments would opposing counsel make?"
-        },
-        {
-            "letter": "4",
-            "component": "Confidence Assessment",
-            "description": "Rate certainty levels",
-            "example": "Rate your confidence in this conclusion: High (well-established law), Medium (arguable), Low (novel/uncertain), or Speculative."
-        },
-        {
-            "letter": "5",
-            "component": "Fallback Position",
-            "description": "Identify alternatives",
-            "example": "If your primary analysis is wrong, what is the fallback position? What's the worst-case scenario?"
-        }
-    ],
-    sa_adaptations=[
+    components=(
+        Component(
+            letter="1",
+            component="Demand Proof",
+            description="Require evidence for claims",
+            example="For every legal proposition, cite the specific case, paragraph number, and quote the relevant passage."
+        ),
+        Component(
+            letter="2",
+            component="Challenge Assumptions",
+            description="Question AI's reasoning",
+            example="What is the basis for your assertion that this falls under s25? Show me the specific wording that supports this."
+        ),
+        Component(
+            letter="3",
+            component="Seek Contrary Authority",
+            description="Actively find counterarguments",
+            example="Now identify any cases that contradict your conclusion. What arguments would opposing counsel make?"
+        ),
+        Component(
+            letter="4",
+            component="Confidence Assessment",
+            description="Rate certainty levels",
+            example="Rate your confidence in this conclusion: High (well-established law), Medium (arguable), Low (novel/uncertain), or Speculative."
+        ),
+        Component(
+            letter="5",
+            component="Fallback Position",
+            description="Identify alternatives",
+            example="If your primary analysis is wrong, what is the fallback position? What's the worst-case scenario?"
+        )
+    ),
+    sa_adaptations=(
         "Demand SAFLII citations for all SA cases",
         "Require specific Act and section references",
         "Cross-reference with official law reports (SA, BCLR)",
         "Challenge Constitutional Court interpretations",
         "Verify SCA pronouncements are not obiter"
-    ],
+    ),
     example_prompt="""You stated that the employer can dismiss for operational requirements with 2 weeks notice.
 
 PROVE YOUR ANSWER:
@@ -650,7 +673,7 @@ PROVE YOUR ANSWER:
 6. If you are wrong, what is the correct position?
 
 DO NOT PROCEED until you have addressed each point. If you cannot find authority, say "I cannot verify this proposition.\"""",
-    best_for=["Citation verification", "Risk assessment", "Quality assurance"],
+    best_for=("Citation verification", "Risk assessment", "Quality assurance"),
     difficulty="Intermediate",
     source="Relativity Legal AI Guide"
 )
@@ -660,39 +683,39 @@ FALSIFIABLE_QUESTIONS = PromptingFramework(
     acronym="FALSIFY",
     category=FrameworkCategory.VERIFICATION,
     description="Framing legal questions in ways that can be definitively proven true or false, reducing ambiguous or evasive AI responses.",
-    components=[
-        {
-            "letter": "1",
-            "component": "Binary Framing",
-            "description": "Yes/No questions",
-            "example": "Does s197 of the LRA apply to the sale of a business as a going concern? Answer YES or NO, then explain."
-        },
-        {
-            "letter": "2",
-            "component": "Existence Verification",
-            "description": "Confirm existence of law",
-            "example": "Does a case called 'Phumelela Gaming' exist that deals with betting regulations? If yes, provide full citation."
-        },
-        {
-            "letter": "3",
-            "component": "Threshold Questions",
-            "description": "Numerical/factual queries",
-            "example": "What is the prescribed time limit for referring an unfair dismissal dispute to the CCMA? Cite the source."
-        },
-        {
-            "letter": "4",
-            "component": "Comparative Framing",
-            "description": "Clear comparisons",
-            "example": "Which has higher precedent value for the Labour Court: a LAC judgment or a previous Labour Court judgment?"
-        }
-    ],
-    sa_adaptations=[
+    components=(
+        Component(
+            letter="1",
+            component="Binary Framing",
+            description="Yes/No questions",
+            example="Does s197 of the LRA apply to the sale of a business as a going concern? Answer YES or NO, then explain."
+        ),
+        Component(
+            letter="2",
+            component="Existence Verification",
+            description="Confirm existence of law",
+            example="Does a case called 'Phumelela Gaming' exist that deals with betting regulations? If yes, provide full citation."
+        ),
+        Component(
+            letter="3",
+            component="Threshold Questions",
+            description="Numerical/factual queries",
+            example="What is the prescribed time limit for referring an unfair dismissal dispute to the CCMA? Cite the source."
+        ),
+        Component(
+            letter="4",
+            component="Comparative Framing",
+            description="Clear comparisons",
+            example="Which has higher precedent value for the Labour Court: a LAC judgment or a previous Labour Court judgment?"
+        )
+    ),
+    sa_adaptations=(
         "Frame questions about specific SA time periods (prescription, referral deadlines)",
         "Use for court hierarchy verification",
         "Apply to statutory threshold questions (monetary jurisdiction, etc.)",
         "Verify existence of SA legislation and amendments",
         "Confirm court division jurisdiction"
-    ],
+    ),
     example_prompt="""Answer these falsifiable questions about SA labour law:
 
 1. TRUE or FALSE: An employee earning above the BCEA threshold is excluded from CCMA jurisdiction for unfair dismissal claims. Cite authority.
@@ -704,7 +727,7 @@ FALSIFIABLE_QUESTIONS = PromptingFramework(
 4. HIERARCHY: Which court's judgment is binding on the Labour Court: (a) Supreme Court of Appeal, or (b) Labour Appeal Court? Cite authority.
 
 For each answer, if you are uncertain, state "UNVERIFIED - requires independent confirmation.\"""",
-    best_for=["Fact-checking", "Quick verification", "Citation checking"],
+    best_for=("Fact-checking", "Quick verification", "Citation checking"),
     difficulty="Beginner",
     source="Legal Prompt Engineering Best Practices"
 )
@@ -714,39 +737,39 @@ PINK_ELEPHANTS = PromptingFramework(
     acronym="POSITIVE",
     category=FrameworkCategory.VERIFICATION,
     description="Using positive commands rather than negative prohibitions—tell AI what to do, not what to avoid—for clearer SA legal outputs.",
-    components=[
-        {
-            "letter": "1",
-            "component": "Positive Commands",
-            "description": "State what to do",
-            "example": "INSTEAD OF: 'Don't cite American cases' → USE: 'Cite only South African authorities from SAFLII'"
-        },
-        {
-            "letter": "2",
-            "component": "Inclusive Language",
-            "description": "Define inclusions",
-            "example": "INSTEAD OF: 'Don't include irrelevant cases' → USE: 'Include only cases directly addressing s193 remedies'"
-        },
-        {
-            "letter": "3",
-            "component": "Specific Guidance",
-            "description": "Clear directions",
-            "example": "INSTEAD OF: 'Don't be vague' → USE: 'Provide specific paragraph numbers for all propositions'"
-        },
-        {
-            "letter": "4",
-            "component": "Focus Areas",
-            "description": "Direct attention",
-            "example": "INSTEAD OF: 'Don't discuss irrelevant issues' → USE: 'Focus exclusively on the limitation of actions defence'"
-        }
-    ],
-    sa_adaptations=[
+    components=(
+        Component(
+            letter="1",
+            component="Positive Commands",
+            description="State what to do",
+            example="INSTEAD OF: 'Don't cite American cases' → USE: 'Cite only South African authorities from SAFLII'"
+        ),
+        Component(
+            letter="2",
+            component="Inclusive Language",
+            description="Define inclusions",
+            example="INSTEAD OF: 'Don't include irrelevant cases' → USE: 'Include only cases directly addressing s193 remedies'"
+        ),
+        Component(
+            letter="3",
+            component="Specific Guidance",
+            description="Clear directions",
+            example="INSTEAD OF: 'Don't be vague' → USE: 'Provide specific paragraph numbers for all propositions'"
+        ),
+        Component(
+            letter="4",
+            component="Focus Areas",
+            description="Direct attention",
+            example="INSTEAD OF: 'Don't discuss irrelevant issues' → USE: 'Focus exclusively on the limitation of actions defence'"
+        )
+    ),
+    sa_adaptations=(
         "Positively specify SA citation formats required",
         "Direct to specific SA law databases (SAFLII, Jutastat)",
         "Affirmatively require Constitutional Court jurisprudence",
         "Specify inclusion of ubuntu principles",
         "Positively frame bilingual terminology requirements"
-    ],
+    ),
     example_prompt="""Draft a legal opinion on prescription defence.
 
 POSITIVE INSTRUCTIONS:
@@ -760,7 +783,7 @@ POSITIVE INSTRUCTIONS:
 ✓ Provide full neutral citations for all cases
 
 [Note: Positive framing ensures AI follows these instructions rather than being confused by prohibitions]""",
-    best_for=["Clear instructions", "Reducing confusion", "Better compliance"],
+    best_for=("Clear instructions", "Reducing confusion", "Better compliance"),
     difficulty="Beginner",
     source="Relativity AI Prompt Engineering Guide"
 )
@@ -774,38 +797,38 @@ VARI_FRAMEWORK = PromptingFramework(
     acronym="VARI",
     category=FrameworkCategory.REASONING,
     description="DeepMind-inspired framework requiring explicit reasoning, self-reflection, and verification at each analytical step. Adapted for rigorous SA legal analysis.",
-    components=[
-        {
-            "letter": "V",
-            "component": "Verify Understanding",
-            "description": "Confirm comprehension of the legal question",
-            "example": "First, verify: What is the precise legal question? What relief does the client seek? Which court has jurisdiction?"
-        },
-        {
-            "letter": "A",
-            "component": "Analyse Systematically",
-            "description": "Break down the legal analysis",
-            "example": "Analyse each element: (1) Cause of action, (2) Available defences, (3) Evidential requirements, (4) Applicable precedent"
-        },
-        {
-            "letter": "R",
-            "component": "Reflect and Question",
-            "description": "Self-reflection on analysis quality",
-            "example": "Reflect: Have I considered all Constitutional Court authorities? Are there recent SCA judgments that might alter the analysis?"
-        },
-        {
-            "letter": "I",
-            "component": "Iterate and Improve",
-            "description": "Refine conclusions through iteration",
-            "example": "Iterate: Recheck reasoning against ubuntu principles. Does this interpretation align with transformative constitutionalism?"
-        }
-    ],
-    sa_adaptations=[
+    components=(
+        Component(
+            letter="V",
+            component="Verify Understanding",
+            description="Confirm comprehension of the legal question",
+            example="First, verify: What is the precise legal question? What relief does the client seek? Which court has jurisdiction?"
+        ),
+        Component(
+            letter="A",
+            component="Analyse Systematically",
+            description="Break down the legal analysis",
+            example="Analyse each element: (1) Cause of action, (2) Available defences, (3) Evidential requirements, (4) Applicable precedent"
+        ),
+        Component(
+            letter="R",
+            component="Reflect and Question",
+            description="Self-reflection on analysis quality",
+            example="Reflect: Have I considered all Constitutional Court authorities? Are there recent SCA judgments that might alter the analysis?"
+        ),
+        Component(
+            letter="I",
+            component="Iterate and Improve",
+            description="Refine conclusions through iteration",
+            example="Iterate: Recheck reasoning against ubuntu principles. Does this interpretation align with transformative constitutionalism?"
+        )
+    ),
+    sa_adaptations=(
         "Verify understanding against SA court hierarchy",
         "Analyse using Constitutional framework first",
         "Reflect on ubuntu and community impact",
         "Iterate considering transformative justice outcomes"
-    ],
+    ),
     example_prompt="""[VARI LEGAL ANALYSIS]
 
 VERIFY: Before analysis, confirm understanding:
@@ -827,7 +850,7 @@ REFLECT: Question the analysis:
 ITERATE: Refine conclusions:
 - Cross-check against recent Housing Act amendments
 - Verify alignment with City of Johannesburg jurisprudence""",
-    best_for=["Complex constitutional matters", "Rights-based analysis", "Multi-step legal reasoning"],
+    best_for=("Complex constitutional matters", "Rights-based analysis", "Multi-step legal reasoning"),
     difficulty="Advanced",
     source="DeepMind AI Research / 302 Prompt Expert"
 )
@@ -837,44 +860,44 @@ Q_STAR_FRAMEWORK = PromptingFramework(
     acronym="Q*",
     category=FrameworkCategory.ITERATIVE,
     description="A* + Q-Learning hybrid framework for legal strategy optimisation. Maps litigation pathways and optimises for best outcomes considering costs, risks, and probabilities.",
-    components=[
-        {
-            "letter": "Q",
-            "component": "Query State",
-            "description": "Define the current legal position",
-            "example": "Query: Current state = employer received demand letter. Goal = minimise liability exposure while preserving business relationship."
-        },
-        {
-            "letter": "S",
-            "component": "Strategy Paths",
-            "description": "Map available strategic pathways",
-            "example": "Paths: (A) Settlement negotiation, (B) CCMA conciliation, (C) Defend at arbitration, (D) Labour Court review"
-        },
-        {
-            "letter": "T",
-            "component": "Think Ahead",
-            "description": "Project outcomes 3 moves ahead",
-            "example": "If Path A (settle): Cost estimate R150k, probability 80%. If Path C (defend): Cost R300k+, success probability 60%."
-        },
-        {
-            "letter": "A",
-            "component": "Assess Optimally",
-            "description": "Calculate optimal path",
-            "example": "Optimal: Path A settlement preferred. Expected value = R150k × 80% = R120k vs Path C = R180k expected cost."
-        },
-        {
-            "letter": "R",
-            "component": "Recommend Action",
-            "description": "Provide actionable strategy",
-            "example": "Recommend: Initiate without prejudice discussions. Set ceiling at R175k. Prepare arbitration defence as BATNA."
-        }
-    ],
-    sa_adaptations=[
+    components=(
+        Component(
+            letter="Q",
+            component="Query State",
+            description="Define the current legal position",
+            example="Query: Current state = employer received demand letter. Goal = minimise liability exposure while preserving business relationship."
+        ),
+        Component(
+            letter="S",
+            component="Strategy Paths",
+            description="Map available strategic pathways",
+            example="Paths: (A) Settlement negotiation, (B) CCMA conciliation, (C) Defend at arbitration, (D) Labour Court review"
+        ),
+        Component(
+            letter="T",
+            component="Think Ahead",
+            description="Project outcomes 3 moves ahead",
+            example="If Path A (settle): Cost estimate R150k, probability 80%. If Path C (defend): Cost R300k+, success probability 60%."
+        ),
+        Component(
+            letter="A",
+            component="Assess Optimally",
+            description="Calculate optimal path",
+            example="Optimal: Path A settlement preferred. Expected value = R150k × 80% = R120k vs Path C = R180k expected cost."
+        ),
+        Component(
+            letter="R",
+            component="Recommend Action",
+            description="Provide actionable strategy",
+            example="Recommend: Initiate without prejudice discussions. Set ceiling at R175k. Prepare arbitration defence as BATNA."
+        )
+    ),
+    sa_adaptations=(
         "Factor in CCMA/bargaining council timelines",
         "Include costs of Constitutional Court escalation",
         "Account for ubuntu-based resolution preferences",
         "Consider specialist court expertise requirements"
-    ],
+    ),
     example_prompt="""[Q* LEGAL STRATEGY ANALYSIS]
 
 QUERY STATE:
@@ -898,7 +921,7 @@ Path A minimises expected cost and preserves confidentiality.
 RECOMMEND:
 Initiate settlement discussions. Offer R275k starting, ceiling R375k. 
 Prepare arbitration defence as leverage. Document all offers as without prejudice.""",
-    best_for=["Litigation strategy", "Cost-benefit analysis", "Settlement negotiations"],
+    best_for=("Litigation strategy", "Cost-benefit analysis", "Settlement negotiations"),
     difficulty="Advanced",
     source="OpenAI Q* Research / 302 Prompt Expert"
 )
@@ -908,44 +931,44 @@ MICRO_OPT_FRAMEWORK = PromptingFramework(
     acronym="MICRO",
     category=FrameworkCategory.ITERATIVE,
     description="Microsoft-inspired iterative micro-enhancement framework. Applies 15+ small optimisations to refine prompts to near-optimal quality through cumulative improvements.",
-    components=[
-        {
-            "letter": "M",
-            "component": "Measure Current",
-            "description": "Assess baseline prompt quality",
-            "example": "Current prompt scores: Clarity 6/10, Specificity 5/10, SA Context 7/10, Structure 6/10"
-        },
-        {
-            "letter": "I",
-            "component": "Identify Weaknesses",
-            "description": "Pinpoint specific improvement areas",
-            "example": "Weaknesses: No role specified, vague timeline, missing citation format requirement"
-        },
-        {
-            "letter": "C",
-            "component": "Correct Incrementally",
-            "description": "Apply targeted fixes",
-            "example": "Add: 'You are a Senior Attorney specialising in commercial law. Use SAFLII neutral citations.'"
-        },
-        {
-            "letter": "R",
-            "component": "Refine Structure",
-            "description": "Improve organisation",
-            "example": "Reorganise into: Context → Instructions → Format → Constraints → Output"
-        },
-        {
-            "letter": "O",
-            "component": "Optimise Tokens",
-            "description": "Maximise information density",
-            "example": "Consolidate redundant instructions. Remove filler words. Add XML-style delimiters."
-        }
-    ],
-    sa_adaptations=[
+    components=(
+        Component(
+            letter="M",
+            component="Measure Current",
+            description="Assess baseline prompt quality",
+            example="Current prompt scores: Clarity 6/10, Specificity 5/10, SA Context 7/10, Structure 6/10"
+        ),
+        Component(
+            letter="I",
+            component="Identify Weaknesses",
+            description="Pinpoint specific improvement areas",
+            example="Weaknesses: No role specified, vague timeline, missing citation format requirement"
+        ),
+        Component(
+            letter="C",
+            component="Correct Incrementally",
+            description="Apply targeted fixes",
+            example="Add: 'You are a Senior Attorney specialising in commercial law. Use SAFLII neutral citations.'"
+        ),
+        Component(
+            letter="R",
+            component="Refine Structure",
+            description="Improve organisation",
+            example="Reorganise into: Context → Instructions → Format → Constraints → Output"
+        ),
+        Component(
+            letter="O",
+            component="Optimise Tokens",
+            description="Maximise information density",
+            example="Consolidate redundant instructions. Remove filler words. Add XML-style delimiters."
+        )
+    ),
+    sa_adaptations=(
         "Ensure each micro-fix maintains SA legal accuracy",
         "Add SA-specific citation requirements incrementally",
         "Include Constitutional Court methodology references",
         "Optimise for SAFLII and Jutastat output formats"
-    ],
+    ),
     example_prompt="""[MICRO-OPTIMISATION SEQUENCE]
 
 BASELINE PROMPT:
@@ -968,7 +991,7 @@ ITERATION 5 - Add Constraints:
 
 FINAL OPTIMISED PROMPT:
 [All iterations combined into coherent, high-quality prompt]""",
-    best_for=["Prompt refinement", "Quality improvement", "Teaching prompt engineering"],
+    best_for=("Prompt refinement", "Quality improvement", "Teaching prompt engineering"),
     difficulty="Intermediate",
     source="Microsoft Research / 302 Prompt Expert"
 )
@@ -978,32 +1001,32 @@ SPO_FRAMEWORK = PromptingFramework(
     acronym="SPO",
     category=FrameworkCategory.ITERATIVE,
     description="HKUST/DeepWisdom self-play optimization framework where AI iteratively refines prompts through internal Q&A cycles and adversarial testing.",
-    components=[
-        {
-            "letter": "S",
-            "component": "Set Initial Prompt",
-            "description": "Establish baseline prompt",
-            "example": "Initial: 'Analyse the validity of this restraint of trade clause'"
-        },
-        {
-            "letter": "P",
-            "component": "Play Opponent",
-            "description": "Generate adversarial questions",
-            "example": "Opponent asks: What jurisdiction? Which industry? What is the restraint period? Who are the parties?"
-        },
-        {
-            "letter": "O",
-            "component": "Optimise Response",
-            "description": "Refine prompt to address weaknesses",
-            "example": "Refined: 'Analyse validity of 2-year, 50km restraint for sales manager in pharmaceutical sector, Gauteng High Court jurisdiction'"
-        }
-    ],
-    sa_adaptations=[
+    components=(
+        Component(
+            letter="S",
+            component="Set Initial Prompt",
+            description="Establish baseline prompt",
+            example="Initial: 'Analyse the validity of this restraint of trade clause'"
+        ),
+        Component(
+            letter="P",
+            component="Play Opponent",
+            description="Generate adversarial questions",
+            example="Opponent asks: What jurisdiction? Which industry? What is the restraint period? Who are the parties?"
+        ),
+        Component(
+            letter="O",
+            component="Optimise Response",
+            description="Refine prompt to address weaknesses",
+            example="Refined: 'Analyse validity of 2-year, 50km restraint for sales manager in pharmaceutical sector, Gauteng High Court jurisdiction'"
+        )
+    ),
+    sa_adaptations=(
         "Include SA restraint of trade test (Magna Alloys)",
         "Reference Constitutional Court balance (Reddy v Siemens)",
         "Add Basson v Chilwan reasonableness factors",
         "Consider BCEA protections for employees"
-    ],
+    ),
     example_prompt="""[SPO LEGAL PROMPT REFINEMENT]
 
 INITIAL PROMPT:
@@ -1023,7 +1046,7 @@ Q: What specific terms? What consideration was given?
 
 FINAL OPTIMISED:
 Full prompt with all adversarial gaps addressed.""",
-    best_for=["Prompt refinement", "Gap identification", "Comprehensive coverage"],
+    best_for=("Prompt refinement", "Gap identification", "Comprehensive coverage"),
     difficulty="Intermediate",
     source="HKUST/DeepWisdom Research / 302 Prompt Expert"
 )
@@ -1033,50 +1056,50 @@ GUIDED_FRAMEWORK = PromptingFramework(
     acronym="GUIDED",
     category=FrameworkCategory.STRUCTURAL,
     description="Step-by-step guided optimisation with component checklist. Walks users through each element of a well-constructed legal prompt for learning and completeness.",
-    components=[
-        {
-            "letter": "G",
-            "component": "Goal Definition",
-            "description": "What outcome do you need?",
-            "example": "Goal: Determine whether client has valid claim for constructive dismissal"
-        },
-        {
-            "letter": "U",
-            "component": "User Context",
-            "description": "Who is this for?",
-            "example": "Audience: Senior partner review, client is HR director"
-        },
-        {
-            "letter": "I",
-            "component": "Information Required",
-            "description": "What input is needed?",
-            "example": "Facts: Employment history, working conditions changes, resignation circumstances"
-        },
-        {
-            "letter": "D",
-            "component": "Deliverable Format",
-            "description": "What format is needed?",
-            "example": "Format: Internal memo with risk assessment scale (High/Medium/Low)"
-        },
-        {
-            "letter": "E",
-            "component": "Examples & Precedent",
-            "description": "What references should be used?",
-            "example": "Cite: Pretoria Society for the Care of the Retarded v Loots, Murray v Minister of Defence"
-        },
-        {
-            "letter": "D",
-            "component": "Delimiters & Structure",
-            "description": "How should output be organised?",
-            "example": "Structure: Executive Summary → Facts → Law → Analysis → Risk Assessment → Recommendations"
-        }
-    ],
-    sa_adaptations=[
+    components=(
+        Component(
+            letter="G",
+            component="Goal Definition",
+            description="What outcome do you need?",
+            example="Goal: Determine whether client has valid claim for constructive dismissal"
+        ),
+        Component(
+            letter="U",
+            component="User Context",
+            description="Who is this for?",
+            example="Audience: Senior partner review, client is HR director"
+        ),
+        Component(
+            letter="I",
+            component="Information Required",
+            description="What input is needed?",
+            example="Facts: Employment history, working conditions changes, resignation circumstances"
+        ),
+        Component(
+            letter="D",
+            component="Deliverable Format",
+            description="What format is needed?",
+            example="Format: Internal memo with risk assessment scale (High/Medium/Low)"
+        ),
+        Component(
+            letter="E",
+            component="Examples & Precedent",
+            description="What references should be used?",
+            example="Cite: Pretoria Society for the Care of the Retarded v Loots, Murray v Minister of Defence"
+        ),
+        Component(
+            letter="D",
+            component="Delimiters & Structure",
+            description="How should output be organised?",
+            example="Structure: Executive Summary → Facts → Law → Analysis → Risk Assessment → Recommendations"
+        )
+    ),
+    sa_adaptations=(
         "Guide users to include SA jurisdiction context",
         "Prompt for relevant SA legislation references",
         "Ensure Constitutional Court methodology consideration",
         "Include ubuntu and transformative justice checkpoints"
-    ],
+    ),
     example_prompt="""[GUIDED PROMPT CONSTRUCTION]
 
 Step 1 - GOAL: What legal outcome do you need?
@@ -1099,7 +1122,7 @@ Step 6 - DELIMITERS: What structure?
 
 [ASSEMBLED PROMPT]:
 Complete prompt constructed from all guided steps.""",
-    best_for=["Learning prompt engineering", "Ensuring completeness", "Training junior staff"],
+    best_for=("Learning prompt engineering", "Ensuring completeness", "Training junior staff"),
     difficulty="Beginner",
     source="302 Prompt Expert Complete Guide"
 )
@@ -1108,7 +1131,8 @@ Complete prompt constructed from all guided steps.""",
 # ALL FRAMEWORKS COLLECTION
 # ═══════════════════════════════════════════════════════════════════════════════
 
-ALL_FRAMEWORKS: Dict[str, PromptingFramework] = {
+# Read-only view: callers share the registry without defensive copies
+ALL_FRAMEWORKS: Mapping[str, PromptingFramework] = MappingProxyType({
     "RICE": RICE_FRAMEWORK,
     "ABCDE": ABCDE_FRAMEWORK,
     "7 Ps": SEVEN_PS_FRAMEWORK,
@@ -1126,92 +1150,197 @@ ALL_FRAMEWORKS: Dict[str, PromptingFramework] = {
     "MICRO": MICRO_OPT_FRAMEWORK,
     "SPO": SPO_FRAMEWORK,
     "GUIDED": GUIDED_FRAMEWORK,
+})
+
+# UI selector labels -> ALL_FRAMEWORKS keys (built once at import)
+FRAMEWORK_OPTIONS: Dict[str, str] = {
+    f"{fw.acronym} - {fw.name}": key for key, fw in ALL_FRAMEWORKS.items()
+}
+N_FRAMEWORKS: int = len(ALL_FRAMEWORKS)
+# Category filter labels (only categories that have entries), sorted
+FRAMEWORK_CATEGORY_LABELS: Tuple[str, ...] = tuple(sorted({fw.category.value for fw in ALL_FRAMEWORKS.values()}))
+# Case-insensitive acronym index, plus its sorted keys for prefix search
+FRAMEWORKS_BY_ACRONYM: Dict[str, PromptingFramework] = {
+    fw.acronym.upper(): fw for fw in ALL_FRAMEWORKS.values()
 }
+_SORTED_ACRONYMS: Tuple[str, ...] = tuple(sorted(FRAMEWORKS_BY_ACRONYM))
+
+def _index_by_category() -> Dict[FrameworkCategory, Tuple[PromptingFramework, ...]]:
+    """Group frameworks by category in one pass, preserving registry order"""
+    groups: Dict[FrameworkCategory, List[PromptingFramework]] = {}
+    for fw in ALL_FRAMEWORKS.values():
+        groups.setdefault(fw.category, []).append(fw)
+    return {category: tuple(fws) for category, fws in groups.items()}
+
+def _index_by_difficulty() -> Dict[str, Tuple[PromptingFramework, ...]]:
+    """Group frameworks by lower-cased difficulty in one pass, preserving registry order"""
+    groups: Dict[str, List[PromptingFramework]] = {}
+    for fw in ALL_FRAMEWORKS.values():
+        groups.setdefault(fw.difficulty.lower(), []).append(fw)
+    return {difficulty: tuple(fws) for difficulty, fws in groups.items()}
+
+FRAMEWORKS_BY_CATEGORY: Dict[FrameworkCategory, Tuple[PromptingFramework, ...]] = _index_by_category()
+FRAMEWORKS_BY_DIFFICULTY: Dict[str, Tuple[PromptingFramework, ...]] = _index_by_difficulty()
 
 def get_frameworks_by_category(category: FrameworkCategory) -> List[PromptingFramework]:
     """Get all frameworks in a specific category"""
-    return [f for f in ALL_FRAMEWORKS.values() if f.category == category]
+    return list(FRAMEWORKS_BY_CATEGORY.get(category, ()))
 
 def get_frameworks_by_difficulty(difficulty: str) -> List[PromptingFramework]:
     """Get frameworks by difficulty level"""
-    return [f for f in ALL_FRAMEWORKS.values() if f.difficulty.lower() == difficulty.lower()]
+    return list(FRAMEWORKS_BY_DIFFICULTY.get(difficulty.lower(), ()))
 
 def get_framework_by_acronym(acronym: str) -> Optional[PromptingFramework]:
-    """Get a specific framework by its acronym"""
-    return ALL_FRAMEWORKS.get(acronym.upper())
+    """Get a specific framework by its acronym (case-insensitive)"""
+    return FRAMEWORKS_BY_ACRONYM.get(acronym.upper())
+
+def get_frameworks_by_prefix(prefix: str) -> List[PromptingFramework]:
+    """Get frameworks whose acronym starts with prefix (case-insensitive), for autocomplete"""
+    prefix = prefix.upper()
+    start = bisect_left(_SORTED_ACRONYMS, prefix)
+    matches = []
+    for acronym in _SORTED_ACRONYMS[start:]:
+        if not acronym.startswith(prefix):
+            break
+        matches.append(FRAMEWORKS_BY_ACRONYM[acronym])
+    return matches
+
+# Fixed closing section appended to every combined prompt
+_SA_REQUIREMENTS_FOOTER: Tuple[str, ...] = (
+    "",
+    "## SA-Specific Requirements",
+    "- Use SAFLII neutral citation format",
+    "- Reference SA legislation by Act number",
+    "- Apply Constitutional Court methodology",
+    "- Consider ubuntu and transformative constitutionalism",
+    "- Verify all citations independently",
+    "",
+)
 
 def generate_combined_prompt(
-    frameworks: List[str],
+    frameworks: Sequence[str],
     context: str,
     legal_issue: str,
     practice_area: PracticeArea
 ) -> str:
     """Generate a combined prompt using multiple frameworks"""
-    combined = f"""
-# Combined SA Legal Prompt
-Practice Area: {practice_area.value}
-
-## Context
-{context}
-
-## Legal Issue
-{legal_issue}
+    # Order and repeats are significant, so the key is the plain tuple
+    return _combined_prompt(tuple(frameworks), context, legal_issue, practice_area)
 
-## Applied Frameworks
-"""
+@lru_cache(maxsize=256)
+def _combined_prompt(
+    frameworks: Tuple[str, ...],
+    context: str,
+    legal_issue: str,
+    practice_area: PracticeArea
+) -> str:
+    """Cached body of generate_combined_prompt"""
+    parts: List[str] = [
+        "",
+        "# Combined SA Legal Prompt",
+        f"Practice Area: {practice_area}",
+        "",
+        "## Context",
+        context,
+        "",
+        "## Legal Issue",
+        legal_issue,
+        "",
+        "## Applied Frameworks",
+    ]
     for fw_name in frameworks:
         fw = ALL_FRAMEWORKS.get(fw_name)
         if fw:
-            combined += f"\n### {fw.acronym} ({fw.name})\n"
-            for comp in fw.components:
-                combined += f"**{comp['component']}**: [Apply {comp['description']}]\n"
+            parts.append("")
+            parts.append(f"### {fw.acronym} ({fw.name})")
+            parts.extend(f"**{comp.component}**: [Apply {comp.description}]" for comp in fw.components)
     
-    combined += """
-## SA-Specific Requirements
-- Use SAFLII neutral citation format
-- Reference SA legislation by Act number
-- Apply Constitutional Court methodology
-- Consider ubuntu and transformative constitutionalism
-- Verify all citations independently
-"""
-    return combined
+    parts.extend(_SA_REQUIREMENTS_FOOTER)
+    return "\n".join(parts)
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # FRAMEWORK SELECTOR LOGIC
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# Task keywords (matched case-insensitively anywhere in the task type) -> framework, in priority order
+_TASK_RULES: Tuple[Tuple[Tuple[str, ...], PromptingFramework], ...] = (
+    (("research",), JUST_ASK_FRAMEWORK),
+    (("draft", "document"), SEVEN_PS_FRAMEWORK),
+    (("analysis", "opinion"), RICE_FRAMEWORK),
+    (("client", "communication"), ABCDE_FRAMEWORK),
+)
+
+# All task keywords in one alternation; group ruleN marks a hit for _TASK_RULES[N].
+# No keyword's suffix is another's prefix, so non-overlapping scanning misses nothing.
+_TASK_PATTERN = re.compile(
+    "|".join(
+        f"(?P<rule{i}>{'|'.join(map(re.escape, keywords))})"
+        for i, (keywords, _) in enumerate(_TASK_RULES)
+    ),
+    re.IGNORECASE,
+)
+
+_COMPLEXITY_RULES: Dict[str, Tuple[PromptingFramework, ...]] = {
+    "complex": (CHAIN_OF_THOUGHT_LEGAL, PROMPT_CHAINING),
+    "simple": (CASE_FRAMEWORK,),
+}
+
+_VERIFICATION_FRAMEWORKS: Tuple[PromptingFramework, ...] = (HOSTILE_WITNESS_TECHNIQUE, FALSIFIABLE_QUESTIONS)
+
 def recommend_framework(
     task_type: str,
     complexity: str,
     verification_needed: bool
 ) -> List[PromptingFramework]:
     """Recommend appropriate frameworks based on task characteristics"""
-    recommendations = []
+    # Insertion-ordered dict doubles as an ordered set
+    recommendations: Dict[PromptingFramework, None] = {}
     
-    # Base framework by task type
-    if "research" in task_type.lower():
-        recommendations.append(JUST_ASK_FRAMEWORK)
-    if "draft" in task_type.lower() or "document" in task_type.lower():
-        recommendations.append(SEVEN_PS_FRAMEWORK)
-    if "analysis" in task_type.lower() or "opinion" in task_type.lower():
-        recommendations.append(RICE_FRAMEWORK)
-    if "client" in task_type.lower() or "communication" in task_type.lower():
-        recommendations.append(ABCDE_FRAMEWORK)
+    # Base framework by task type (single scan, then rule order)
+    matched = {m.lastgroup for m in _TASK_PATTERN.finditer(task_type)}
+    for i, (_, fw) in enumerate(_TASK_RULES):
+        if f"rule{i}" in matched:
+            recommendations[fw] = None
     
     # Add complexity-based framework
-    if complexity.lower() == "complex":
-        recommendations.append(CHAIN_OF_THOUGHT_LEGAL)
-        recommendations.append(PROMPT_CHAINING)
-    elif complexity.lower() == "simple":
-        recommendations.append(CASE_FRAMEWORK)
+    for fw in _COMPLEXITY_RULES.get(complexity.lower(), ()):
+        recommendations[fw] = None
     
     # Add verification frameworks if needed
     if verification_needed:
-        recommendations.append(HOSTILE_WITNESS_TECHNIQUE)
-        recommendations.append(FALSIFIABLE_QUESTIONS)
+        for fw in _VERIFICATION_FRAMEWORKS:
+            recommendations[fw] = None
     
     # Always recommend positive framing
-    if PINK_ELEPHANTS not in recommendations:
-        recommendations.append(PINK_ELEPHANTS)
+    recommendations[PINK_ELEPHANTS] = None
     
-    return recommendations
+    return list(recommendations)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# EXPORTS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+__all__ = [
+    # Enums
+    'FrameworkCategory',
+    'PracticeArea',
+    # Data classes
+    'Component',
+    'PromptingFramework',
+    # Registries
+    'ALL_FRAMEWORKS',
+    'FRAMEWORK_OPTIONS',
+    'N_FRAMEWORKS',
+    'FRAMEWORK_CATEGORY_LABELS',
+    'FRAMEWORKS_BY_ACRONYM',
+    'FRAMEWORKS_BY_CATEGORY',
+    'FRAMEWORKS_BY_DIFFICULTY',
+    # Functions
+    'get_frameworks_by_category',
+    'get_frameworks_by_difficulty',
+    'get_framework_by_acronym',
+    'get_frameworks_by_prefix',
+    'generate_combined_prompt',
+    'recommend_framework'
+]
@@ -3,11 +3,14 @@
 AI-Assisted Document Drafting Templates for South African Legal Practice
 """
 
-from dataclasses import dataclass, field
-from enum import Enum
-from typing import List, Dict, Optional
-
-class DocumentCategory(Enum):
+import sys
+from dataclasses import dataclass
+from enum import StrEnum
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Final, List, Mapping, Optional, Tuple
+
+class DocumentCategory(StrEnum):
     """Categories of Legal Documents"""
     CORRESPONDENCE = "Legal Correspondence"
     PLEADINGS = "Court Pleadings"
@@ -17,7 +20,7 @@ class DocumentCategory(Enum):
     CORPORATE = "Corporate Documents"
     CONVEYANCING = "Conveyancing Documents"
 
-class Court(Enum):
+class Court(StrEnum):
     """Courts for Pleading Templates"""
     CONSTITUTIONAL = "Constitutional Court"
     SCA = "Supreme Court of Appeal"
@@ -27,7 +30,7 @@ class Court(Enum):
     LABOUR_COURT = "Labour Court"
     CCMA = "CCMA"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DocumentSection:
     """Section of a Document Template"""
     name: str
@@ -36,37 +39,50 @@ class DocumentSection:
     content_guidance: str
     example: str
 
-@dataclass
+    def __post_init__(self):
+        """Intern the short labels that recur across templates"""
+        object.__setattr__(self, "name", sys.intern(self.name))
+        object.__setattr__(self, "description", sys.intern(self.description))
+        object.__setattr__(self, "content_guidance", sys.intern(self.content_guidance))
+
+@dataclass(slots=True, frozen=True)
 class DocumentTemplate:
     """Legal Document Template"""
     title: str
     category: DocumentCategory
     description: str
-    use_cases: List[str]
-    applicable_courts: Optional[List[Court]]
-    structure: List[DocumentSection]
-    drafting_tips: List[str]
-    common_errors: List[str]
+    use_cases: Tuple[str, ...]
+    applicable_courts: Optional[Tuple[Court, ...]]
+    structure: Tuple[DocumentSection, ...]
+    drafting_tips: Tuple[str, ...]
+    common_errors: Tuple[str, ...]
     prompt_template: str
-    key_legislation: List[str]
+    key_legislation: Tuple[str, ...]
     time_estimate: str
 
+    def __post_init__(self):
+        """Intern the title and the short list entries that recur across templates"""
+        object.__setattr__(self, "title", sys.intern(self.title))
+        object.__setattr__(self, "use_cases", tuple(sys.intern(s) for s in self.use_cases))
+        object.__setattr__(self, "drafting_tips", tuple(sys.intern(s) for s in self.drafting_tips))
+        object.__setattr__(self, "key_legislation", tuple(sys.intern(s) for s in self.key_legislation))
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # LEGAL CORRESPONDENCE
 # ═══════════════════════════════════════════════════════════════════════════════
 
-LETTER_OF_DEMAND = DocumentTemplate(
+LETTER_OF_DEMAND: Final[DocumentTemplate] = DocumentTemplate(
     title="Letter of Demand",
     category=DocumentCategory.CORRESPONDENCE,
     description="Formal demand letter required before instituting civil proceedings for recovery of debt or damages.",
-    use_cases=[
+    use_cases=(
         "Debt recovery",
         "Breach of contract claims",
         "Delictual damages claims",
         "Matrimonial contribution claims"
-    ],
-    applicable_courts=[Court.HIGH_COURT, Court.MAGISTRATES_COURT],
-    structure=[
+    ),
+    applicable_courts=(Court.HIGH_COURT, Court.MAGISTRATES_COURT),
+    structure=(
         DocumentSection(
             name="Heading and Reference",
             description="Letterhead, date, reference number, delivery method notation",
@@ -137,8 +153,8 @@ LETTER_OF_DEMAND = DocumentTemplate(
             content_guidance="Partner/director signature with contact details.",
             example="[Firm Name]\nPer: [Signatory]\nDirect: [Tel]\nEmail: [Email]"
         )
-    ],
-    drafting_tips=[
+    ),
+    drafting_tips=(
         "Be factually accurate - allegations must be provable",
         "Calculate interest correctly per agreement or Prescribed Rate of Interest Act",
         "Give reasonable time to comply (too short may be criticised by court)",
@@ -146,15 +162,15 @@ LETTER_OF_DEMAND = DocumentTemplate(
         "Keep copy of proof of delivery",
         "Consider in duplum rule for interest",
         "For consumers, ensure NCA and CPA compliance"
-    ],
-    common_errors=[
+    ),
+    common_errors=(
         "Interest incorrectly calculated",
         "Wrong legal entity sued",
         "Insufficient time allowed",
         "Threatening criminal proceedings for civil debt",
         "Not preserving proof of delivery",
         "Ignoring prescription periods"
-    ],
+    ),
     prompt_template="""
 # Letter of Demand Drafting
 
@@ -195,12 +211,12 @@ Draft a professional Letter of Demand that:
 ## Output
 Complete, ready-to-send Letter of Demand with all sections properly completed.
 """,
-    key_legislation=[
+    key_legislation=(
         "Prescribed Rate of Interest Act 55 of 1975",
         "National Credit Act 34 of 2005 (s129 for credit agreements)",
         "Consumer Protection Act 68 of 2008",
         "In duplum common law rule"
-    ],
+    ),
     time_estimate="30-60 minutes"
 )
 
@@ -208,18 +224,18 @@ Complete, ready-to-send Letter of Demand with all sections properly completed.
 # COURT PLEADINGS
 # ═══════════════════════════════════════════════════════════════════════════════
 
-PARTICULARS_OF_CLAIM = DocumentTemplate(
+PARTICULARS_OF_CLAIM: Final[DocumentTemplate] = DocumentTemplate(
     title="Particulars of Claim",
     category=DocumentCategory.PLEADINGS,
     description="The founding document in civil action stating plaintiff's cause of action.",
-    use_cases=[
+    use_cases=(
         "Contract claims",
         "Delictual claims",
         "Debt recovery actions",
         "Divorce actions"
-    ],
-    applicable_courts=[Court.HIGH_COURT, Court.MAGISTRATES_COURT],
-    structure=[
+    ),
+    applicable_courts=(Court.HIGH_COURT, Court.MAGISTRATES_COURT),
+    structure=(
         DocumentSection(
             name="Case Number and Heading",
             description="Court case number and party designations",
@@ -283,8 +299,8 @@ PARTICULARS_OF_CLAIM = DocumentTemplate(
             content_guidance="Physical address within court jurisdiction. Email if e-filing.",
             example="PLAINTIFF'S ADDRESS FOR SERVICE:\n[Address]\nTel: [X]\nEmail: [X]\nc/o [Local correspondent if applicable]"
         )
-    ],
-    drafting_tips=[
+    ),
+    drafting_tips=(
         "Every material fact must be pleaded - apply 'so what?' test",
         "Avoid evidence - plead facts, not how you'll prove them",
         "Each paragraph should contain one proposition",
@@ -292,8 +308,8 @@ PARTICULARS_OF_CLAIM = DocumentTemplate(
         "Plead legal conclusions (e.g., 'breached') after pleading facts supporting them",
         "Check monetary jurisdiction for correct court",
         "Include interest claim with rate and start date"
-    ],
-    common_errors=[
+    ),
+    common_errors=(
         "Pleading evidence instead of facts",
         "Failing to plead all elements of cause of action",
         "Incorrect calculation of interest",
@@ -301,7 +317,7 @@ PARTICULARS_OF_CLAIM = DocumentTemplate(
         "Vague or embarrassing pleadings",
         "Failing to annex written agreement",
         "Not stating basis for jurisdiction"
-    ],
+    ),
     prompt_template="""
 # Particulars of Claim Drafting
 
@@ -356,27 +372,27 @@ Draft Particulars of Claim that:
 ## Output
 Complete Particulars of Claim ready for filing.
 """,
-    key_legislation=[
+    key_legislation=(
         "Uniform Rules of Court (High Court)",
         "Magistrates' Courts Rules (Magistrates Court)",
         "Prescription Act 68 of 1969",
         "Prescribed Rate of Interest Act 55 of 1975"
-    ],
+    ),
     time_estimate="1-3 hours depending on complexity"
 )
 
-HEADS_OF_ARGUMENT = DocumentTemplate(
+HEADS_OF_ARGUMENT: Final[DocumentTemplate] = DocumentTemplate(
     title="Heads of Argument",
     category=DocumentCategory.PLEADINGS,
     description="Written legal submissions summarising a party's case and legal arguments.",
-    use_cases=[
+    use_cases=(
         "High Court applications and trials",
         "Appeals",
         "Constitutional Court matters",
         "Complex motion proceedings"
-    ],
-    applicable_courts=[Court.CONSTITUTIONAL, Court.SCA, Court.HIGH_COURT],
-    structure=[
+    ),
+    applicable_courts=(Court.CONSTITUTIONAL, Court.SCA, Court.HIGH_COURT),
+    structure=(
         DocumentSection(
             name="Cover Page",
             description="Case details and party identification",
@@ -440,8 +456,8 @@ HEADS_OF_ARGUMENT = DocumentTemplate(
             content_guidance="Alphabetical list of cases. Separate legislation. Include pinpoint references.",
             example="LIST OF AUTHORITIES\nCases\nMinister of Home Affairs v Fourie [2005] ZACC 19\nS v Makwanyane [1995] ZACC 3\nLegislation\nConstitution of the Republic of South Africa, 1996 - ss 9, 10, 36"
         )
-    ],
-    drafting_tips=[
+    ),
+    drafting_tips=(
         "Start with your strongest argument",
         "Every factual statement must reference the record",
         "Quote key passages from authorities - don't just cite",
@@ -450,8 +466,8 @@ HEADS_OF_ARGUMENT = DocumentTemplate(
         "Use headings and subheadings for clarity",
         "Include a table of authorities",
         "Proofread citations carefully"
-    ],
-    common_errors=[
+    ),
+    common_errors=(
         "Factual statements without record references",
         "Citing cases without explaining their relevance",
         "Failing to address contrary authority",
@@ -459,7 +475,7 @@ HEADS_OF_ARGUMENT = DocumentTemplate(
         "Incorrect citation format",
         "Not updating table of contents",
         "Emotional or argumentative tone"
-    ],
+    ),
     prompt_template="""
 # Heads of Argument Drafting
 
@@ -513,12 +529,12 @@ Use SAFLII neutral citation format:
 ## Output
 Complete Heads of Argument ready for filing.
 """,
-    key_legislation=[
+    key_legislation=(
         "Uniform Rules of Court",
         "Constitutional Court Rules",
         "Supreme Court of Appeal Rules",
         "Practice Directives of specific court"
-    ],
+    ),
     time_estimate="4-12 hours depending on complexity"
 )
 
@@ -526,19 +542,19 @@ Complete Heads of Argument ready for filing.
 # CONTRACTS & AGREEMENTS
 # ═══════════════════════════════════════════════════════════════════════════════
 
-NDA_AGREEMENT = DocumentTemplate(
+NDA_AGREEMENT: Final[DocumentTemplate] = DocumentTemplate(
     title="Non-Disclosure Agreement (Confidentiality Agreement)",
     category=DocumentCategory.CONTRACTS,
     description="Agreement protecting confidential information shared between parties.",
-    use_cases=[
+    use_cases=(
         "Pre-transaction due diligence",
         "Employment relationships",
         "Joint ventures and partnerships",
         "Tender/RFP processes",
         "Technology licensing discussions"
-    ],
+    ),
     applicable_courts=None,
-    structure=[
+    structure=(
         DocumentSection(
             name="Heading and Parties",
             description="Agreement title and party definitions",
@@ -616,8 +632,8 @@ NDA_AGREEMENT = DocumentTemplate(
             content_guidance="Signature lines, witness if required, date.",
             example="SIGNED at [place] on this [day] of [month] [year]\n\nFor and on behalf of [PARTY A]:\n_____________________\nName:\nCapacity:\n\nAs witness:\n1. _____________________\n2. _____________________"
         )
-    ],
-    drafting_tips=[
+    ),
+    drafting_tips=(
         "Define 'Confidential Information' carefully - not too broad or narrow",
         "Consider mutual vs one-way NDA based on circumstances",
         "Include practical carve-outs for Representatives",
@@ -625,15 +641,15 @@ NDA_AGREEMENT = DocumentTemplate(
         "Consider POPIA implications for personal information",
         "Include clear return/destruction provisions",
         "Specify governing law and jurisdiction"
-    ],
-    common_errors=[
+    ),
+    common_errors=(
         "Overly broad definition of Confidential Information",
         "No exclusions for public/prior knowledge",
         "Unreasonable duration",
         "No provision for legally compelled disclosure",
         "Missing signature requirements for company",
         "No survival clause after termination"
-    ],
+    ),
     prompt_template="""
 # NDA Drafting
 
@@ -673,12 +689,12 @@ Draft an NDA that:
 ## Output
 Complete NDA ready for review and execution.
 """,
-    key_legislation=[
+    key_legislation=(
         "Common law of contract",
         "Protection of Personal Information Act 4 of 2013 (POPIA)",
         "Electronic Communications and Transactions Act 25 of 2002",
         "Companies Act 71 of 2008 (signing requirements)"
-    ],
+    ),
     time_estimate="1-2 hours"
 )
 
@@ -686,19 +702,19 @@ Complete NDA ready for review and execution.
 # LEGAL OPINIONS
 # ═══════════════════════════════════════════════════════════════════════════════
 
-LEGAL_OPINION = DocumentTemplate(
+LEGAL_OPINION: Final[DocumentTemplate] = DocumentTemplate(
     title="Legal Opinion/Advice",
     category=DocumentCategory.OPINIONS,
     description="Formal written legal advice on a specific legal question or matter.",
-    use_cases=[
+    use_cases=(
         "Transaction opinions",
         "Regulatory compliance",
         "Risk assessment",
         "Pre-litigation advice",
         "Board advice"
-    ],
+    ),
     applicable_courts=None,
-    structure=[
+    structure=(
         DocumentSection(
             name="Header",
             description="Title and confidentiality notice",
@@ -769,8 +785,8 @@ LEGAL_OPINION = DocumentTemplate(
             content_guidance="State that opinion is based on SA law only, facts as stated, and is not guarantee.",
             example="9. QUALIFICATIONS\n9.1 This opinion is based on the laws of South Africa as at the date hereof.\n9.2 We express no opinion on the laws of any other jurisdiction.\n9.3 This opinion is based on the facts as set out above..."
         )
-    ],
-    drafting_tips=[
+    ),
+    drafting_tips=(
         "Be clear on what you are opining on - and what you are not",
         "State all assumptions and qualifications upfront",
         "Distinguish between 'facts' (as provided) and your analysis",
@@ -778,8 +794,8 @@ LEGAL_OPINION = DocumentTemplate(
         "Consider the reader - adjust technical detail accordingly",
         "If uncertain, say so - and explain why",
         "Check privilege and confidentiality claims"
-    ],
-    common_errors=[
+    ),
+    common_errors=(
         "Scope creep - opining beyond instructions",
         "Unclear conclusions",
         "Not stating assumptions",
@@ -787,7 +803,7 @@ LEGAL_OPINION = DocumentTemplate(
         "Not addressing all questions posed",
         "Outdated law",
         "Not limiting to SA law"
-    ],
+    ),
     prompt_template="""
 # Legal Opinion Drafting
 
@@ -831,10 +847,10 @@ Draft a Legal Opinion that:
 ## Output
 Complete Legal Opinion ready for partner review.
 """,
-    key_legislation=[
+    key_legislation=(
         "Depends on subject matter",
         "Note: Identify and reference all applicable statutes"
-    ],
+    ),
     time_estimate="2-8 hours depending on complexity"
 )
 
@@ -842,50 +858,119 @@ Complete Legal Opinion ready for partner review.
 # ALL DOCUMENT TEMPLATES
 # ═══════════════════════════════════════════════════════════════════════════════
 
-ALL_DOCUMENT_TEMPLATES: Dict[str, DocumentTemplate] = {
+# Read-only view: callers share the registry without defensive copies
+ALL_DOCUMENT_TEMPLATES: Mapping[str, DocumentTemplate] = MappingProxyType({
     "letter_of_demand": LETTER_OF_DEMAND,
     "particulars_of_claim": PARTICULARS_OF_CLAIM,
     "heads_of_argument": HEADS_OF_ARGUMENT,
     "nda_agreement": NDA_AGREEMENT,
     "legal_opinion": LEGAL_OPINION,
-}
+})
+
+# UI selector labels -> ALL_DOCUMENT_TEMPLATES keys (built once at import)
+DOCUMENT_TEMPLATE_OPTIONS: Dict[str, str] = {d.title: key for key, d in ALL_DOCUMENT_TEMPLATES.items()}
+N_DOCUMENT_TEMPLATES: int = len(ALL_DOCUMENT_TEMPLATES)
+# Selector labels in display order
+DOCUMENT_TEMPLATE_LABELS: Tuple[str, ...] = tuple(sorted(DOCUMENT_TEMPLATE_OPTIONS))
+# Category filter labels (only categories that have entries), sorted
+DOCUMENT_CATEGORY_LABELS: Tuple[str, ...] = tuple(sorted({d.category.value for d in ALL_DOCUMENT_TEMPLATES.values()}))
+
+def _index_by_category() -> Dict[DocumentCategory, Tuple[DocumentTemplate, ...]]:
+    """Group templates by category in one pass, preserving registry order"""
+    groups: Dict[DocumentCategory, List[DocumentTemplate]] = {}
+    for d in ALL_DOCUMENT_TEMPLATES.values():
+        groups.setdefault(d.category, []).append(d)
+    return {category: tuple(docs) for category, docs in groups.items()}
+
+DOCUMENT_TEMPLATES_BY_CATEGORY: Dict[DocumentCategory, Tuple[DocumentTemplate, ...]] = _index_by_category()
 
 def get_templates_by_category(category: DocumentCategory) -> List[DocumentTemplate]:
     """Get all templates for a specific category"""
-    return [t for t in ALL_DOCUMENT_TEMPLATES.values() if t.category == category]
+    return list(DOCUMENT_TEMPLATES_BY_CATEGORY.get(category, ()))
+
+# One structure-guide entry per section
+_SECTION_TEMPLATE = (
+    "## {i}. {name} [{req}]\n"
+    "**Description:** {description}\n"
+    "**Guidance:** {guidance}\n"
+    "**Example:**\n```\n{example}\n```\n\n"
+)
 
+@lru_cache(maxsize=None)
 def get_template_structure(template: DocumentTemplate) -> str:
-    """Get formatted structure guide for a template"""
-    structure_text = f"# {template.title} Structure\n\n"
+    """Get formatted structure guide for a template (rendered once per template)"""
+    parts = [f"# {template.title} Structure\n\n"]
     for i, section in enumerate(template.structure, 1):
         req_marker = "✓ REQUIRED" if section.required else "○ Optional"
-        structure_text += f"## {i}. {section.name} [{req_marker}]\n"
-        structure_text += f"**Description:** {section.description}\n"
-        structure_text += f"**Guidance:** {section.content_guidance}\n"
-        structure_text += f"**Example:**\n```\n{section.example}\n```\n\n"
-    return structure_text
-
-def generate_document_prompt(template: DocumentTemplate, context: str) -> str:
-    """Generate a complete prompt for document drafting"""
-    return f"""
-{template.prompt_template}
-
-## Your Specific Context
-{context}
+        parts.append(_SECTION_TEMPLATE.format(
+            i=i,
+            name=section.name,
+            req=req_marker,
+            description=section.description,
+            guidance=section.content_guidance,
+            example=section.example,
+        ))
+    return "".join(parts)
+
+@lru_cache(maxsize=None)
+def _document_prompt_parts(template: DocumentTemplate) -> Tuple[str, str]:
+    """Static text before and after the user context, built once per template"""
+    legislation = "\n".join(f"• {leg}" for leg in template.key_legislation)
+    tips = "\n".join(f"💡 {tip}" for tip in template.drafting_tips)
+    errors = "\n".join(f"⚠️ {error}" for error in template.common_errors)
+    prefix = f"\n{template.prompt_template}\n\n## Your Specific Context\n"
+    suffix = f"""
 
 ## Document Structure Required
 {get_template_structure(template)}
 
 ## Key Legislation
-{chr(10).join(f"• {leg}" for leg in template.key_legislation)}
+{legislation}
 
 ## Drafting Tips
-{chr(10).join(f"💡 {tip}" for tip in template.drafting_tips)}
+{tips}
 
 ## Common Errors to Avoid
-{chr(10).join(f"⚠️ {error}" for error in template.common_errors)}
+{errors}
 
 ---
 Estimated drafting time: {template.time_estimate}
 IMPORTANT: This is a template for guidance. All documents must be reviewed by a qualified attorney before use.
 """
+    return prefix, suffix
+
+def generate_document_prompt(template: DocumentTemplate, context: str) -> str:
+    """Generate a complete prompt for document drafting"""
+    prefix, suffix = _document_prompt_parts(template)
+    return prefix + context + suffix
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# EXPORTS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+__all__ = [
+    # Enums
+    'DocumentCategory',
+    'Court',
+    # Data classes
+    'DocumentSection',
+    'DocumentTemplate',
+    # Templates
+    'LETTER_OF_DEMAND',
+    'PARTICULARS_OF_CLAIM',
+    'HEADS_OF_ARGUMENT',
+    'NDA_AGREEMENT',
+    'LEGAL_OPINION',
+    # Registries
+    'ALL_DOCUMENT_TEMPLATES',
+    'DOCUMENT_TEMPLATE_OPTIONS',
+    'N_DOCUMENT_TEMPLATES',
+    'DOCUMENT_TEMPLATE_LABELS',
+    'DOCUMENT_CATEGORY_LABELS',
+    'DOCUMENT_TEMPLATES_BY_CATEGORY',
+    # Functions
+    'get_templates_by_category',
+    'get_template_structure',
+    'generate_document_prompt'
+]
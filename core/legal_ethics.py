@@ -3,11 +3,13 @@
 Professional Ethics Guidelines for AI-Assisted Legal Practice in South Africa
 """
 
-from dataclasses import dataclass, field
-from enum import Enum
-from typing import List, Dict, Optional
+from dataclasses import dataclass
+from enum import StrEnum
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Dict, Iterable, Mapping, NamedTuple, Optional, Tuple
 
-class EthicsCategory(Enum):
+class EthicsCategory(StrEnum):
     """Categories of Legal Ethics for AI"""
     COMPETENCE = "Professional Competence"
     CONFIDENTIALITY = "Confidentiality & Privilege"
@@ -17,14 +19,20 @@ class EthicsCategory(Enum):
     VERIFICATION = "Verification & Accuracy"
     BIAS = "Bias & Fairness"
 
-class RiskLevel(Enum):
+class RiskLevel(StrEnum):
     """Risk level for AI use scenarios"""
     HIGH = "High Risk - Exercise Extreme Caution"
     MEDIUM = "Medium Risk - Proceed with Care"
     LOW = "Low Risk - Standard Precautions"
     PROHIBITED = "Prohibited - Do Not Use AI"
 
-@dataclass
+class Example(NamedTuple):
+    """A worked ethics scenario attached to a guideline"""
+    situation: str
+    issue: str
+    resolution: str
+
+@dataclass(slots=True, frozen=True)
 class EthicalGuideline:
     """Ethical guideline for AI use in SA legal practice"""
     title: str
@@ -32,20 +40,20 @@ class EthicalGuideline:
     description: str
     lpc_rule_reference: Optional[str]
     sa_context: str
-    requirements: List[str]
-    prohibited_practices: List[str]
-    best_practices: List[str]
-    examples: List[Dict[str, str]]
+    requirements: Tuple[str, ...]
+    prohibited_practices: Tuple[str, ...]
+    best_practices: Tuple[str, ...]
+    examples: Tuple[Example, ...]
     prompt_guidance: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AIUseScenario:
     """Scenario for AI use with risk assessment"""
     scenario: str
     risk_level: RiskLevel
-    safeguards_required: List[str]
+    safeguards_required: Tuple[str, ...]
     recommended_approach: str
-    prohibited_uses: List[str]
+    prohibited_uses: Tuple[str, ...]
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # CORE ETHICAL GUIDELINES
@@ -62,39 +70,39 @@ competence. While no specific AI rules exist yet, the duty of competence extends
 technology use. SA practitioners should follow international guidance (ABA Formal 
 Opinion 512) adapted for local context, pending LPC-specific guidance.
     """,
-    requirements=[
+    requirements=(
         "Understand capabilities and limitations of AI tools used",
         "Stay current with developments in legal AI technology",
         "Recognise when AI is appropriate vs inappropriate for specific tasks",
         "Maintain ability to independently verify AI outputs",
         "Ensure AI use does not undermine quality of legal work",
         "Complete appropriate training on AI tools before professional use"
-    ],
-    prohibited_practices=[
+    ),
+    prohibited_practices=(
         "Using AI tools without understanding their limitations",
         "Relying solely on AI without independent verification",
         "Using AI for tasks beyond its demonstrated capabilities",
         "Ignoring known issues with AI hallucinations in legal contexts"
-    ],
-    best_practices=[
+    ),
+    best_practices=(
         "Attend CLE/CPD courses on legal AI",
         "Test AI tools on known matters before using on client work",
         "Maintain a log of AI tool performance and issues",
         "Subscribe to updates on legal AI developments",
         "Participate in law society AI working groups"
-    ],
-    examples=[
-        {
-            "situation": "Attorney uses ChatGPT for legal research without understanding it hallucinates citations",
-            "issue": "Breach of competence - failing to understand tool limitations",
-            "resolution": "Train on AI limitations; always verify citations on SAFLII"
-        },
-        {
-            "situation": "Advocate uses AI to draft heads of argument, properly reviews and edits",
-            "issue": "None - appropriate supervised use",
-            "resolution": "Continue with proper review process"
-        }
-    ],
+    ),
+    examples=(
+        Example(
+            situation="Attorney uses ChatGPT for legal research without understanding it hallucinates citations",
+            issue="Breach of competence - failing to understand tool limitations",
+            resolution="Train on AI limitations; always verify citations on SAFLII"
+        ),
+        Example(
+            situation="Advocate uses AI to draft heads of argument, properly reviews and edits",
+            issue="None - appropriate supervised use",
+            resolution="Continue with proper review process"
+        )
+    ),
     prompt_guidance="""
 When using AI for legal work, always:
 1. State your verification requirements: "I will independently verify all citations on SAFLII"
@@ -117,41 +125,41 @@ enforced. Information shared with public AI tools may be:
 3. At risk of data breaches
 SA practitioners must be especially cautious given limited local case law on AI privilege waiver.
     """,
-    requirements=[
+    requirements=(
         "Never input client-identifying information into public AI tools",
         "Use enterprise/professional AI tools with data protection agreements",
         "Anonymise all prompts before input (remove names, case numbers, identifiers)",
         "Verify AI tool's data retention and training policies",
         "Obtain informed consent if using AI that poses confidentiality risks",
         "Maintain records of AI tool usage for privilege purposes"
-    ],
-    prohibited_practices=[
+    ),
+    prohibited_practices=(
         "Inputting client names, ID numbers, or case numbers into public AI",
         "Using free AI tools for privileged communications analysis",
         "Copying entire client files into AI prompts",
         "Sharing confidential settlement figures with public AI",
         "Using AI on sealed court documents or in camera materials"
-    ],
-    best_practices=[
+    ),
+    best_practices=(
         "Use find/replace to anonymise before prompting: 'Client A' instead of actual names",
         "Use enterprise tools with BAA/data processing agreements",
         "Create sanitised fact patterns that preserve issues but remove identifiers",
         "Maintain 'do not input' lists for highly sensitive matters",
         "Use temporary chat modes where available",
         "Regularly delete AI conversation histories"
-    ],
-    examples=[
-        {
-            "situation": "Attorney inputs 'Advise if ABC Pty Ltd can sue XYZ Inc for R5m breach'",
-            "issue": "Identified parties and amount - privilege potentially waived",
-            "resolution": "Use: 'Advise if Company A can sue Company B for significant breach'"
-        },
-        {
-            "situation": "Using enterprise AI with data processing agreement for contract review",
-            "issue": "None if proper agreements in place",
-            "resolution": "Confirm DPA covers AI use; document compliance"
-        }
-    ],
+    ),
+    examples=(
+        Example(
+            situation="Attorney inputs 'Advise if ABC Pty Ltd can sue XYZ Inc for R5m breach'",
+            issue="Identified parties and amount - privilege potentially waived",
+            resolution="Use: 'Advise if Company A can sue Company B for significant breach'"
+        ),
+        Example(
+            situation="Using enterprise AI with data processing agreement for contract review",
+            issue="None if proper agreements in place",
+            resolution="Confirm DPA covers AI use; document compliance"
+        )
+    ),
     prompt_guidance="""
 BEFORE PROMPTING - ANONYMISATION CHECKLIST:
 □ Remove all client names → Use "Client", "Company A", "Applicant"
@@ -181,40 +189,40 @@ Act and LPC Rules require practitioners to ensure work quality regardless of sou
 AI should be treated like a junior candidate attorney or law student - requiring 
 supervision and verification of all outputs.
     """,
-    requirements=[
+    requirements=(
         "Review all AI-generated content before use in legal work",
         "Apply same quality standards to AI output as human subordinate work",
         "Maintain decision-making authority - never defer judgment to AI",
         "Document AI assistance in file notes where appropriate",
         "Accept personal responsibility for all work product regardless of AI assistance",
         "Ensure junior practitioners understand AI supervision requirements"
-    ],
-    prohibited_practices=[
+    ),
+    prohibited_practices=(
         "Filing AI-generated documents without human review",
         "Delegating final legal judgment to AI",
         "Presenting AI output as own work without verification",
         "Allowing unsupervised AI use by junior practitioners",
         "Blaming AI for errors in work product"
-    ],
-    best_practices=[
+    ),
+    best_practices=(
         "Implement multi-stage review: AI draft → practitioner review → senior review",
         "Create checklists for AI output verification",
         "Treat AI like a 'first-year associate' requiring significant guidance",
         "Document AI assistance in internal file notes",
         "Establish firm-wide AI supervision protocols"
-    ],
-    examples=[
-        {
-            "situation": "Attorney submits AI-drafted affidavit without reading it; contains false statements",
-            "issue": "Failure to supervise; breach of candour to court",
-            "resolution": "Review every line before filing; verify all factual statements"
-        },
-        {
-            "situation": "Senior Counsel reviews AI-drafted heads of argument, rewrites 40%, approves final version",
-            "issue": "None - appropriate supervision exercised",
-            "resolution": "Proper supervision process followed"
-        }
-    ],
+    ),
+    examples=(
+        Example(
+            situation="Attorney submits AI-drafted affidavit without reading it; contains false statements",
+            issue="Failure to supervise; breach of candour to court",
+            resolution="Review every line before filing; verify all factual statements"
+        ),
+        Example(
+            situation="Senior Counsel reviews AI-drafted heads of argument, rewrites 40%, approves final version",
+            issue="None - appropriate supervision exercised",
+            resolution="Proper supervision process followed"
+        )
+    ),
     prompt_guidance="""
 SUPERVISION FRAMEWORK FOR AI OUTPUTS:
 
@@ -259,38 +267,38 @@ practitioners should anticipate developments similar to US courts (standing orde
 requiring AI certification). Proactive disclosure to clients demonstrates professional 
 integrity and aligns with SA legal profession's ethical foundations.
     """,
-    requirements=[
+    requirements=(
         "Disclose AI use to clients during engagement where material to representation",
         "Comply with any court orders requiring AI disclosure in filings",
         "Be truthful if directly asked about AI use by court or opposing counsel",
         "Update engagement letters to address AI tool usage",
         "Maintain records of AI use for potential disclosure requirements"
-    ],
-    prohibited_practices=[
+    ),
+    prohibited_practices=(
         "Lying about AI use when directly asked by the court",
         "Misrepresenting AI-generated content as solely human-authored when disclosure required",
         "Ignoring court standing orders on AI certification",
         "Concealing material AI involvement from clients who express concerns"
-    ],
-    best_practices=[
+    ),
+    best_practices=(
         "Include AI disclosure clause in standard engagement letters",
         "Discuss AI use during initial client consultation",
         "Monitor court practice directives for AI disclosure requirements",
         "Proactively disclose AI assistance in sensitive matters",
         "Create standard disclosure language for various contexts"
-    ],
-    examples=[
-        {
-            "situation": "Client asks 'Will you be using AI on my matter?'",
-            "issue": "Disclosure obligation triggered by direct question",
-            "resolution": "Honest answer about AI assistance, supervision process, and safeguards"
-        },
-        {
-            "situation": "Court issues practice directive requiring AI certification in pleadings",
-            "issue": "Mandatory disclosure compliance",
-            "resolution": "Include required certification; maintain records of AI use for matter"
-        }
-    ],
+    ),
+    examples=(
+        Example(
+            situation="Client asks 'Will you be using AI on my matter?'",
+            issue="Disclosure obligation triggered by direct question",
+            resolution="Honest answer about AI assistance, supervision process, and safeguards"
+        ),
+        Example(
+            situation="Court issues practice directive requiring AI certification in pleadings",
+            issue="Mandatory disclosure compliance",
+            resolution="Include required certification; maintain records of AI use for matter"
+        )
+    ),
     prompt_guidance="""
 SAMPLE CLIENT DISCLOSURE LANGUAGE:
 
@@ -328,38 +336,38 @@ of reasonable fees apply to AI-assisted work. When AI significantly reduces time
 practitioners should consider value-based billing or reduced time billing rather than 
 billing at rates that would have applied to fully manual work.
     """,
-    requirements=[
+    requirements=(
         "Bill only for actual time spent on AI-assisted work, not 'saved' time",
         "Disclose AI-related costs or efficiencies in fee discussions",
         "Ensure fees remain reasonable despite AI efficiency",
         "Consider value-based billing models where appropriate",
         "Do not charge separately for AI tool costs unless disclosed and agreed"
-    ],
-    prohibited_practices=[
+    ),
+    prohibited_practices=(
         "Billing full manual hours for work completed quickly with AI",
         "Hidden charges for AI tool subscriptions without disclosure",
         "Inflating time estimates knowing AI will accelerate work",
         "Double-billing for AI research plus manual verification where minimal"
-    ],
-    best_practices=[
+    ),
+    best_practices=(
         "Adopt value-based or fixed-fee billing where AI provides efficiency",
         "Disclose AI efficiency when providing estimates",
         "Share AI savings with clients through reduced fees",
         "Clearly separate AI tool costs from professional fees",
         "Review billing practices regularly as AI capabilities evolve"
-    ],
-    examples=[
-        {
-            "situation": "Research that previously took 4 hours completed in 30 minutes with AI",
-            "issue": "Cannot bill 4 hours; must reflect actual time",
-            "resolution": "Bill actual verification and analysis time; consider value-based fee"
-        },
-        {
-            "situation": "AI drafts contract in 10 minutes; 2 hours spent reviewing/editing",
-            "issue": "Billing should reflect value delivered plus actual time",
-            "resolution": "Bill 2+ hours for review/editing; disclose AI assistance in drafting"
-        }
-    ],
+    ),
+    examples=(
+        Example(
+            situation="Research that previously took 4 hours completed in 30 minutes with AI",
+            issue="Cannot bill 4 hours; must reflect actual time",
+            resolution="Bill actual verification and analysis time; consider value-based fee"
+        ),
+        Example(
+            situation="AI drafts contract in 10 minutes; 2 hours spent reviewing/editing",
+            issue="Billing should reflect value delivered plus actual time",
+            resolution="Bill 2+ hours for review/editing; disclose AI assistance in drafting"
+        )
+    ),
     prompt_guidance="""
 BILLING CONSIDERATIONS FOR AI-ASSISTED WORK:
 
@@ -400,38 +408,38 @@ judgments could result in:
 - Potential negligence claims from clients
 SAFLII provides free access for verification of SA case law.
     """,
-    requirements=[
+    requirements=(
         "Verify every case citation on SAFLII or official law reports before use",
         "Check that quoted passages accurately reflect judgment text",
         "Confirm legislation references are current and correctly cited",
         "Verify procedural rules and practice directives cited",
         "Cross-check AI's characterisation of case holdings against source"
-    ],
-    prohibited_practices=[
+    ),
+    prohibited_practices=(
         "Filing documents with unverified AI-generated citations",
         "Relying on AI's summary of a case without reading the judgment",
         "Citing cases based on AI description without source verification",
         "Using AI-generated citations in oral argument without verification"
-    ],
-    best_practices=[
+    ),
+    best_practices=(
         "Create verification checklist for all AI-assisted research",
         "Use SAFLII noteup function to check case currency",
         "Read at least the relevant paragraphs of any cited judgment",
         "Cross-reference with Juta or LexisNexis for confirmation",
         "Maintain citation verification log for file notes"
-    ],
-    examples=[
-        {
-            "situation": "AI cites 'Minister of Justice v Ntuli [2019] ZACC 12' - case does not exist",
-            "issue": "Hallucinated citation - would embarrass practitioner and potentially attract sanctions",
-            "resolution": "Verify all citations on SAFLII before use; reject unverifiable cases"
-        },
-        {
-            "situation": "AI accurately cites case but mischaracterises the ratio",
-            "issue": "Reading AI summary is insufficient; misrepresentation to court",
-            "resolution": "Read actual judgment; verify AI's characterisation of holding"
-        }
-    ],
+    ),
+    examples=(
+        Example(
+            situation="AI cites 'Minister of Justice v Ntuli [2019] ZACC 12' - case does not exist",
+            issue="Hallucinated citation - would embarrass practitioner and potentially attract sanctions",
+            resolution="Verify all citations on SAFLII before use; reject unverifiable cases"
+        ),
+        Example(
+            situation="AI accurately cites case but mischaracterises the ratio",
+            issue="Reading AI summary is insufficient; misrepresentation to court",
+            resolution="Read actual judgment; verify AI's characterisation of holding"
+        )
+    ),
     prompt_guidance="""
 VERIFICATION PROTOCOL:
 
@@ -473,38 +481,38 @@ trained on historical legal materials may perpetuate past discrimination or refl
 foreign legal biases inappropriate for SA's transformative constitutional framework.
 Practitioners must apply ubuntu and transformative constitutionalism lens.
     """,
-    requirements=[
+    requirements=(
         "Screen AI outputs for racial, gender, or other inappropriate bias",
         "Apply SA constitutional values (dignity, equality, ubuntu) as filter",
         "Recognise AI may not reflect transformative constitutionalism principles",
         "Correct AI suggestions that perpetuate historical discrimination",
         "Consider diversity and inclusion in AI tool selection"
-    ],
-    prohibited_practices=[
+    ),
+    prohibited_practices=(
         "Accepting AI recommendations that perpetuate discrimination",
         "Using AI to inform decisions on protected grounds without scrutiny",
         "Ignoring bias indicators in AI outputs",
         "Applying foreign legal norms uncritically in SA context"
-    ],
-    best_practices=[
+    ),
+    best_practices=(
         "Apply 'ubuntu lens' to all AI outputs",
         "Cross-check AI outputs against Constitutional Court jurisprudence",
         "Consult diverse perspectives when AI outputs seem problematic",
         "Report biased outputs to AI providers for improvement",
         "Train team on recognising AI bias"
-    ],
-    examples=[
-        {
-            "situation": "AI suggests creditworthiness factors that correlate with race (e.g., zip codes)",
-            "issue": "Indirect discrimination; unconstitutional approach",
-            "resolution": "Use objective criteria; apply equality analysis; reject proxy discrimination"
-        },
-        {
-            "situation": "AI applies US legal concepts that don't align with SA transformative constitutionalism",
-            "issue": "Inappropriate foreign law influence",
-            "resolution": "Redirect to SA Constitutional Court jurisprudence; apply local values"
-        }
-    ],
+    ),
+    examples=(
+        Example(
+            situation="AI suggests creditworthiness factors that correlate with race (e.g., zip codes)",
+            issue="Indirect discrimination; unconstitutional approach",
+            resolution="Use objective criteria; apply equality analysis; reject proxy discrimination"
+        ),
+        Example(
+            situation="AI applies US legal concepts that don't align with SA transformative constitutionalism",
+            issue="Inappropriate foreign law influence",
+            resolution="Redirect to SA Constitutional Court jurisprudence; apply local values"
+        )
+    ),
     prompt_guidance="""
 BIAS SCREENING FRAMEWORK:
 
@@ -542,103 +550,104 @@ BIAS SCREENING FRAMEWORK:
 # AI USE SCENARIOS WITH RISK ASSESSMENT
 # ═══════════════════════════════════════════════════════════════════════════════
 
-AI_USE_SCENARIOS: List[AIUseScenario] = [
+AI_USE_SCENARIOS: Tuple[AIUseScenario, ...] = (
     AIUseScenario(
         scenario="Legal Research - General Principles",
         risk_level=RiskLevel.LOW,
-        safeguards_required=[
+        safeguards_required=(
             "Verify all citations on SAFLII",
             "Read actual judgments, not just AI summaries",
             "Cross-reference with authoritative sources"
-        ],
+        ),
         recommended_approach="Use AI for initial research; verify and expand using SAFLII, Juta, LexisNexis",
-        prohibited_uses=["Filing research memos with unverified citations"]
+        prohibited_uses=("Filing research memos with unverified citations",)
     ),
     AIUseScenario(
         scenario="Document Drafting - First Drafts",
         risk_level=RiskLevel.LOW,
-        safeguards_required=[
+        safeguards_required=(
             "Thorough review and editing of all drafts",
             "Verify factual accuracy",
             "Ensure compliance with specific requirements",
             "Anonymise any factual context used in prompts"
-        ],
+        ),
         recommended_approach="Use AI for initial draft; extensively review, edit, and personalise",
-        prohibited_uses=["Filing AI drafts without review"]
+        prohibited_uses=("Filing AI drafts without review",)
     ),
     AIUseScenario(
         scenario="Contract Analysis - Clause Identification",
         risk_level=RiskLevel.MEDIUM,
-        safeguards_required=[
+        safeguards_required=(
             "Anonymise contract parties before input",
             "Do not input highly sensitive commercial terms",
             "Verify AI's clause identification against actual document",
             "Apply human judgment to risk assessment"
-        ],
+        ),
         recommended_approach="Use for issue-spotting; verify findings; apply professional judgment",
-        prohibited_uses=["Inputting identified parties or specific deal terms into public AI"]
+        prohibited_uses=("Inputting identified parties or specific deal terms into public AI",)
     ),
     AIUseScenario(
         scenario="Case Outcome Prediction",
         risk_level=RiskLevel.HIGH,
-        safeguards_required=[
+        safeguards_required=(
             "Never rely solely on AI predictions",
             "Provide multiple caveats to client",
             "Apply professional judgment and experience",
             "Document basis for any predictions given"
-        ],
+        ),
         recommended_approach="Use only as one input among many; extensive human analysis required",
-        prohibited_uses=["Giving clients AI predictions as legal advice"]
+        prohibited_uses=("Giving clients AI predictions as legal advice",)
     ),
     AIUseScenario(
         scenario="Privileged Document Analysis",
         risk_level=RiskLevel.HIGH,
-        safeguards_required=[
+        safeguards_required=(
             "Use only enterprise AI with strict data agreements",
             "Never use public AI for privileged materials",
             "Anonymise all identifiers",
             "Obtain client consent if any risk"
-        ],
+        ),
         recommended_approach="Enterprise tools only; thorough anonymisation; documented consent",
-        prohibited_uses=["Any public AI use with privileged documents"]
+        prohibited_uses=("Any public AI use with privileged documents",)
     ),
     AIUseScenario(
         scenario="Settlement Negotiations Strategy",
         risk_level=RiskLevel.HIGH,
-        safeguards_required=[
+        safeguards_required=(
             "Complete anonymisation of parties and amounts",
             "No disclosure of actual negotiation positions",
             "Enterprise tools preferred"
-        ],
+        ),
         recommended_approach="General strategic advice only; no specific case details",
-        prohibited_uses=["Inputting actual offers, counteroffers, or strategy into public AI"]
+        prohibited_uses=("Inputting actual offers, counteroffers, or strategy into public AI",)
     ),
     AIUseScenario(
         scenario="Client Intake and Matter Assessment",
         risk_level=RiskLevel.PROHIBITED,
-        safeguards_required=["Do not use AI for this purpose with identified client information"],
+        safeguards_required=("Do not use AI for this purpose with identified client information",),
         recommended_approach="Conduct intake manually; anonymise before any AI consultation",
-        prohibited_uses=["Inputting prospective client's confidential disclosures into AI"]
+        prohibited_uses=("Inputting prospective client's confidential disclosures into AI",)
     ),
     AIUseScenario(
         scenario="Criminal Defence Strategy",
         risk_level=RiskLevel.HIGH,
-        safeguards_required=[
+        safeguards_required=(
             "Extreme anonymisation required",
             "No identifying facts",
             "Enterprise tools only",
             "Heightened privilege concerns"
-        ],
+        ),
         recommended_approach="General legal research only; no case-specific analysis via AI",
-        prohibited_uses=["Any identified or identifiable case details in AI prompts"]
+        prohibited_uses=("Any identified or identifiable case details in AI prompts",)
     )
-]
+)
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # COMPREHENSIVE ETHICS COLLECTION
 # ═══════════════════════════════════════════════════════════════════════════════
 
-ALL_GUIDELINES: Dict[str, EthicalGuideline] = {
+# Read-only view: callers share the registry without defensive copies
+ALL_GUIDELINES: Mapping[str, EthicalGuideline] = MappingProxyType({
     "competence": COMPETENCE_GUIDELINE,
     "confidentiality": CONFIDENTIALITY_GUIDELINE,
     "supervision": SUPERVISION_GUIDELINE,
@@ -646,12 +655,50 @@ ALL_GUIDELINES: Dict[str, EthicalGuideline] = {
     "billing": BILLING_GUIDELINE,
     "verification": VERIFICATION_GUIDELINE,
     "bias": BIAS_GUIDELINE,
-}
+})
+
+# UI selector labels -> ALL_GUIDELINES keys (built once at import)
+GUIDELINE_OPTIONS: Dict[str, str] = {g.title: key for key, g in ALL_GUIDELINES.items()}
+N_GUIDELINES: int = len(ALL_GUIDELINES)
+
+# Scenario name -> AIUseScenario, for selectors that pick a scenario by name
+AI_USE_SCENARIOS_BY_NAME: Dict[str, AIUseScenario] = {s.scenario: s for s in AI_USE_SCENARIOS}
+
+def _index_by_category() -> Dict[EthicsCategory, Tuple[EthicalGuideline, ...]]:
+    """Group guidelines by category in one pass, preserving registry order"""
+    groups: Dict[EthicsCategory, List[EthicalGuideline]] = {}
+    for g in ALL_GUIDELINES.values():
+        groups.setdefault(g.category, []).append(g)
+    return {category: tuple(guidelines) for category, guidelines in groups.items()}
+
+def _index_by_risk() -> Dict[RiskLevel, Tuple[AIUseScenario, ...]]:
+    """Group scenarios by risk level in one pass, preserving registry order"""
+    groups: Dict[RiskLevel, List[AIUseScenario]] = {}
+    for s in AI_USE_SCENARIOS:
+        groups.setdefault(s.risk_level, []).append(s)
+    return {level: tuple(scenarios) for level, scenarios in groups.items()}
+
+GUIDELINES_BY_CATEGORY: Dict[EthicsCategory, Tuple[EthicalGuideline, ...]] = _index_by_category()
+SCENARIOS_BY_RISK: Dict[RiskLevel, Tuple[AIUseScenario, ...]] = _index_by_risk()
 
 def get_guidelines_by_category(category: EthicsCategory) -> List[EthicalGuideline]:
     """Get all guidelines in a specific category"""
-    return [g for g in ALL_GUIDELINES.values() if g.category == category]
-
+    return list(GUIDELINES_BY_CATEGORY.get(category, ()))
+
+def get_guidelines_by_categories(
+    categories: Iterable[EthicsCategory],
+) -> Dict[EthicsCategory, List[EthicalGuideline]]:
+    """Get guidelines for several categories at once, keyed in request order"""
+    return {
+        category: list(GUIDELINES_BY_CATEGORY.get(category, ()))
+        for category in dict.fromkeys(categories)
+    }
+
+def get_scenarios_by_risk(level: RiskLevel) -> List[AIUseScenario]:
+    """Get all AI use scenarios at a specific risk level"""
+    return list(SCENARIOS_BY_RISK.get(level, ()))
+
+@lru_cache(maxsize=128)
 def assess_ai_use_risk(scenario_type: str) -> Optional[AIUseScenario]:
     """Find risk assessment for a given scenario type"""
     for scenario in AI_USE_SCENARIOS:
@@ -664,7 +711,7 @@ def generate_ethics_checklist(guideline: EthicalGuideline) -> str:
     checklist = f"""
 # AI Use Ethics Checklist: {guideline.title}
 
-## Category: {guideline.category.value}
+## Category: {guideline.category}
 
 ## LPC Reference: {guideline.lpc_rule_reference or 'N/A'}
 
@@ -682,6 +729,11 @@ def generate_ethics_checklist(guideline: EthicalGuideline) -> str:
 """
     return checklist
 
+@lru_cache(maxsize=None)
+def get_ethics_checklist(guideline_key: str) -> str:
+    """Cached checklist for an ALL_GUIDELINES key"""
+    return generate_ethics_checklist(ALL_GUIDELINES[guideline_key])
+
 def generate_comprehensive_ethics_prompt() -> str:
     """Generate a comprehensive ethics-aware prompt prefix"""
     return """
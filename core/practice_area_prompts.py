@@ -3,11 +3,11 @@
 Specialized Prompt Templates for Each South African Legal Practice Area
 """
 
-from dataclasses import dataclass, field
-from enum import Enum
-from typing import List, Dict, Optional
+from dataclasses import dataclass
+from enum import Enum, StrEnum
+from typing import List, Dict, Optional, Tuple
 
-class PracticeArea(Enum):
+class PracticeArea(StrEnum):
     """South African Legal Practice Areas"""
     CONSTITUTIONAL = "Constitutional Law"
     CRIMINAL = "Criminal Law"
@@ -745,6 +745,14 @@ ALL_PRACTICE_PROMPTS: Dict[str, PracticeAreaPrompt] = {
     "tax_dispute": TAX_DISPUTE_ANALYSIS,
 }
 
+# UI selector labels -> ALL_PRACTICE_PROMPTS keys (built once at import)
+PRACTICE_PROMPT_OPTIONS: Dict[str, str] = {p.title: key for key, p in ALL_PRACTICE_PROMPTS.items()}
+N_PRACTICE_PROMPTS: int = len(ALL_PRACTICE_PROMPTS)
+# Selector labels in display order
+PRACTICE_PROMPT_LABELS: Tuple[str, ...] = tuple(sorted(PRACTICE_PROMPT_OPTIONS))
+# Category filter labels (only categories that have entries), sorted
+PRACTICE_AREA_LABELS: Tuple[str, ...] = tuple(sorted({p.practice_area.value for p in ALL_PRACTICE_PROMPTS.values()}))
+
 def get_prompts_by_area(area: PracticeArea) -> List[PracticeAreaPrompt]:
     """Get all prompts for a specific practice area"""
     return [p for p in ALL_PRACTICE_PROMPTS.values() if p.practice_area == area]
@@ -22,11 +22,12 @@ Service Pack 2 Features:
 - Quick prompt templates
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import Enum
 from typing import List, Dict, Optional, Tuple
 import datetime
 import json
+import re
 
 
 class OptimizationMode(Enum):
@@ -52,6 +53,8 @@ class OptimizationMode(Enum):
     SPO_SELF_PLAY = "SPO (Self-Play Optimization)"
     GUIDED_COMPLETE = "Guided Step-by-Step"
 
+N_OPTIMIZATION_MODES: int = len(OptimizationMode)
+
 
 class LegalOutputFormat(Enum):
     """SA Legal output format types"""
@@ -333,6 +336,19 @@ def get_preset_configuration(preset: PracticeAreaPreset) -> PresetConfiguration:
     return PRACTICE_PRESETS.get(preset, PRACTICE_PRESETS[PracticeAreaPreset.LITIGATION])
 
 
+# Detection keywords per preset, split and lower-cased once at import:
+# (preset, context hints, first three words of each key Act, first word of each key case)
+PRACTICE_DETECTION_KEYWORDS: Tuple[Tuple[PracticeAreaPreset, Tuple[str, ...], Tuple[Tuple[str, ...], ...], Tuple[str, ...]], ...] = tuple(
+    (
+        preset,
+        tuple(config.context_hints),
+        tuple(tuple(word.lower() for word in leg.split()[:3]) for leg in config.key_legislation),
+        tuple(case.split()[0].lower() for case in config.key_cases),
+    )
+    for preset, config in PRACTICE_PRESETS.items()
+)
+
+
 def detect_practice_area(context: str) -> Tuple[PracticeAreaPreset, float]:
     """
     Auto-detect practice area from context text.
@@ -341,21 +357,20 @@ def detect_practice_area(context: str) -> Tuple[PracticeAreaPreset, float]:
     context_lower = context.lower()
     scores: Dict[PracticeAreaPreset, float] = {}
     
-    for preset, config in PRACTICE_PRESETS.items():
+    for preset, hints, legislation_words, case_names in PRACTICE_DETECTION_KEYWORDS:
         score = 0.0
         # Check for hint words
-        for hint in config.context_hints:
+        for hint in hints:
             if hint in context_lower:
                 score += 0.15
         
         # Check for legislation mentions
-        for leg in config.key_legislation:
-            if any(word.lower() in context_lower for word in leg.split()[:3]):
+        for words in legislation_words:
+            if any(word in context_lower for word in words):
                 score += 0.1
         
         # Check for case mentions
-        for case in config.key_cases:
-            case_name = case.split()[0].lower()
+        for case_name in case_names:
             if case_name in context_lower:
                 score += 0.2
         
@@ -2390,6 +2405,25 @@ class QualityScoreDetails:
     strengths: List[str]
 
 
+# Scoring tables, built once at import rather than on every call
+ACTION_VERBS: Tuple[str, ...] = ('analyse', 'analyze', 'draft', 'review', 'advise', 'research', 'compare', 'identify')
+LEGAL_REFERENCE_TERMS: Tuple[str, ...] = ('act', 'section', 'regulation', 'rule')
+SA_CONTEXT_INDICATORS: Tuple[Tuple[str, int], ...] = (
+    ('saflii', 5),
+    ('constitutional court', 5),
+    ('supreme court of appeal', 4),
+    ('sca', 3),
+    ('high court', 3),
+    ('labour court', 3),
+    ('ccma', 3),
+    ('ubuntu', 4),
+    ('constitution', 4),
+    ('bill of rights', 4),
+    ('section 36', 4),
+    ('transformative', 3),
+)
+
+
 def calculate_detailed_quality_score(
     prompt: str,
     components: Dict[str, str]
@@ -2416,8 +2450,7 @@ def calculate_detailed_quality_score(
     
     # Check for clear action verbs
     task_text = components.get('task', '').lower()
-    action_verbs = ['analyse', 'analyze', 'draft', 'review', 'advise', 'research', 'compare', 'identify']
-    if any(verb in task_text for verb in action_verbs):
+    if any(verb in task_text for verb in ACTION_VERBS):
         clarity_score += 10
         strengths.append("Uses clear action verbs")
     else:
@@ -2428,7 +2461,7 @@ def calculate_detailed_quality_score(
     
     # Check for specific legal references
     prompt_lower = prompt.lower()
-    if any(word in prompt_lower for word in ['act', 'section', 'regulation', 'rule']):
+    if any(word in prompt_lower for word in LEGAL_REFERENCE_TERMS):
         specificity_score += 8
         strengths.append("References specific legislation")
     else:
@@ -2454,22 +2487,7 @@ def calculate_detailed_quality_score(
     # SA Context Score (0-25): SA legal system integration
     sa_context_score = 0.0
     
-    sa_indicators = {
-        'saflii': 5,
-        'constitutional court': 5,
-        'supreme court of appeal': 4,
-        'sca': 3,
-        'high court': 3,
-        'labour court': 3,
-        'ccma': 3,
-        'ubuntu': 4,
-        'constitution': 4,
-        'bill of rights': 4,
-        'section 36': 4,
-        'transformative': 3
-    }
-    
-    for indicator, points in sa_indicators.items():
+    for indicator, points in SA_CONTEXT_INDICATORS:
         if indicator in prompt_lower:
             sa_context_score += points
     
@@ -2788,6 +2806,7 @@ QUICK_TEMPLATES: List[QuickTemplate] = [
         popularity=89
     )
 ]
+N_QUICK_TEMPLATES: int = len(QUICK_TEMPLATES)
 
 
 def get_quick_templates() -> List[QuickTemplate]:
@@ -2812,6 +2831,12 @@ def get_templates_by_category(category: str) -> List[QuickTemplate]:
 # PROMPT QUALITY SCORING (NEW SP1)
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# Any year from 1990 to 2029 appearing in the prompt (a likely Act year).
+# [0-9] rather than \d, which would also match non-ASCII digits.
+ACT_YEAR_PATTERN = re.compile(r"199[0-9]|20[0-2][0-9]")
+SA_COURT_TERMS: Tuple[str, ...] = ('constitutional court', 'sca', 'high court', 'labour court')
+
+
 def calculate_prompt_quality_score(prompt: str, components: Dict[str, str]) -> Tuple[float, List[str]]:
     """
     Calculate a quality score for a prompt and return improvement suggestions.
@@ -2875,9 +2900,9 @@ def calculate_prompt_quality_score(prompt: str, components: Dict[str, str]) -> T
         sa_elements += 3
     if 'ubuntu' in prompt_lower:
         sa_elements += 3
-    if 'act' in prompt_lower and any(str(year) in prompt for year in range(1990, 2030)):
+    if 'act' in prompt_lower and ACT_YEAR_PATTERN.search(prompt):
         sa_elements += 3
-    if any(court in prompt_lower for court in ['constitutional court', 'sca', 'high court', 'labour court']):
+    if any(court in prompt_lower for court in SA_COURT_TERMS):
         sa_elements += 3
     
     score += min(sa_elements, 15)
@@ -2893,6 +2918,11 @@ def estimate_token_count(text: str) -> int:
     return len(text) // 4
 
 
+def estimate_token_counts(texts: List[str]) -> List[int]:
+    """Token estimates for a batch of texts in one pass (same heuristic as estimate_token_count)"""
+    return [len(text) // 4 for text in texts]
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # MAIN OPTIMIZATION FUNCTION
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -3244,6 +3274,7 @@ def _get_mode_description(mode: OptimizationMode) -> str:
 __all__ = [
     # Enums
     'OptimizationMode',
+    'N_OPTIMIZATION_MODES',
     'LegalOutputFormat', 
     'PracticeAreaPreset',
     # Data classes
@@ -3253,6 +3284,7 @@ __all__ = [
     'BatchResult',
     'QualityScoreDetails',
     'QuickTemplate',
+    'N_QUICK_TEMPLATES',
     'GuidedOptimizationResult',
     # Main functions
     'optimize_legal_prompt',
@@ -3292,5 +3324,6 @@ __all__ = [
     'get_preset_configuration',
     'detect_practice_area',
     'calculate_prompt_quality_score',
-    'estimate_token_count'
+    'estimate_token_count',
+    'estimate_token_counts'
 ]
@@ -3,9 +3,9 @@
 Comprehensive Reference for Key South African Legislation with Prompting Guidance
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import Enum
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 
 class LegislationCategory(Enum):
     """Categories of SA Legislation"""
@@ -776,6 +776,14 @@ ALL_LEGISLATION: Dict[str, SALegislation] = {
     "CPA": CONSUMER_PROTECTION_ACT,
 }
 
+# UI selector labels -> ALL_LEGISLATION keys (built once at import)
+LEGISLATION_OPTIONS: Dict[str, str] = {
+    f"{leg.short_title} ({leg.act_number})": key for key, leg in ALL_LEGISLATION.items()
+}
+N_LEGISLATION: int = len(ALL_LEGISLATION)
+# Selector labels in display order
+LEGISLATION_LABELS: Tuple[str, ...] = tuple(sorted(LEGISLATION_OPTIONS))
+
 def get_legislation_by_category(category: LegislationCategory) -> List[SALegislation]:
     """Get all legislation in a specific category"""
     return [leg for leg in ALL_LEGISLATION.values() if leg.category == category]
@@ -3,9 +3,9 @@
 Comprehensive Database of South African Specialist Courts, Tribunals, and Forums
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import Enum
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 
 class CourtCategory(Enum):
     """Categories of SA Courts and Tribunals"""
@@ -901,6 +901,14 @@ ALL_SPECIALIST_COURTS: Dict[str, SpecialistCourt] = {
     "Circuit": CIRCUIT_COURT,
 }
 
+# UI selector labels -> ALL_SPECIALIST_COURTS keys (built once at import)
+COURT_OPTIONS: Dict[str, str] = {
+    f"{c.name} ({c.saflii_code})": key for key, c in ALL_SPECIALIST_COURTS.items()
+}
+N_COURTS: int = len(ALL_SPECIALIST_COURTS)
+# Category filter labels (only categories that have entries), sorted
+COURT_CATEGORY_LABELS: Tuple[str, ...] = tuple(sorted({court.category.value for court in ALL_SPECIALIST_COURTS.values()}))
+
 def get_courts_by_category(category: CourtCategory) -> List[SpecialistCourt]:
     """Get all courts in a specific category"""
     return [c for c in ALL_SPECIALIST_COURTS.values() if c.category == category]
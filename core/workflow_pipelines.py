@@ -3,9 +3,9 @@
 Multi-Step Legal Workflows with AI-Assisted Prompting for South African Practice
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import Enum
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 
 class WorkflowCategory(Enum):
     """Categories of Legal Workflows"""
@@ -60,6 +60,11 @@ class LegalWorkflow:
     total_estimated_time: str
     complexity: str
 
+    @property
+    def n_steps(self) -> int:
+        """Number of steps in the pipeline"""
+        return len(self.steps)
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # CONTRACT REVIEW WORKFLOW
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -1292,6 +1297,14 @@ ALL_WORKFLOWS: Dict[str, LegalWorkflow] = {
     "due_diligence": DUE_DILIGENCE_WORKFLOW,
 }
 
+# UI selector labels -> ALL_WORKFLOWS keys (built once at import)
+WORKFLOW_OPTIONS: Dict[str, str] = {w.title: key for key, w in ALL_WORKFLOWS.items()}
+N_WORKFLOWS: int = len(ALL_WORKFLOWS)
+# Selector labels in display order
+WORKFLOW_LABELS: Tuple[str, ...] = tuple(sorted(WORKFLOW_OPTIONS))
+# Category filter labels (only categories that have entries), sorted
+WORKFLOW_CATEGORY_LABELS: Tuple[str, ...] = tuple(sorted({w.category.value for w in ALL_WORKFLOWS.values()}))
+
 def get_workflows_by_category(category: WorkflowCategory) -> List[LegalWorkflow]:
     """Get all workflows for a specific category"""
     return [w for w in ALL_WORKFLOWS.values() if w.category == category]
@@ -28,8 +28,9 @@ import streamlit as st
 import json
 import datetime
 import requests
-from typing import Optional, List, Dict, Tuple, Any, Union
+from typing import Optional, List, Dict, Tuple, Any, Union, Sequence
 import hashlib
+import html
 import base64
 import re
 from collections import Counter
@@ -88,44 +89,70 @@ World-class AI prompting for South African legal professionals.
 
 from core.advanced_frameworks import (
     ALL_FRAMEWORKS, 
+    FRAMEWORK_OPTIONS,
+    FRAMEWORK_CATEGORY_LABELS,
+    FRAMEWORKS_BY_CATEGORY,
+    N_FRAMEWORKS,
     get_framework_by_acronym,
     generate_combined_prompt,
     FrameworkCategory
 )
 from core.specialist_courts import (
     ALL_SPECIALIST_COURTS,
+    COURT_OPTIONS,
+    COURT_CATEGORY_LABELS,
+    N_COURTS,
     generate_court_prompt_guidance,
     CourtCategory
 )
 from core.sa_legislation import (
     ALL_LEGISLATION,
+    LEGISLATION_OPTIONS,
+    LEGISLATION_LABELS,
+    N_LEGISLATION,
     generate_legislation_prompt,
     LegislationCategory
 )
 from core.legal_ethics import (
     ALL_GUIDELINES,
-    AI_USE_SCENARIOS,
+    GUIDELINE_OPTIONS,
+    N_GUIDELINES,
+    AI_USE_SCENARIOS_BY_NAME,
     assess_ai_use_risk,
     generate_ethics_checklist,
     RiskLevel
 )
 from core.practice_area_prompts import (
     ALL_PRACTICE_PROMPTS,
+    PRACTICE_PROMPT_OPTIONS,
+    PRACTICE_PROMPT_LABELS,
+    PRACTICE_AREA_LABELS,
+    N_PRACTICE_PROMPTS,
     generate_practice_prompt,
     PracticeArea
 )
 from core.document_templates import (
     ALL_DOCUMENT_TEMPLATES,
+    DOCUMENT_TEMPLATE_OPTIONS,
+    DOCUMENT_TEMPLATE_LABELS,
+    DOCUMENT_TEMPLATES_BY_CATEGORY,
+    DOCUMENT_CATEGORY_LABELS,
+    N_DOCUMENT_TEMPLATES,
     generate_document_prompt,
     DocumentCategory
 )
 from core.workflow_pipelines import (
     ALL_WORKFLOWS,
+    WORKFLOW_OPTIONS,
+    WORKFLOW_LABELS,
+    WORKFLOW_CATEGORY_LABELS,
+    N_WORKFLOWS,
     get_step_prompt,
     WorkflowCategory
 )
 from core.prompt_optimizer import (
     OptimizationMode,
+    N_OPTIMIZATION_MODES,
     LegalOutputFormat,
     PracticeAreaPreset,
     OptimizedPrompt,
@@ -165,6 +192,9 @@ def init_session_state():
         'session_start': datetime.datetime.now().isoformat(),
         'copied_prompt': None,
         'active_workflow_step': 0,
+        # Selected step per workflow key; kept outside the slider widgets, whose
+        # state Streamlit drops while their workflow is not displayed
+        'workflow_steps': {},
         'selected_framework': None,
         'selected_court': None,
         # v4.4.0 - Cerebras API Integration
@@ -228,1240 +258,1245 @@ init_session_state()
 # WORLD-CLASS CSS STYLING
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def inject_custom_css():
-    """Inject ultra-modern monochrome CSS styling with Quicksand font"""
-    st.markdown("""
-    <style>
-        /* ═══════════════════════════════════════════════════════════════════
-           GOOGLE FONTS - Quicksand only (no Material Icons - using CSS arrows)
-           ═══════════════════════════════════════════════════════════════════ */
-        @import url('https://fonts.googleapis.com/css2?family=Quicksand:wght@400;500;600;700&display=swap');
-        
-        /* ═══════════════════════════════════════════════════════════════════
-           ROOT VARIABLES - Ultra-Modern Monochrome Palette
-           ═══════════════════════════════════════════════════════════════════ */
-        :root {
-            /* Monochrome Palette */
-            --mono-black: #0a0a0a;
-            --mono-charcoal: #1a1a1a;
-            --mono-dark: #2d2d2d;
-            --mono-gray-700: #404040;
-            --mono-gray-600: #525252;
-            --mono-gray-500: #737373;
-            --mono-gray-400: #a3a3a3;
-            --mono-gray-300: #d4d4d4;
-            --mono-gray-200: #e5e5e5;
-            --mono-gray-100: #f5f5f5;
-            --mono-white: #fafafa;
-            --mono-pure-white: #ffffff;
-            
-            /* Accent - subtle warm gray for highlights */
-            --accent-warm: #e8e4e0;
-            --accent-cool: #e4e8ec;
-            
-            /* Gradients */
-            --gradient-primary: linear-gradient(135deg, #1a1a1a 0%, #2d2d2d 50%, #404040 100%);
-            --gradient-light: linear-gradient(135deg, #fafafa 0%, #f5f5f5 100%);
-            --gradient-dark: linear-gradient(180deg, #0a0a0a 0%, #1a1a1a 100%);
-            --gradient-subtle: linear-gradient(135deg, #ffffff 0%, #f5f5f5 100%);
-            --gradient-glass: linear-gradient(135deg, rgba(255,255,255,0.9) 0%, rgba(255,255,255,0.7) 100%);
-            
-            /* Shadows - refined */
-            --shadow-xs: 0 1px 2px rgba(0,0,0,0.04);
-            --shadow-sm: 0 2px 8px rgba(0,0,0,0.06);
-            --shadow-md: 0 4px 16px rgba(0,0,0,0.08);
-            --shadow-lg: 0 8px 32px rgba(0,0,0,0.12);
-            --shadow-xl: 0 16px 48px rgba(0,0,0,0.16);
-            --shadow-inner: inset 0 2px 4px rgba(0,0,0,0.04);
-            
-            /* Border radius - modern */
-            --radius-xs: 4px;
-            --radius-sm: 6px;
-            --radius-md: 10px;
-            --radius-lg: 14px;
-            --radius-xl: 18px;
-            --radius-2xl: 24px;
-            
-            /* Typography */
-            --font-primary: 'Quicksand', -apple-system, BlinkMacSystemFont, sans-serif;
-            --font-mono: 'SF Mono', 'Fira Code', 'Consolas', monospace;
-        }
-        
-        /* ═══════════════════════════════════════════════════════════════════
-           GLOBAL STYLES
-           ═══════════════════════════════════════════════════════════════════ */
-        * {
-            font-family: var(--font-primary) !important;
-        }
-        
-        .stApp {
-            background: var(--mono-white);
-            font-family: var(--font-primary);
-            color: var(--mono-charcoal);
-        }
-        
-        /* Main content area text should be dark */
-        .stApp .main .block-container,
-        .stApp .main .block-container p,
-        .stApp .main .block-container span,
-        .stApp .main .block-container div,
-        .stApp .main .block-container label {
-            color: var(--mono-charcoal);
-        }
-        
-        .stApp .main .block-container h1,
-        .stApp .main .block-container h2,
-        .stApp .main .block-container h3,
-        .stApp .main .block-container h4,
-        .stApp .main .block-container h5 {
-            color: var(--mono-black);
-        }
-        
-        /* Hide Streamlit branding for cleaner look */
-        #MainMenu {visibility: hidden;}
-        footer {visibility: hidden;}
-        header {visibility: hidden;}
-        
-        /* Typography baseline - compact sizing */
-        h1, h2, h3, h4, h5, h6, p, span, div, button, input, textarea, label {
-            font-family: var(--font-primary) !important;
-            font-weight: 500;
-        }
-        
-        h1 { font-weight: 700 !important; letter-spacing: -0.02em; font-size: 1.5rem !important; }
-        h2 { font-weight: 600 !important; letter-spacing: -0.01em; font-size: 1.2rem !important; }
-        h3 { font-weight: 600 !important; font-size: 1rem !important; }
-        h4 { font-weight: 600 !important; font-size: 0.9rem !important; }
-        
-        p, span, div, label { font-size: 0.85rem; }
-        
-        /* Compact metrics */
-        [data-testid="stMetric"] {
-            background: var(--mono-gray-100);
-            padding: 0.6rem 0.8rem !important;
-            border-radius: var(--radius-sm);
-        }
-        
-        [data-testid="stMetric"] label {
-            font-size: 0.7rem !important;
-        }
-        
-        [data-testid="stMetric"] [data-testid="stMetricValue"] {
-            font-size: 1.1rem !important;
-        }
-        
-        /* Compact expanders */
-        [data-testid="stExpander"] {
-            border: 1px solid var(--mono-gray-200) !important;
-            border-radius: var(--radius-sm) !important;
-            margin: 0.35rem 0 !important;
-        }
-        
-        [data-testid="stExpander"] summary {
-            padding: 0.5rem 0.75rem !important;
-            font-size: 0.85rem !important;
-        }
-        
-        [data-testid="stExpander"] [data-testid="stExpanderDetails"] {
-            padding: 0.5rem 0.75rem !important;
-        }
-        
-        /* ═══════════════════════════════════════════════════════════════════
-           HERO HEADER - Ultra Modern Monochrome
-           ═══════════════════════════════════════════════════════════════════ */
-        .hero-header {
-            background: var(--gradient-primary);
-            color: var(--mono-white);
-            padding: 1.5rem 2rem;
-            border-radius: var(--radius-2xl);
-            margin-bottom: 1.25rem;
-            box-shadow: var(--shadow-xl);
-            position: relative;
-            overflow: hidden;
-            border: 1px solid rgba(255,255,255,0.05);
-        }
-        
-        .hero-header::before {
-            content: '';
-            position: absolute;
-            top: 0;
-            right: 0;
-            width: 40%;
-            height: 100%;
-            background: linear-gradient(135deg, transparent 0%, rgba(255,255,255,0.03) 100%);
-            pointer-events: none;
-        }
-        
-        .hero-header::after {
-            content: '';
-            position: absolute;
-            bottom: -50%;
-            right: -25%;
-            width: 50%;
-            height: 100%;
-            background: radial-gradient(circle, rgba(255,255,255,0.02) 0%, transparent 70%);
-            pointer-events: none;
-        }
-        
-        .hero-header h1 {
-            margin: 0;
-            font-size: 1.6rem;
-            font-weight: 700;
-            letter-spacing: -0.03em;
-            position: relative;
-            z-index: 1;
-            color: var(--mono-pure-white);
-        }
-        
-        .hero-header .subtitle {
-            margin: 0.5rem 0 0 0;
-            font-size: 0.85rem;
-            opacity: 0.7;
-            font-weight: 400;
-            position: relative;
-            z-index: 1;
-            letter-spacing: 0.02em;
-        }
-        
-        .hero-logo {
-            height: 36px;
-            width: auto;
-            margin-bottom: 0.75rem;
-            filter: brightness(0) invert(1);
-            opacity: 0.95;
-        }
-        
-        /* ═══════════════════════════════════════════════════════════════════
-           STATS BADGES - Minimal & Clean
-           ═══════════════════════════════════════════════════════════════════ */
-        .stats-container {
-            display: flex;
-            flex-wrap: wrap;
-            gap: 0.4rem;
-            margin-top: 1rem;
-            position: relative;
-            z-index: 1;
-        }
-        
-        .stats-badge {
-            background: rgba(255,255,255,0.08);
-            backdrop-filter: blur(20px);
-            -webkit-backdrop-filter: blur(20px);
-            color: rgba(255,255,255,0.9);
-            padding: 0.35rem 0.75rem;
-            border-radius: 100px;
-            font-weight: 500;
-            font-size: 0.7rem;
-            display: inline-flex;
-            align-items: center;
-            gap: 0.3rem;
-            border: 1px solid rgba(255,255,255,0.1);
-            transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-        }
-        
-        .stats-badge:hover {
-            background: rgba(255,255,255,0.15);
-            transform: translateY(-1px);
-        }
-        
-        .stats-badge.gold {
-            background: rgba(255,255,255,0.95);
-            color: var(--mono-charcoal);
-            border-color: transparent;
-            font-weight: 600;
-        }
-        
-        /* ═══════════════════════════════════════════════════════════════════
-           SECTION CARDS - Modern Glass Effect
-           ═══════════════════════════════════════════════════════════════════ */
-        .section-card {
-            background: var(--mono-pure-white);
-            border-radius: var(--radius-lg);
-            padding: 1.25rem;
-            margin: 0.75rem 0;
-            box-shadow: var(--shadow-sm);
-            border: 1px solid var(--mono-gray-200);
-            transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-            position: relative;
-        }
-        
-        .section-card::before {
-            content: '';
-            position: absolute;
-            left: 0;
-            top: 0;
-            bottom: 0;
-            width: 3px;
-            background: var(--mono-charcoal);
-            border-radius: 3px 0 0 3px;
-        }
-        
-        .section-card:hover {
-            box-shadow: var(--shadow-md);
-            transform: translateY(-2px);
-            border-color: var(--mono-gray-300);
-        }
-        
-        .section-card.gold-accent::before {
-            background: var(--mono-gray-500);
-        }
-        
-        .section-card.red-accent::before {
-            background: var(--mono-gray-700);
-        }
-        
-        .section-card h3 {
-            color: var(--mono-charcoal);
-            margin: 0 0 0.35rem 0;
-            font-size: 1rem;
-            font-weight: 600;
-        }
-        
-        .section-card p {
-            color: var(--mono-gray-600);
-            margin: 0;
-            font-size: 0.85rem;
-            line-height: 1.5;
-        }
-        
-        /* ═══════════════════════════════════════════════════════════════════
-           PROMPT OUTPUT BOX - Elegant Code Display
-           ═══════════════════════════════════════════════════════════════════ */
-        .prompt-output {
-            background: var(--mono-gray-100);
-            border: 1px solid var(--mono-gray-200);
-            border-radius: var(--radius-lg);
-            padding: 1.25rem;
-            font-family: var(--font-mono);
-            font-size: 0.8rem;
-            line-height: 1.6;
-            white-space: pre-wrap;
-            max-height: 400px;
-            overflow-y: auto;
-            position: relative;
-            color: var(--mono-charcoal);
-        }
-        
-        .prompt-output::before {
-            content: '📋 Generated Prompt';
-            position: absolute;
-            top: -12px;
-            left: 20px;
-            background: var(--mono-white);
-            padding: 0 10px;
-            font-size: 0.7rem;
-            font-weight: 600;
-            color: var(--mono-gray-500);
-            font-family: var(--font-primary);
-            text-transform: uppercase;
-            letter-spacing: 0.05em;
-        }
-        
-        /* ═══════════════════════════════════════════════════════════════════
-           TAB STYLING - Ultra Clean
-           ═══════════════════════════════════════════════════════════════════ */
-        .stTabs [data-baseweb="tab-list"] {
-            gap: 3px;
-            background: var(--mono-gray-100);
-            padding: 0.35rem;
-            border-radius: var(--radius-xl);
-            border: 1px solid var(--mono-gray-200);
-        }
-        
-        .stTabs [data-baseweb="tab"] {
-            height: 38px;
-            padding: 0 14px;
-            background: transparent;
-            border-radius: var(--radius-md);
-            font-weight: 500;
-            font-size: 0.8rem;
-            color: var(--mono-gray-600);
-            transition: all 0.2s cubic-bezier(0.4, 0, 0.2, 1);
-            border: none;
-        }
-        
-        .stTabs [data-baseweb="tab"]:hover {
-            background: var(--mono-pure-white);
-            color: var(--mono-charcoal);
-        }
-        
-        .stTabs [aria-selected="true"] {
-            background: var(--mono-charcoal) !important;
-            color: var(--mono-pure-white) !important;
-            font-weight: 600;
-            box-shadow: var(--shadow-sm);
-        }
-        
-        /* ═══════════════════════════════════════════════════════════════════
-           SIDEBAR STYLING - Dark Sophisticated with White Text
-           ═══════════════════════════════════════════════════════════════════ */
-        [data-testid="stSidebar"] {
-            background: var(--gradient-dark);
-            border-right: 1px solid rgba(255,255,255,0.05);
-        }
-        
-        [data-testid="stSidebar"] .stMarkdown,
-        [data-testid="stSidebar"] .stMarkdown p,
-        [data-testid="stSidebar"] .stMarkdown span,
-        [data-testid="stSidebar"] .stMarkdown div,
-        [data-testid="stSidebar"] p,
-        [data-testid="stSidebar"] span,
-        [data-testid="stSidebar"] label,
-        [data-testid="stSidebar"] .stCaption,
-        [data-testid="stSidebar"] [data-testid="stCaptionContainer"],
-        [data-testid="stSidebar"] [data-testid="stCaptionContainer"] * {
-            color: rgba(255,255,255,0.9) !important;
-        }
-        
-        [data-testid="stSidebar"] h1, 
-        [data-testid="stSidebar"] h2, 
-        [data-testid="stSidebar"] h3,
-        [data-testid="stSidebar"] h4,
-        [data-testid="stSidebar"] h5 {
-            color: var(--mono-pure-white) !important;
-            font-weight: 600;
-        }
-        
-        [data-testid="stSidebar"] .stSelectbox label,
-        [data-testid="stSidebar"] .stMultiSelect label,
-        [data-testid="stSidebar"] .stTextInput label,
-        [data-testid="stSidebar"] .stTextArea label {
-            color: rgba(255,255,255,0.9) !important;
-        }
-        
-        [data-testid="stSidebar"] hr {
-            border-color: rgba(255,255,255,0.1);
-        }
-        
-        /* Sidebar metrics */
-        [data-testid="stSidebar"] [data-testid="stMetricValue"],
-        [data-testid="stSidebar"] [data-testid="stMetricLabel"],
-        [data-testid="stSidebar"] [data-testid="stMetricDelta"] {
-            color: var(--mono-pure-white) !important;
-        }
-        
-        /* Sidebar expanders */
-        [data-testid="stSidebar"] [data-testid="stExpander"] summary p,
-        [data-testid="stSidebar"] [data-testid="stExpander"] summary span {
-            color: rgba(255,255,255,0.9) !important;
-        }
-        
-        /* Sidebar toggle labels */
-        [data-testid="stSidebar"] .stCheckbox label span,
-        [data-testid="stSidebar"] [data-testid="stWidgetLabel"] {
-            color: rgba(255,255,255,0.9) !important;
-        }
-        
-        /* Sidebar buttons */
-        [data-testid="stSidebar"] .stButton > button {
-            background: rgba(255,255,255,0.1);
-            color: var(--mono-pure-white);
-            border: 1px solid rgba(255,255,255,0.2);
-        }
-        
-        [data-testid="stSidebar"] .stButton > button:hover {
-            background: rgba(255,255,255,0.2);
-            border-color: rgba(255,255,255,0.3);
-        }
-        
-        /* Sidebar progress bar text */
-        [data-testid="stSidebar"] .stProgress > div > div > div {
-            color: rgba(255,255,255,0.9) !important;
-        }
-        
-        /* ═══════════════════════════════════════════════════════════════════
-           BUTTON STYLING - Minimal & Elegant
-           ═══════════════════════════════════════════════════════════════════ */
-        .stButton > button {
-            background: var(--mono-charcoal);
-            color: var(--mono-pure-white);
-            border: none;
-            border-radius: var(--radius-md);
-            padding: 0.5rem 1rem;
-            font-weight: 600;
-            font-size: 0.8rem;
-            transition: all 0.2s cubic-bezier(0.4, 0, 0.2, 1);
-            box-shadow: var(--shadow-sm);
-        }
-        
-        .stButton > button:hover {
-            background: var(--mono-black);
-            box-shadow: var(--shadow-md);
-            transform: translateY(-1px);
-        }
-        
-        .stButton > button:active {
-            transform: translateY(0);
-            box-shadow: var(--shadow-xs);
-        }
-        
-        /* Primary button variant */
-        .stButton > button[kind="primary"] {
-            background: var(--mono-black);
-        }
-        
-        /* ═══════════════════════════════════════════════════════════════════
-           INPUT FIELDS - Clean & Modern
-           ═══════════════════════════════════════════════════════════════════ */
-        .stTextInput > div > div > input,
-        .stTextArea > div > div > textarea {
-            border-radius: var(--radius-md);
-            border: 1px solid var(--mono-gray-300);
-            background: var(--mono-pure-white);
-            color: var(--mono-charcoal);
-            transition: all 0.2s cubic-bezier(0.4, 0, 0.2, 1);
-            font-size: 0.85rem;
-        }
-        
-        .stTextInput > div > div > input:focus,
-        .stTextArea > div > div > textarea:focus {
-            border-color: var(--mono-charcoal);
-            box-shadow: 0 0 0 3px rgba(26, 26, 26, 0.08);
-            color: var(--mono-charcoal);
-        }
-        
-        .stTextInput > div > div > input::placeholder,
-        .stTextArea > div > div > textarea::placeholder {
-            color: var(--mono-gray-400);
-        }
-        
-        /* Selectbox styling - ensure dark text on light background */
-        .stSelectbox > div > div,
-        .stMultiSelect > div > div {
-            color: var(--mono-charcoal);
-        }
-        
-        .stSelectbox label,
-        .stMultiSelect label {
-            color: var(--mono-charcoal) !important;
-        }
-        
-        /* ═══════════════════════════════════════════════════════════════════
-           METRICS STYLING - Minimalist
-           ═══════════════════════════════════════════════════════════════════ */
-        [data-testid="stMetric"] {
-            background: var(--mono-pure-white);
-            padding: 1.25rem;
-            border-radius: var(--radius-md);
-            box-shadow: var(--shadow-xs);
-            border: 1px solid var(--mono-gray-200);
-        }
-        
-        [data-testid="stMetricLabel"] {
-            color: var(--mono-gray-500);
-            font-weight: 500;
-        }
-        
-        [data-testid="stMetricValue"] {
-            color: var(--mono-charcoal);
-            font-weight: 700;
-        }
-        
-        /* ═══════════════════════════════════════════════════════════════════
-           EXPANDER STYLING - Subtle
-           ═══════════════════════════════════════════════════════════════════ */
-        .streamlit-expanderHeader {
-            background: var(--mono-pure-white);
-            border-radius: var(--radius-md);
-            font-weight: 600;
-            color: var(--mono-charcoal);
-            border: 1px solid var(--mono-gray-200);
-        }
-        
-        .streamlit-expanderHeader:hover {
-            background: var(--mono-gray-100);
-        }
-        
-        .streamlit-expanderContent {
-            background: var(--mono-gray-100);
-            border-radius: 0 0 var(--radius-md) var(--radius-md);
-            border: 1px solid var(--mono-gray-200);
-            border-top: none;
-            color: var(--mono-charcoal);
-        }
-        
-        .streamlit-expanderContent p,
-        .streamlit-expanderContent span,
-        .streamlit-expanderContent div {
-            color: var(--mono-charcoal);
-        }
-        
-        /* ═══════════════════════════════════════════════════════════════════
-           RISK LEVEL BADGES - Monochrome
-           ═══════════════════════════════════════════════════════════════════ */
-        .risk-badge {
-            display: inline-flex;
-            align-items: center;
-            gap: 0.35rem;
-            padding: 0.35rem 0.75rem;
-            border-radius: 100px;
-            font-weight: 600;
-            font-size: 0.7rem;
-        }
-        
-        .risk-low {
-            background: linear-gradient(135deg, #e8f5e9 0%, #c8e6c9 100%);
-            color: #2e7d32;
-            border: 1px solid #a5d6a7;
-        }
-        
-        .risk-medium {
-            background: linear-gradient(135deg, #fff8e1 0%, #ffecb3 100%);
-            color: #f57f17;
-            border: 1px solid #ffe082;
-        }
-        
-        .risk-high {
-            background: linear-gradient(135deg, #ffebee 0%, #ffcdd2 100%);
-            color: #c62828;
-            border: 1px solid #ef9a9a;
-        }
-        
-        .risk-critical {
-            background: linear-gradient(135deg, #b71c1c 0%, #c62828 100%);
-            color: #ffffff;
-            border: 1px solid #e53935;
-        }
-        
-        /* ═══════════════════════════════════════════════════════════════════
-           FRAMEWORK CARDS - Clean Selection
-           ═══════════════════════════════════════════════════════════════════ */
-        .framework-card {
-            background: var(--mono-pure-white);
-            border-radius: var(--radius-lg);
-            padding: 1rem;
-            margin: 0.35rem 0;
-            border: 1px solid var(--mono-gray-200);
-            transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-            cursor: pointer;
-        }
-        
-        .framework-card:hover {
-            border-color: var(--mono-charcoal);
-            box-shadow: var(--shadow-md);
-            transform: translateX(4px);
-        }
-        
-        .framework-card.selected {
-            border-color: var(--mono-charcoal);
-            border-width: 2px;
-            background: var(--mono-gray-100);
-        }
-        
-        .framework-acronym {
-            background: var(--mono-charcoal);
-            color: var(--mono-pure-white);
-            padding: 0.2rem 0.6rem;
-            border-radius: 100px;
-            font-weight: 600;
-            font-size: 0.7rem;
-            display: inline-block;
-            margin-bottom: 0.35rem;
-        }
-        
-        /* ═══════════════════════════════════════════════════════════════════
-           ALERT BOXES - Ensure proper text colors
-           ═══════════════════════════════════════════════════════════════════ */
-        [data-testid="stAlert"] p,
-        [data-testid="stAlert"] span,
-        .stAlert p,
-        .stAlert span {
-            color: var(--mono-charcoal) !important;
-        }
-        
-        /* ═══════════════════════════════════════════════════════════════════
-           ANIMATIONS - Subtle & Professional
-           ═══════════════════════════════════════════════════════════════════ */
-        @keyframes fadeIn {
-            from { opacity: 0; transform: translateY(8px); }
-            to { opacity: 1; transform: translateY(0); }
-        }
-        
-        .fade-in {
-            animation: fadeIn 0.4s cubic-bezier(0.4, 0, 0.2, 1) forwards;
-        }
-        
-        @keyframes slideIn {
-            from { opacity: 0; transform: translateX(-12px); }
-            to { opacity: 1; transform: translateX(0); }
-        }
-        
-        .slide-in {
-            animation: slideIn 0.3s cubic-bezier(0.4, 0, 0.2, 1) forwards;
-        }
-        
-        /* ═══════════════════════════════════════════════════════════════════
-           RESPONSIVE DESIGN
-           ═══════════════════════════════════════════════════════════════════ */
-        @media (max-width: 768px) {
-            .hero-header {
-                padding: 1.75rem;
-                border-radius: var(--radius-xl);
-            }
-            
-            .hero-header h1 {
-                font-size: 1.6rem;
-            }
-            
-            .stats-container {
-                gap: 0.4rem;
-            }
-            
-            .stats-badge {
-                font-size: 0.7rem;
-                padding: 0.375rem 0.75rem;
-            }
-        }
-        
-        /* ═══════════════════════════════════════════════════════════════════
-           v4.0 - AI CHAT INTERFACE - Sophisticated
-           ═══════════════════════════════════════════════════════════════════ */
-        .chat-container {
-            background: var(--gradient-subtle);
-            border-radius: var(--radius-xl);
-            padding: 1.25rem;
-            margin: 0.75rem 0;
-            border: 1px solid var(--mono-gray-200);
-            max-height: 500px;
-            overflow-y: auto;
-        }
-        
-        .chat-message {
-            display: flex;
-            gap: 0.75rem;
-            margin: 0.75rem 0;
-            animation: fadeIn 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-        }
-        
-        .chat-message.user {
-            flex-direction: row-reverse;
-        }
-        
-        .chat-avatar {
-            width: 32px;
-            height: 32px;
-            border-radius: 50%;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-size: 1rem;
-            flex-shrink: 0;
-        }
-        
-        .chat-avatar.assistant {
-            background: var(--mono-charcoal);
-            color: var(--mono-pure-white);
-        }
-        
-        .chat-avatar.user {
-            background: var(--mono-gray-200);
-            color: var(--mono-charcoal);
-        }
-        
-        .chat-bubble {
-            max-width: 70%;
-            padding: 0.75rem 1rem;
-            border-radius: var(--radius-lg);
-            position: relative;
-            font-size: 0.85rem;
-        }
-        
-        .chat-bubble.assistant {
-            background: var(--mono-pure-white);
-            border: 1px solid var(--mono-gray-200);
-            border-top-left-radius: 4px;
-            color: var(--mono-charcoal);
-        }
-        
-        .chat-bubble.user {
-            background: var(--mono-charcoal);
-            color: var(--mono-pure-white);
-            border-top-right-radius: 4px;
-        }
-        
-        /* ═══════════════════════════════════════════════════════════════════
-           v4.0 - SMART PROMPT BUILDER - Clean
-           ═══════════════════════════════════════════════════════════════════ */
-        .builder-container {
-            background: var(--mono-pure-white);
-            border-radius: var(--radius-xl);
-            padding: 1.25rem;
-            box-shadow: var(--shadow-lg);
-            border: 1px solid var(--mono-gray-200);
-            position: relative;
-        }
-        
-        .component-slot {
-            background: var(--mono-gray-100);
-            border: 2px dashed var(--mono-gray-300);
-            border-radius: var(--radius-md);
-            padding: 0.75rem;
-            margin: 0.35rem 0;
-            transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-        }
-        
-        .component-slot:hover {
-            border-color: var(--mono-charcoal);
-            background: var(--mono-gray-100);
-        }
-        
-        .component-slot.filled {
-            border-style: solid;
-            border-color: var(--mono-charcoal);
-            background: var(--mono-pure-white);
-        }
-        
-        .preview-panel {
-            background: var(--mono-charcoal);
-            color: var(--mono-gray-200);
-            border-radius: var(--radius-lg);
-            padding: 2rem 1.25rem 1.25rem 1.25rem;
-            font-family: var(--font-mono);
-            font-size: 0.8rem;
-            line-height: 1.7;
-            position: relative;
-            overflow: hidden;
-        }
-        
-        .preview-panel::before {
-            content: '⌘ LIVE PREVIEW';
-            position: absolute;
-            top: 0;
-            left: 0;
-            right: 0;
-            padding: 0.35rem 0.75rem;
-            background: rgba(255,255,255,0.08);
-            font-size: 0.6rem;
-            font-weight: 600;
-            letter-spacing: 1.5px;
-            font-family: var(--font-primary);
-            color: var(--mono-gray-400);
-            z-index: 10;
-        }
-        
-        .preview-panel .content {
-            margin-top: 0.5rem;
-            position: relative;
-            z-index: 5;
-        }
-        
-        /* ═══════════════════════════════════════════════════════════════════
-           v4.0 - COMMAND PALETTE - Minimal
-           ═══════════════════════════════════════════════════════════════════ */
-        .command-palette-overlay {
-            position: fixed;
-            top: 0;
-            left: 0;
-            right: 0;
-            bottom: 0;
-            background: rgba(10, 10, 10, 0.6);
-            backdrop-filter: blur(8px);
-            -webkit-backdrop-filter: blur(8px);
-            z-index: 9999;
-            display: flex;
-            align-items: flex-start;
-            justify-content: center;
-            padding-top: 18vh;
-        }
-        
-        .command-palette {
-            background: var(--mono-pure-white);
-            border-radius: var(--radius-xl);
-            width: 90%;
-            max-width: 560px;
-            box-shadow: var(--shadow-xl);
-            overflow: hidden;
-            border: 1px solid var(--mono-gray-200);
-        }
-        
-        .command-input {
-            width: 100%;
-            padding: 1.25rem 1.5rem;
-            border: none;
-            border-bottom: 1px solid var(--mono-gray-200);
-            font-size: 1.05rem;
-            outline: none;
-            font-family: var(--font-primary);
-            font-weight: 500;
-        }
-        
-        .command-item {
-            padding: 0.875rem 1.5rem;
-            display: flex;
-            align-items: center;
-            gap: 1rem;
-            cursor: pointer;
-            transition: background 0.15s cubic-bezier(0.4, 0, 0.2, 1);
-            color: var(--mono-charcoal);
-        }
-        
-        .command-item:hover {
-            background: var(--mono-gray-100);
-        }
-        
-        .command-item.selected {
-            background: var(--mono-charcoal);
-            color: var(--mono-pure-white);
-        }
-        
-        .command-shortcut {
-            margin-left: auto;
-            font-size: 0.7rem;
-            padding: 0.25rem 0.6rem;
-            background: var(--mono-gray-200);
-            border-radius: 6px;
-            font-family: var(--font-mono);
-            color: var(--mono-gray-600);
-        }
-        
-        /* ═══════════════════════════════════════════════════════════════════
-           v4.0 - ANALYTICS DASHBOARD - Clean Data Display
-           ═══════════════════════════════════════════════════════════════════ */
-        .analytics-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 1rem;
-            margin: 1rem 0;
-        }
-        
-        .analytics-card {
-            background: var(--mono-pure-white);
-            border-radius: var(--radius-lg);
-            padding: 1.75rem;
-            box-shadow: var(--shadow-sm);
-            text-align: center;
-            transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-            border: 1px solid var(--mono-gray-200);
-        }
-        
-        .analytics-card:hover {
-            transform: translateY(-3px);
-            box-shadow: var(--shadow-md);
-        }
-        
-        .analytics-value {
-            font-size: 2.75rem;
-            font-weight: 700;
-            color: var(--mono-charcoal);
-            line-height: 1;
-        }
-        
-        .analytics-label {
-            color: var(--mono-gray-500);
-            font-size: 0.875rem;
-            margin-top: 0.625rem;
-            font-weight: 500;
-        }
-        
-        .analytics-trend {
-            font-size: 0.75rem;
-            margin-top: 0.5rem;
-            font-weight: 600;
-        }
-        
-        .analytics-trend.up { color: var(--mono-gray-600); }
-        .analytics-trend.down { color: var(--mono-gray-500); }
-        
-        /* ═══════════════════════════════════════════════════════════════════
-           v4.0 - TEMPLATE GALLERY - Grid Cards
-           ═══════════════════════════════════════════════════════════════════ */
-        .template-gallery {
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(280px, 1fr));
-            gap: 1.5rem;
-            margin: 1.5rem 0;
-        }
-        
-        .template-card {
-            background: var(--mono-pure-white);
-            border-radius: var(--radius-lg);
-            overflow: hidden;
-            box-shadow: var(--shadow-sm);
-            transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-            cursor: pointer;
-            border: 1px solid var(--mono-gray-200);
-        }
-        
-        .template-card:hover {
-            transform: translateY(-3px);
-            box-shadow: var(--shadow-md);
-            border-color: var(--mono-charcoal);
-        }
-        
-        .template-header {
-            background: var(--mono-charcoal);
-            color: var(--mono-pure-white);
-            padding: 1rem 1.25rem;
-            position: relative;
-        }
-        
-        .template-header h4 {
-            margin: 0;
-            font-size: 1rem;
-            font-weight: 600;
-        }
-        
-        .template-badge {
-            position: absolute;
-            top: 0.75rem;
-            right: 0.75rem;
-            background: var(--mono-pure-white);
-            color: var(--mono-charcoal);
-            padding: 0.2rem 0.625rem;
-            border-radius: 100px;
-            font-size: 0.65rem;
-            font-weight: 600;
-            letter-spacing: 0.02em;
-        }
-        
-        .template-body {
-            padding: 1.25rem;
-        }
-        
-        .template-body p {
-            color: var(--mono-gray-600);
-            font-size: 0.9rem;
-            margin: 0 0 1rem 0;
-            line-height: 1.6;
-        }
-        
-        .template-meta {
-            display: flex;
-            gap: 1rem;
-            font-size: 0.8rem;
-            color: var(--mono-gray-500);
-        }
-        
-        /* ═══════════════════════════════════════════════════════════════════
-           v4.0 - TOAST NOTIFICATIONS - Subtle
-           ═══════════════════════════════════════════════════════════════════ */
-        .toast-container {
-            position: fixed;
-            bottom: 2rem;
-            right: 2rem;
-            z-index: 9998;
-        }
-        
-        .toast {
-            background: var(--mono-pure-white);
-            border-radius: var(--radius-md);
-            padding: 1rem 1.5rem;
-            box-shadow: var(--shadow-lg);
-            margin-top: 0.5rem;
-            display: flex;
-            align-items: center;
-            gap: 0.75rem;
-            animation: slideInRight 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-            border-left: 3px solid var(--mono-charcoal);
-        }
-        
-        .toast.success { border-left-color: var(--mono-gray-400); }
-        .toast.warning { border-left-color: var(--mono-gray-500); }
-        .toast.error { border-left-color: var(--mono-gray-700); }
-        
-        @keyframes slideInRight {
-            from { opacity: 0; transform: translateX(100px); }
-            to { opacity: 1; transform: translateX(0); }
-        }
-        
-        /* ═══════════════════════════════════════════════════════════════════
-           v4.0 - PROGRESS INDICATORS - Minimal
-           ═══════════════════════════════════════════════════════════════════ */
-        .progress-ring {
-            display: inline-flex;
-            align-items: center;
-            justify-content: center;
-            position: relative;
-        }
-        
-        .progress-ring svg {
-            transform: rotate(-90deg);
-        }
-        
-        .progress-ring circle {
-            fill: none;
-            stroke-width: 6;
-        }
-        
-        .progress-ring .bg { stroke: var(--mono-gray-200); }
-        .progress-ring .progress { stroke: var(--mono-charcoal); }
-        
-        .progress-value {
-            position: absolute;
-            font-weight: 700;
-            color: var(--mono-charcoal);
-        }
-        
-        /* ═══════════════════════════════════════════════════════════════════
-           v4.0 - KEYBOARD SHORTCUTS HINT - Sleek
-           ═══════════════════════════════════════════════════════════════════ */
-        .shortcuts-hint {
-            position: fixed;
-            bottom: 1.25rem;
-            left: 50%;
-            transform: translateX(-50%);
-            background: var(--mono-charcoal);
-            color: var(--mono-gray-200);
-            padding: 0.625rem 1.25rem;
-            border-radius: 100px;
-            font-size: 0.75rem;
-            display: flex;
-            gap: 1.5rem;
-            backdrop-filter: blur(20px);
-            -webkit-backdrop-filter: blur(20px);
-            box-shadow: var(--shadow-lg);
-            border: 1px solid rgba(255,255,255,0.1);
-            z-index: 9998;
-        }
-        
-        /* ═══════════════════════════════════════════════════════════════════
-           SP2 FIX - LAYOUT FIXES
-           ═══════════════════════════════════════════════════════════════════ */
-        /* Add bottom padding to main content to avoid overlap with shortcuts bar */
-        .main .block-container {
-            padding-bottom: 5rem !important;
-        }
-        
-        /* ═══════════════════════════════════════════════════════════════════
-           EXPANDER ICON FIX - NUCLEAR OPTION v3
-           Hide ALL possible Material Icons text in expanders
-           ═══════════════════════════════════════════════════════════════════ */
-        /* Target every possible element that might contain icon text */
-        [data-testid="stExpander"] summary > span:first-child,
-        [data-testid="stExpander"] summary [data-testid="stExpanderToggleIcon"],
-        [data-testid="stExpander"] summary span[class*="material"],
-        [data-testid="stExpander"] summary span[class*="icon"],
-        [data-testid="stExpander"] summary span[class*="Icon"],
-        [data-testid="stExpander"] details > summary > span:first-child,
-        details[data-testid="stExpander"] > summary > span:first-child {
-            display: none !important;
-            visibility: hidden !important;
-            width: 0 !important;
-            height: 0 !important;
-            max-width: 0 !important;
-            max-height: 0 !important;
-            overflow: hidden !important;
-            font-size: 0 !important;
-            line-height: 0 !important;
-            opacity: 0 !important;
-            position: absolute !important;
-            left: -9999px !important;
-        }
-        
-        /* Hide any element using Material Symbols font */
-        [data-testid="stExpander"] summary *[style*="Material"],
-        [data-testid="stExpander"] summary span:not(:has(p)):not(:has(div)) {
-            font-size: 0 !important;
-            color: transparent !important;
-            width: 0 !important;
-            overflow: hidden !important;
-        }
-        
-        /* Only show the paragraph text in expander summary */
-        [data-testid="stExpander"] summary p,
-        [data-testid="stExpander"] summary > div > p {
-            font-size: 0.9rem !important;
-            font-family: 'Quicksand', -apple-system, BlinkMacSystemFont, sans-serif !important;
-            color: var(--mono-charcoal) !important;
-            display: inline-block !important;
-            visibility: visible !important;
-            opacity: 1 !important;
-        }
-        
-        /* Style the expander with clean arrow */
-        [data-testid="stExpander"] {
-            position: relative;
-            z-index: 1;
-            overflow: hidden;
-        }
-        
-        [data-testid="stExpander"] summary {
-            display: flex;
-            align-items: center;
-            gap: 0.5rem;
-            cursor: pointer;
-            padding-left: 1.5rem !important;
-            position: relative;
-        }
-        
-        /* Add CSS-only arrow */
-        [data-testid="stExpander"]:not([open]) summary::before {
-            content: '▸' !important;
-            position: absolute !important;
-            left: 0.5rem !important;
-            top: 50% !important;
-            transform: translateY(-50%) !important;
-            font-size: 12px !important;
-            color: #737373 !important;
-            font-family: system-ui, sans-serif !important;
-        }
-        
-        [data-testid="stExpander"][open] summary::before {
-            content: '▾' !important;
-            position: absolute !important;
-            left: 0.5rem !important;
-            top: 50% !important;
-            transform: translateY(-50%) !important;
-            font-size: 12px !important;
-            color: #737373 !important;
-            font-family: system-ui, sans-serif !important;
-        }
-        
-        .shortcut-key {
-            background: rgba(255, 255, 255, 0.12);
-            padding: 0.2rem 0.5rem;
-            border-radius: 4px;
-            font-family: var(--font-mono);
-            margin-right: 0.5rem;
-            font-size: 0.7rem;
-        }
-        
-        /* ═══════════════════════════════════════════════════════════════════
-           v4.0 - SUBTLE EFFECTS
-           ═══════════════════════════════════════════════════════════════════ */
-        .glow-green {
-            box-shadow: var(--shadow-lg);
-        }
-        
-        .glow-gold {
-            box-shadow: var(--shadow-lg);
-        }
-        
-        .pulse-glow {
-            /* Removed for cleaner monochrome aesthetic */
-        }
-        
-        /* ═══════════════════════════════════════════════════════════════════
-           SCROLLBAR - Minimal
-           ═══════════════════════════════════════════════════════════════════ */
-        ::-webkit-scrollbar {
-            width: 8px;
-            height: 8px;
-        }
-        
-        ::-webkit-scrollbar-track {
-            background: var(--mono-gray-100);
-            border-radius: 4px;
+# Static stylesheet. Streamlit re-executes this script on every rerun, so the
+# constant is re-evaluated and re-emitted per run (elements that are not
+# re-emitted are dropped); it is kept here as one constant for readability.
+CUSTOM_CSS = """
+<style>
+    /* ═══════════════════════════════════════════════════════════════════
+       GOOGLE FONTS - Quicksand only (no Material Icons - using CSS arrows)
+       ═══════════════════════════════════════════════════════════════════ */
+    @import url('https://fonts.googleapis.com/css2?family=Quicksand:wght@400;500;600;700&display=swap');
+    
+    /* ═══════════════════════════════════════════════════════════════════
+       ROOT VARIABLES - Ultra-Modern Monochrome Palette
+       ═══════════════════════════════════════════════════════════════════ */
+    :root {
+        /* Monochrome Palette */
+        --mono-black: #0a0a0a;
+        --mono-charcoal: #1a1a1a;
+        --mono-dark: #2d2d2d;
+        --mono-gray-700: #404040;
+        --mono-gray-600: #525252;
+        --mono-gray-500: #737373;
+        --mono-gray-400: #a3a3a3;
+        --mono-gray-300: #d4d4d4;
+        --mono-gray-200: #e5e5e5;
+        --mono-gray-100: #f5f5f5;
+        --mono-white: #fafafa;
+        --mono-pure-white: #ffffff;
+        
+        /* Accent - subtle warm gray for highlights */
+        --accent-warm: #e8e4e0;
+        --accent-cool: #e4e8ec;
+        
+        /* Gradients */
+        --gradient-primary: linear-gradient(135deg, #1a1a1a 0%, #2d2d2d 50%, #404040 100%);
+        --gradient-light: linear-gradient(135deg, #fafafa 0%, #f5f5f5 100%);
+        --gradient-dark: linear-gradient(180deg, #0a0a0a 0%, #1a1a1a 100%);
+        --gradient-subtle: linear-gradient(135deg, #ffffff 0%, #f5f5f5 100%);
+        --gradient-glass: linear-gradient(135deg, rgba(255,255,255,0.9) 0%, rgba(255,255,255,0.7) 100%);
+        
+        /* Shadows - refined */
+        --shadow-xs: 0 1px 2px rgba(0,0,0,0.04);
+        --shadow-sm: 0 2px 8px rgba(0,0,0,0.06);
+        --shadow-md: 0 4px 16px rgba(0,0,0,0.08);
+        --shadow-lg: 0 8px 32px rgba(0,0,0,0.12);
+        --shadow-xl: 0 16px 48px rgba(0,0,0,0.16);
+        --shadow-inner: inset 0 2px 4px rgba(0,0,0,0.04);
+        
+        /* Border radius - modern */
+        --radius-xs: 4px;
+        --radius-sm: 6px;
+        --radius-md: 10px;
+        --radius-lg: 14px;
+        --radius-xl: 18px;
+        --radius-2xl: 24px;
+        
+        /* Typography */
+        --font-primary: 'Quicksand', -apple-system, BlinkMacSystemFont, sans-serif;
+        --font-mono: 'SF Mono', 'Fira Code', 'Consolas', monospace;
+    }
+    
+    /* ═══════════════════════════════════════════════════════════════════
+       GLOBAL STYLES
+       ═══════════════════════════════════════════════════════════════════ */
+    * {
+        font-family: var(--font-primary) !important;
+    }
+    
+    .stApp {
+        background: var(--mono-white);
+        font-family: var(--font-primary);
+        color: var(--mono-charcoal);
+    }
+    
+    /* Main content area text should be dark */
+    .stApp .main .block-container,
+    .stApp .main .block-container p,
+    .stApp .main .block-container span,
+    .stApp .main .block-container div,
+    .stApp .main .block-container label {
+        color: var(--mono-charcoal);
+    }
+    
+    .stApp .main .block-container h1,
+    .stApp .main .block-container h2,
+    .stApp .main .block-container h3,
+    .stApp .main .block-container h4,
+    .stApp .main .block-container h5 {
+        color: var(--mono-black);
+    }
+    
+    /* Hide Streamlit branding for cleaner look */
+    #MainMenu {visibility: hidden;}
+    footer {visibility: hidden;}
+    header {visibility: hidden;}
+    
+    /* Typography baseline - compact sizing */
+    h1, h2, h3, h4, h5, h6, p, span, div, button, input, textarea, label {
+        font-family: var(--font-primary) !important;
+        font-weight: 500;
+    }
+    
+    h1 { font-weight: 700 !important; letter-spacing: -0.02em; font-size: 1.5rem !important; }
+    h2 { font-weight: 600 !important; letter-spacing: -0.01em; font-size: 1.2rem !important; }
+    h3 { font-weight: 600 !important; font-size: 1rem !important; }
+    h4 { font-weight: 600 !important; font-size: 0.9rem !important; }
+    
+    p, span, div, label { font-size: 0.85rem; }
+    
+    /* Compact metrics */
+    [data-testid="stMetric"] {
+        background: var(--mono-gray-100);
+        padding: 0.6rem 0.8rem !important;
+        border-radius: var(--radius-sm);
+    }
+    
+    [data-testid="stMetric"] label {
+        font-size: 0.7rem !important;
+    }
+    
+    [data-testid="stMetric"] [data-testid="stMetricValue"] {
+        font-size: 1.1rem !important;
+    }
+    
+    /* Compact expanders */
+    [data-testid="stExpander"] {
+        border: 1px solid var(--mono-gray-200) !important;
+        border-radius: var(--radius-sm) !important;
+        margin: 0.35rem 0 !important;
+    }
+    
+    [data-testid="stExpander"] summary {
+        padding: 0.5rem 0.75rem !important;
+        font-size: 0.85rem !important;
+    }
+    
+    [data-testid="stExpander"] [data-testid="stExpanderDetails"] {
+        padding: 0.5rem 0.75rem !important;
+    }
+    
+    /* ═══════════════════════════════════════════════════════════════════
+       HERO HEADER - Ultra Modern Monochrome
+       ═══════════════════════════════════════════════════════════════════ */
+    .hero-header {
+        background: var(--gradient-primary);
+        color: var(--mono-white);
+        padding: 1.5rem 2rem;
+        border-radius: var(--radius-2xl);
+        margin-bottom: 1.25rem;
+        box-shadow: var(--shadow-xl);
+        position: relative;
+        overflow: hidden;
+        border: 1px solid rgba(255,255,255,0.05);
+    }
+    
+    .hero-header::before {
+        content: '';
+        position: absolute;
+        top: 0;
+        right: 0;
+        width: 40%;
+        height: 100%;
+        background: linear-gradient(135deg, transparent 0%, rgba(255,255,255,0.03) 100%);
+        pointer-events: none;
+    }
+    
+    .hero-header::after {
+        content: '';
+        position: absolute;
+        bottom: -50%;
+        right: -25%;
+        width: 50%;
+        height: 100%;
+        background: radial-gradient(circle, rgba(255,255,255,0.02) 0%, transparent 70%);
+        pointer-events: none;
+    }
+    
+    .hero-header h1 {
+        margin: 0;
+        font-size: 1.6rem;
+        font-weight: 700;
+        letter-spacing: -0.03em;
+        position: relative;
+        z-index: 1;
+        color: var(--mono-pure-white);
+    }
+    
+    .hero-header .subtitle {
+        margin: 0.5rem 0 0 0;
+        font-size: 0.85rem;
+        opacity: 0.7;
+        font-weight: 400;
+        position: relative;
+        z-index: 1;
+        letter-spacing: 0.02em;
+    }
+    
+    .hero-logo {
+        height: 36px;
+        width: auto;
+        margin-bottom: 0.75rem;
+        filter: brightness(0) invert(1);
+        opacity: 0.95;
+    }
+    
+    /* ═══════════════════════════════════════════════════════════════════
+       STATS BADGES - Minimal & Clean
+       ═══════════════════════════════════════════════════════════════════ */
+    .stats-container {
+        display: flex;
+        flex-wrap: wrap;
+        gap: 0.4rem;
+        margin-top: 1rem;
+        position: relative;
+        z-index: 1;
+    }
+    
+    .stats-badge {
+        background: rgba(255,255,255,0.08);
+        backdrop-filter: blur(20px);
+        -webkit-backdrop-filter: blur(20px);
+        color: rgba(255,255,255,0.9);
+        padding: 0.35rem 0.75rem;
+        border-radius: 100px;
+        font-weight: 500;
+        font-size: 0.7rem;
+        display: inline-flex;
+        align-items: center;
+        gap: 0.3rem;
+        border: 1px solid rgba(255,255,255,0.1);
+        transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
+    }
+    
+    .stats-badge:hover {
+        background: rgba(255,255,255,0.15);
+        transform: translateY(-1px);
+    }
+    
+    .stats-badge.gold {
+        background: rgba(255,255,255,0.95);
+        color: var(--mono-charcoal);
+        border-color: transparent;
+        font-weight: 600;
+    }
+    
+    /* ═══════════════════════════════════════════════════════════════════
+       SECTION CARDS - Modern Glass Effect
+       ═══════════════════════════════════════════════════════════════════ */
+    .section-card {
+        background: var(--mono-pure-white);
+        border-radius: var(--radius-lg);
+        padding: 1.25rem;
+        margin: 0.75rem 0;
+        box-shadow: var(--shadow-sm);
+        border: 1px solid var(--mono-gray-200);
+        transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
+        position: relative;
+    }
+    
+    .section-card::before {
+        content: '';
+        position: absolute;
+        left: 0;
+        top: 0;
+        bottom: 0;
+        width: 3px;
+        background: var(--mono-charcoal);
+        border-radius: 3px 0 0 3px;
+    }
+    
+    .section-card:hover {
+        box-shadow: var(--shadow-md);
+        transform: translateY(-2px);
+        border-color: var(--mono-gray-300);
+    }
+    
+    .section-card.gold-accent::before {
+        background: var(--mono-gray-500);
+    }
+    
+    .section-card.red-accent::before {
+        background: var(--mono-gray-700);
+    }
+    
+    .section-card h3 {
+        color: var(--mono-charcoal);
+        margin: 0 0 0.35rem 0;
+        font-size: 1rem;
+        font-weight: 600;
+    }
+    
+    .section-card p {
+        color: var(--mono-gray-600);
+        margin: 0;
+        font-size: 0.85rem;
+        line-height: 1.5;
+    }
+    
+    /* ═══════════════════════════════════════════════════════════════════
+       PROMPT OUTPUT BOX - Elegant Code Display
+       ═══════════════════════════════════════════════════════════════════ */
+    .prompt-output {
+        background: var(--mono-gray-100);
+        border: 1px solid var(--mono-gray-200);
+        border-radius: var(--radius-lg);
+        padding: 1.25rem;
+        font-family: var(--font-mono);
+        font-size: 0.8rem;
+        line-height: 1.6;
+        white-space: pre-wrap;
+        max-height: 400px;
+        overflow-y: auto;
+        position: relative;
+        color: var(--mono-charcoal);
+    }
+    
+    .prompt-output::before {
+        content: '📋 Generated Prompt';
+        position: absolute;
+        top: -12px;
+        left: 20px;
+        background: var(--mono-white);
+        padding: 0 10px;
+        font-size: 0.7rem;
+        font-weight: 600;
+        color: var(--mono-gray-500);
+        font-family: var(--font-primary);
+        text-transform: uppercase;
+        letter-spacing: 0.05em;
+    }
+    
+    /* ═══════════════════════════════════════════════════════════════════
+       TAB STYLING - Ultra Clean
+       ═══════════════════════════════════════════════════════════════════ */
+    .stTabs [data-baseweb="tab-list"] {
+        gap: 3px;
+        background: var(--mono-gray-100);
+        padding: 0.35rem;
+        border-radius: var(--radius-xl);
+        border: 1px solid var(--mono-gray-200);
+    }
+    
+    .stTabs [data-baseweb="tab"] {
+        height: 38px;
+        padding: 0 14px;
+        background: transparent;
+        border-radius: var(--radius-md);
+        font-weight: 500;
+        font-size: 0.8rem;
+        color: var(--mono-gray-600);
+        transition: all 0.2s cubic-bezier(0.4, 0, 0.2, 1);
+        border: none;
+    }
+    
+    .stTabs [data-baseweb="tab"]:hover {
+        background: var(--mono-pure-white);
+        color: var(--mono-charcoal);
+    }
+    
+    .stTabs [aria-selected="true"] {
+        background: var(--mono-charcoal) !important;
+        color: var(--mono-pure-white) !important;
+        font-weight: 600;
+        box-shadow: var(--shadow-sm);
+    }
+    
+    /* ═══════════════════════════════════════════════════════════════════
+       SIDEBAR STYLING - Dark Sophisticated with White Text
+       ═══════════════════════════════════════════════════════════════════ */
+    [data-testid="stSidebar"] {
+        background: var(--gradient-dark);
+        border-right: 1px solid rgba(255,255,255,0.05);
+    }
+    
+    [data-testid="stSidebar"] .stMarkdown,
+    [data-testid="stSidebar"] .stMarkdown p,
+    [data-testid="stSidebar"] .stMarkdown span,
+    [data-testid="stSidebar"] .stMarkdown div,
+    [data-testid="stSidebar"] p,
+    [data-testid="stSidebar"] span,
+    [data-testid="stSidebar"] label,
+    [data-testid="stSidebar"] .stCaption,
+    [data-testid="stSidebar"] [data-testid="stCaptionContainer"],
+    [data-testid="stSidebar"] [data-testid="stCaptionContainer"] * {
+        color: rgba(255,255,255,0.9) !important;
+    }
+    
+    [data-testid="stSidebar"] h1, 
+    [data-testid="stSidebar"] h2, 
+    [data-testid="stSidebar"] h3,
+    [data-testid="stSidebar"] h4,
+    [data-testid="stSidebar"] h5 {
+        color: var(--mono-pure-white) !important;
+        font-weight: 600;
+    }
+    
+    [data-testid="stSidebar"] .stSelectbox label,
+    [data-testid="stSidebar"] .stMultiSelect label,
+    [data-testid="stSidebar"] .stTextInput label,
+    [data-testid="stSidebar"] .stTextArea label {
+        color: rgba(255,255,255,0.9) !important;
+    }
+    
+    [data-testid="stSidebar"] hr {
+        border-color: rgba(255,255,255,0.1);
+    }
+    
+    /* Sidebar metrics */
+    [data-testid="stSidebar"] [data-testid="stMetricValue"],
+    [data-testid="stSidebar"] [data-testid="stMetricLabel"],
+    [data-testid="stSidebar"] [data-testid="stMetricDelta"] {
+        color: var(--mono-pure-white) !important;
+    }
+    
+    /* Sidebar expanders */
+    [data-testid="stSidebar"] [data-testid="stExpander"] summary p,
+    [data-testid="stSidebar"] [data-testid="stExpander"] summary span {
+        color: rgba(255,255,255,0.9) !important;
+    }
+    
+    /* Sidebar toggle labels */
+    [data-testid="stSidebar"] .stCheckbox label span,
+    [data-testid="stSidebar"] [data-testid="stWidgetLabel"] {
+        color: rgba(255,255,255,0.9) !important;
+    }
+    
+    /* Sidebar buttons */
+    [data-testid="stSidebar"] .stButton > button {
+        background: rgba(255,255,255,0.1);
+        color: var(--mono-pure-white);
+        border: 1px solid rgba(255,255,255,0.2);
+    }
+    
+    [data-testid="stSidebar"] .stButton > button:hover {
+        background: rgba(255,255,255,0.2);
+        border-color: rgba(255,255,255,0.3);
+    }
+    
+    /* Sidebar progress bar text */
+    [data-testid="stSidebar"] .stProgress > div > div > div {
+        color: rgba(255,255,255,0.9) !important;
+    }
+    
+    /* ═══════════════════════════════════════════════════════════════════
+       BUTTON STYLING - Minimal & Elegant
+       ═══════════════════════════════════════════════════════════════════ */
+    .stButton > button {
+        background: var(--mono-charcoal);
+        color: var(--mono-pure-white);
+        border: none;
+        border-radius: var(--radius-md);
+        padding: 0.5rem 1rem;
+        font-weight: 600;
+        font-size: 0.8rem;
+        transition: all 0.2s cubic-bezier(0.4, 0, 0.2, 1);
+        box-shadow: var(--shadow-sm);
+    }
+    
+    .stButton > button:hover {
+        background: var(--mono-black);
+        box-shadow: var(--shadow-md);
+        transform: translateY(-1px);
+    }
+    
+    .stButton > button:active {
+        transform: translateY(0);
+        box-shadow: var(--shadow-xs);
+    }
+    
+    /* Primary button variant */
+    .stButton > button[kind="primary"] {
+        background: var(--mono-black);
+    }
+    
+    /* ═══════════════════════════════════════════════════════════════════
+       INPUT FIELDS - Clean & Modern
+       ═══════════════════════════════════════════════════════════════════ */
+    .stTextInput > div > div > input,
+    .stTextArea > div > div > textarea {
+        border-radius: var(--radius-md);
+        border: 1px solid var(--mono-gray-300);
+        background: var(--mono-pure-white);
+        color: var(--mono-charcoal);
+        transition: all 0.2s cubic-bezier(0.4, 0, 0.2, 1);
+        font-size: 0.85rem;
+    }
+    
+    .stTextInput > div > div > input:focus,
+    .stTextArea > div > div > textarea:focus {
+        border-color: var(--mono-charcoal);
+        box-shadow: 0 0 0 3px rgba(26, 26, 26, 0.08);
+        color: var(--mono-charcoal);
+    }
+    
+    .stTextInput > div > div > input::placeholder,
+    .stTextArea > div > div > textarea::placeholder {
+        color: var(--mono-gray-400);
+    }
+    
+    /* Selectbox styling - ensure dark text on light background */
+    .stSelectbox > div > div,
+    .stMultiSelect > div > div {
+        color: var(--mono-charcoal);
+    }
+    
+    .stSelectbox label,
+    .stMultiSelect label {
+        color: var(--mono-charcoal) !important;
+    }
+    
+    /* ═══════════════════════════════════════════════════════════════════
+       METRICS STYLING - Minimalist
+       ═══════════════════════════════════════════════════════════════════ */
+    [data-testid="stMetric"] {
+        background: var(--mono-pure-white);
+        padding: 1.25rem;
+        border-radius: var(--radius-md);
+        box-shadow: var(--shadow-xs);
+        border: 1px solid var(--mono-gray-200);
+    }
+    
+    [data-testid="stMetricLabel"] {
+        color: var(--mono-gray-500);
+        font-weight: 500;
+    }
+    
+    [data-testid="stMetricValue"] {
+        color: var(--mono-charcoal);
+        font-weight: 700;
+    }
+    
+    /* ═══════════════════════════════════════════════════════════════════
+       EXPANDER STYLING - Subtle
+       ═══════════════════════════════════════════════════════════════════ */
+    .streamlit-expanderHeader {
+        background: var(--mono-pure-white);
+        border-radius: var(--radius-md);
+        font-weight: 600;
+        color: var(--mono-charcoal);
+        border: 1px solid var(--mono-gray-200);
+    }
+    
+    .streamlit-expanderHeader:hover {
+        background: var(--mono-gray-100);
+    }
+    
+    .streamlit-expanderContent {
+        background: var(--mono-gray-100);
+        border-radius: 0 0 var(--radius-md) var(--radius-md);
+        border: 1px solid var(--mono-gray-200);
+        border-top: none;
+        color: var(--mono-charcoal);
+    }
+    
+    .streamlit-expanderContent p,
+    .streamlit-expanderContent span,
+    .streamlit-expanderContent div {
+        color: var(--mono-charcoal);
+    }
+    
+    /* ═══════════════════════════════════════════════════════════════════
+       RISK LEVEL BADGES - Monochrome
+       ═══════════════════════════════════════════════════════════════════ */
+    .risk-badge {
+        display: inline-flex;
+        align-items: center;
+        gap: 0.35rem;
+        padding: 0.35rem 0.75rem;
+        border-radius: 100px;
+        font-weight: 600;
+        font-size: 0.7rem;
+    }
+    
+    .risk-low {
+        background: linear-gradient(135deg, #e8f5e9 0%, #c8e6c9 100%);
+        color: #2e7d32;
+        border: 1px solid #a5d6a7;
+    }
+    
+    .risk-medium {
+        background: linear-gradient(135deg, #fff8e1 0%, #ffecb3 100%);
+        color: #f57f17;
+        border: 1px solid #ffe082;
+    }
+    
+    .risk-high {
+        background: linear-gradient(135deg, #ffebee 0%, #ffcdd2 100%);
+        color: #c62828;
+        border: 1px solid #ef9a9a;
+    }
+    
+    .risk-critical {
+        background: linear-gradient(135deg, #b71c1c 0%, #c62828 100%);
+        color: #ffffff;
+        border: 1px solid #e53935;
+    }
+    
+    /* ═══════════════════════════════════════════════════════════════════
+       FRAMEWORK CARDS - Clean Selection
+       ═══════════════════════════════════════════════════════════════════ */
+    .framework-card {
+        background: var(--mono-pure-white);
+        border-radius: var(--radius-lg);
+        padding: 1rem;
+        margin: 0.35rem 0;
+        border: 1px solid var(--mono-gray-200);
+        transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
+        cursor: pointer;
+    }
+    
+    .framework-card:hover {
+        border-color: var(--mono-charcoal);
+        box-shadow: var(--shadow-md);
+        transform: translateX(4px);
+    }
+    
+    .framework-card.selected {
+        border-color: var(--mono-charcoal);
+        border-width: 2px;
+        background: var(--mono-gray-100);
+    }
+    
+    .framework-acronym {
+        background: var(--mono-charcoal);
+        color: var(--mono-pure-white);
+        padding: 0.2rem 0.6rem;
+        border-radius: 100px;
+        font-weight: 600;
+        font-size: 0.7rem;
+        display: inline-block;
+        margin-bottom: 0.35rem;
+    }
+    
+    /* ═══════════════════════════════════════════════════════════════════
+       ALERT BOXES - Ensure proper text colors
+       ═══════════════════════════════════════════════════════════════════ */
+    [data-testid="stAlert"] p,
+    [data-testid="stAlert"] span,
+    .stAlert p,
+    .stAlert span {
+        color: var(--mono-charcoal) !important;
+    }
+    
+    /* ═══════════════════════════════════════════════════════════════════
+       ANIMATIONS - Subtle & Professional
+       ═══════════════════════════════════════════════════════════════════ */
+    @keyframes fadeIn {
+        from { opacity: 0; transform: translateY(8px); }
+        to { opacity: 1; transform: translateY(0); }
+    }
+    
+    .fade-in {
+        animation: fadeIn 0.4s cubic-bezier(0.4, 0, 0.2, 1) forwards;
+    }
+    
+    @keyframes slideIn {
+        from { opacity: 0; transform: translateX(-12px); }
+        to { opacity: 1; transform: translateX(0); }
+    }
+    
+    .slide-in {
+        animation: slideIn 0.3s cubic-bezier(0.4, 0, 0.2, 1) forwards;
+    }
+    
+    /* ═══════════════════════════════════════════════════════════════════
+       RESPONSIVE DESIGN
+       ═══════════════════════════════════════════════════════════════════ */
+    @media (max-width: 768px) {
+        .hero-header {
+            padding: 1.75rem;
+            border-radius: var(--radius-xl);
         }
         
-        ::-webkit-scrollbar-thumb {
-            background: var(--mono-gray-300);
-            border-radius: 4px;
+        .hero-header h1 {
+            font-size: 1.6rem;
         }
         
-        ::-webkit-scrollbar-thumb:hover {
-            background: var(--mono-gray-400);
+        .stats-container {
+            gap: 0.4rem;
         }
         
-        /* ═══════════════════════════════════════════════════════════════════
-           SELECTION
-           ═══════════════════════════════════════════════════════════════════ */
-        ::selection {
-            background: var(--mono-charcoal);
-            color: var(--mono-pure-white);
+        .stats-badge {
+            font-size: 0.7rem;
+            padding: 0.375rem 0.75rem;
         }
-    </style>
-    """, unsafe_allow_html=True)
+    }
+    
+    /* ═══════════════════════════════════════════════════════════════════
+       v4.0 - AI CHAT INTERFACE - Sophisticated
+       ═══════════════════════════════════════════════════════════════════ */
+    .chat-container {
+        background: var(--gradient-subtle);
+        border-radius: var(--radius-xl);
+        padding: 1.25rem;
+        margin: 0.75rem 0;
+        border: 1px solid var(--mono-gray-200);
+        max-height: 500px;
+        overflow-y: auto;
+    }
+    
+    .chat-message {
+        display: flex;
+        gap: 0.75rem;
+        margin: 0.75rem 0;
+        animation: fadeIn 0.3s cubic-bezier(0.4, 0, 0.2, 1);
+    }
+    
+    .chat-message.user {
+        flex-direction: row-reverse;
+    }
+    
+    .chat-avatar {
+        width: 32px;
+        height: 32px;
+        border-radius: 50%;
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        font-size: 1rem;
+        flex-shrink: 0;
+    }
+    
+    .chat-avatar.assistant {
+        background: var(--mono-charcoal);
+        color: var(--mono-pure-white);
+    }
+    
+    .chat-avatar.user {
+        background: var(--mono-gray-200);
+        color: var(--mono-charcoal);
+    }
+    
+    .chat-bubble {
+        max-width: 70%;
+        padding: 0.75rem 1rem;
+        border-radius: var(--radius-lg);
+        position: relative;
+        font-size: 0.85rem;
+    }
+    
+    .chat-bubble.assistant {
+        background: var(--mono-pure-white);
+        border: 1px solid var(--mono-gray-200);
+        border-top-left-radius: 4px;
+        color: var(--mono-charcoal);
+    }
+    
+    .chat-bubble.user {
+        background: var(--mono-charcoal);
+        color: var(--mono-pure-white);
+        border-top-right-radius: 4px;
+    }
+    
+    /* ═══════════════════════════════════════════════════════════════════
+       v4.0 - SMART PROMPT BUILDER - Clean
+       ═══════════════════════════════════════════════════════════════════ */
+    .builder-container {
+        background: var(--mono-pure-white);
+        border-radius: var(--radius-xl);
+        padding: 1.25rem;
+        box-shadow: var(--shadow-lg);
+        border: 1px solid var(--mono-gray-200);
+        position: relative;
+    }
+    
+    .component-slot {
+        background: var(--mono-gray-100);
+        border: 2px dashed var(--mono-gray-300);
+        border-radius: var(--radius-md);
+        padding: 0.75rem;
+        margin: 0.35rem 0;
+        transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
+    }
+    
+    .component-slot:hover {
+        border-color: var(--mono-charcoal);
+        background: var(--mono-gray-100);
+    }
+    
+    .component-slot.filled {
+        border-style: solid;
+        border-color: var(--mono-charcoal);
+        background: var(--mono-pure-white);
+    }
+    
+    .preview-panel {
+        background: var(--mono-charcoal);
+        color: var(--mono-gray-200);
+        border-radius: var(--radius-lg);
+        padding: 2rem 1.25rem 1.25rem 1.25rem;
+        font-family: var(--font-mono);
+        font-size: 0.8rem;
+        line-height: 1.7;
+        position: relative;
+        overflow: hidden;
+    }
+    
+    .preview-panel::before {
+        content: '⌘ LIVE PREVIEW';
+        position: absolute;
+        top: 0;
+        left: 0;
+        right: 0;
+        padding: 0.35rem 0.75rem;
+        background: rgba(255,255,255,0.08);
+        font-size: 0.6rem;
+        font-weight: 600;
+        letter-spacing: 1.5px;
+        font-family: var(--font-primary);
+        color: var(--mono-gray-400);
+        z-index: 10;
+    }
+    
+    .preview-panel .content {
+        margin-top: 0.5rem;
+        position: relative;
+        z-index: 5;
+    }
+    
+    /* ═══════════════════════════════════════════════════════════════════
+       v4.0 - COMMAND PALETTE - Minimal
+       ═══════════════════════════════════════════════════════════════════ */
+    .command-palette-overlay {
+        position: fixed;
+        top: 0;
+        left: 0;
+        right: 0;
+        bottom: 0;
+        background: rgba(10, 10, 10, 0.6);
+        backdrop-filter: blur(8px);
+        -webkit-backdrop-filter: blur(8px);
+        z-index: 9999;
+        display: flex;
+        align-items: flex-start;
+        justify-content: center;
+        padding-top: 18vh;
+    }
+    
+    .command-palette {
+        background: var(--mono-pure-white);
+        border-radius: var(--radius-xl);
+        width: 90%;
+        max-width: 560px;
+        box-shadow: var(--shadow-xl);
+        overflow: hidden;
+        border: 1px solid var(--mono-gray-200);
+    }
+    
+    .command-input {
+        width: 100%;
+        padding: 1.25rem 1.5rem;
+        border: none;
+        border-bottom: 1px solid var(--mono-gray-200);
+        font-size: 1.05rem;
+        outline: none;
+        font-family: var(--font-primary);
+        font-weight: 500;
+    }
+    
+    .command-item {
+        padding: 0.875rem 1.5rem;
+        display: flex;
+        align-items: center;
+        gap: 1rem;
+        cursor: pointer;
+        transition: background 0.15s cubic-bezier(0.4, 0, 0.2, 1);
+        color: var(--mono-charcoal);
+    }
+    
+    .command-item:hover {
+        background: var(--mono-gray-100);
+    }
+    
+    .command-item.selected {
+        background: var(--mono-charcoal);
+        color: var(--mono-pure-white);
+    }
+    
+    .command-shortcut {
+        margin-left: auto;
+        font-size: 0.7rem;
+        padding: 0.25rem 0.6rem;
+        background: var(--mono-gray-200);
+        border-radius: 6px;
+        font-family: var(--font-mono);
+        color: var(--mono-gray-600);
+    }
+    
+    /* ═══════════════════════════════════════════════════════════════════
+       v4.0 - ANALYTICS DASHBOARD - Clean Data Display
+       ═══════════════════════════════════════════════════════════════════ */
+    .analytics-grid {
+        display: grid;
+        grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+        gap: 1rem;
+        margin: 1rem 0;
+    }
+    
+    .analytics-card {
+        background: var(--mono-pure-white);
+        border-radius: var(--radius-lg);
+        padding: 1.75rem;
+        box-shadow: var(--shadow-sm);
+        text-align: center;
+        transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
+        border: 1px solid var(--mono-gray-200);
+    }
+    
+    .analytics-card:hover {
+        transform: translateY(-3px);
+        box-shadow: var(--shadow-md);
+    }
+    
+    .analytics-value {
+        font-size: 2.75rem;
+        font-weight: 700;
+        color: var(--mono-charcoal);
+        line-height: 1;
+    }
+    
+    .analytics-label {
+        color: var(--mono-gray-500);
+        font-size: 0.875rem;
+        margin-top: 0.625rem;
+        font-weight: 500;
+    }
+    
+    .analytics-trend {
+        font-size: 0.75rem;
+        margin-top: 0.5rem;
+        font-weight: 600;
+    }
+    
+    .analytics-trend.up { color: var(--mono-gray-600); }
+    .analytics-trend.down { color: var(--mono-gray-500); }
+    
+    /* ═══════════════════════════════════════════════════════════════════
+       v4.0 - TEMPLATE GALLERY - Grid Cards
+       ═══════════════════════════════════════════════════════════════════ */
+    .template-gallery {
+        display: grid;
+        grid-template-columns: repeat(auto-fill, minmax(280px, 1fr));
+        gap: 1.5rem;
+        margin: 1.5rem 0;
+    }
+    
+    .template-card {
+        background: var(--mono-pure-white);
+        border-radius: var(--radius-lg);
+        overflow: hidden;
+        box-shadow: var(--shadow-sm);
+        transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
+        cursor: pointer;
+        border: 1px solid var(--mono-gray-200);
+    }
+    
+    .template-card:hover {
+        transform: translateY(-3px);
+        box-shadow: var(--shadow-md);
+        border-color: var(--mono-charcoal);
+    }
+    
+    .template-header {
+        background: var(--mono-charcoal);
+        color: var(--mono-pure-white);
+        padding: 1rem 1.25rem;
+        position: relative;
+    }
+    
+    .template-header h4 {
+        margin: 0;
+        font-size: 1rem;
+        font-weight: 600;
+    }
+    
+    .template-badge {
+        position: absolute;
+        top: 0.75rem;
+        right: 0.75rem;
+        background: var(--mono-pure-white);
+        color: var(--mono-charcoal);
+        padding: 0.2rem 0.625rem;
+        border-radius: 100px;
+        font-size: 0.65rem;
+        font-weight: 600;
+        letter-spacing: 0.02em;
+    }
+    
+    .template-body {
+        padding: 1.25rem;
+    }
+    
+    .template-body p {
+        color: var(--mono-gray-600);
+        font-size: 0.9rem;
+        margin: 0 0 1rem 0;
+        line-height: 1.6;
+    }
+    
+    .template-meta {
+        display: flex;
+        gap: 1rem;
+        font-size: 0.8rem;
+        color: var(--mono-gray-500);
+    }
+    
+    /* ═══════════════════════════════════════════════════════════════════
+       v4.0 - TOAST NOTIFICATIONS - Subtle
+       ═══════════════════════════════════════════════════════════════════ */
+    .toast-container {
+        position: fixed;
+        bottom: 2rem;
+        right: 2rem;
+        z-index: 9998;
+    }
+    
+    .toast {
+        background: var(--mono-pure-white);
+        border-radius: var(--radius-md);
+        padding: 1rem 1.5rem;
+        box-shadow: var(--shadow-lg);
+        margin-top: 0.5rem;
+        display: flex;
+        align-items: center;
+        gap: 0.75rem;
+        animation: slideInRight 0.3s cubic-bezier(0.4, 0, 0.2, 1);
+        border-left: 3px solid var(--mono-charcoal);
+    }
+    
+    .toast.success { border-left-color: var(--mono-gray-400); }
+    .toast.warning { border-left-color: var(--mono-gray-500); }
+    .toast.error { border-left-color: var(--mono-gray-700); }
+    
+    @keyframes slideInRight {
+        from { opacity: 0; transform: translateX(100px); }
+        to { opacity: 1; transform: translateX(0); }
+    }
+    
+    /* ═══════════════════════════════════════════════════════════════════
+       v4.0 - PROGRESS INDICATORS - Minimal
+       ═══════════════════════════════════════════════════════════════════ */
+    .progress-ring {
+        display: inline-flex;
+        align-items: center;
+        justify-content: center;
+        position: relative;
+    }
+    
+    .progress-ring svg {
+        transform: rotate(-90deg);
+    }
+    
+    .progress-ring circle {
+        fill: none;
+        stroke-width: 6;
+    }
+    
+    .progress-ring .bg { stroke: var(--mono-gray-200); }
+    .progress-ring .progress { stroke: var(--mono-charcoal); }
+    
+    .progress-value {
+        position: absolute;
+        font-weight: 700;
+        color: var(--mono-charcoal);
+    }
+    
+    /* ═══════════════════════════════════════════════════════════════════
+       v4.0 - KEYBOARD SHORTCUTS HINT - Sleek
+       ═══════════════════════════════════════════════════════════════════ */
+    .shortcuts-hint {
+        position: fixed;
+        bottom: 1.25rem;
+        left: 50%;
+        transform: translateX(-50%);
+        background: var(--mono-charcoal);
+        color: var(--mono-gray-200);
+        padding: 0.625rem 1.25rem;
+        border-radius: 100px;
+        font-size: 0.75rem;
+        display: flex;
+        gap: 1.5rem;
+        backdrop-filter: blur(20px);
+        -webkit-backdrop-filter: blur(20px);
+        box-shadow: var(--shadow-lg);
+        border: 1px solid rgba(255,255,255,0.1);
+        z-index: 9998;
+    }
+    
+    /* ═══════════════════════════════════════════════════════════════════
+       SP2 FIX - LAYOUT FIXES
+       ═══════════════════════════════════════════════════════════════════ */
+    /* Add bottom padding to main content to avoid overlap with shortcuts bar */
+    .main .block-container {
+        padding-bottom: 5rem !important;
+    }
+    
+    /* ═══════════════════════════════════════════════════════════════════
+       EXPANDER ICON FIX - NUCLEAR OPTION v3
+       Hide ALL possible Material Icons text in expanders
+       ═══════════════════════════════════════════════════════════════════ */
+    /* Target every possible element that might contain icon text */
+    [data-testid="stExpander"] summary > span:first-child,
+    [data-testid="stExpander"] summary [data-testid="stExpanderToggleIcon"],
+    [data-testid="stExpander"] summary span[class*="material"],
+    [data-testid="stExpander"] summary span[class*="icon"],
+    [data-testid="stExpander"] summary span[class*="Icon"],
+    [data-testid="stExpander"] details > summary > span:first-child,
+    details[data-testid="stExpander"] > summary > span:first-child {
+        display: none !important;
+        visibility: hidden !important;
+        width: 0 !important;
+        height: 0 !important;
+        max-width: 0 !important;
+        max-height: 0 !important;
+        overflow: hidden !important;
+        font-size: 0 !important;
+        line-height: 0 !important;
+        opacity: 0 !important;
+        position: absolute !important;
+        left: -9999px !important;
+    }
+    
+    /* Hide any element using Material Symbols font */
+    [data-testid="stExpander"] summary *[style*="Material"],
+    [data-testid="stExpander"] summary span:not(:has(p)):not(:has(div)) {
+        font-size: 0 !important;
+        color: transparent !important;
+        width: 0 !important;
+        overflow: hidden !important;
+    }
+    
+    /* Only show the paragraph text in expander summary */
+    [data-testid="stExpander"] summary p,
+    [data-testid="stExpander"] summary > div > p {
+        font-size: 0.9rem !important;
+        font-family: 'Quicksand', -apple-system, BlinkMacSystemFont, sans-serif !important;
+        color: var(--mono-charcoal) !important;
+        display: inline-block !important;
+        visibility: visible !important;
+        opacity: 1 !important;
+    }
+    
+    /* Style the expander with clean arrow */
+    [data-testid="stExpander"] {
+        position: relative;
+        z-index: 1;
+        overflow: hidden;
+    }
+    
+    [data-testid="stExpander"] summary {
+        display: flex;
+        align-items: center;
+        gap: 0.5rem;
+        cursor: pointer;
+        padding-left: 1.5rem !important;
+        position: relative;
+    }
+    
+    /* Add CSS-only arrow */
+    [data-testid="stExpander"]:not([open]) summary::before {
+        content: '▸' !important;
+        position: absolute !important;
+        left: 0.5rem !important;
+        top: 50% !important;
+        transform: translateY(-50%) !important;
+        font-size: 12px !important;
+        color: #737373 !important;
+        font-family: system-ui, sans-serif !important;
+    }
+    
+    [data-testid="stExpander"][open] summary::before {
+        content: '▾' !important;
+        position: absolute !important;
+        left: 0.5rem !important;
+        top: 50% !important;
+        transform: translateY(-50%) !important;
+        font-size: 12px !important;
+        color: #737373 !important;
+        font-family: system-ui, sans-serif !important;
+    }
+    
+    .shortcut-key {
+        background: rgba(255, 255, 255, 0.12);
+        padding: 0.2rem 0.5rem;
+        border-radius: 4px;
+        font-family: var(--font-mono);
+        margin-right: 0.5rem;
+        font-size: 0.7rem;
+    }
+    
+    /* ═══════════════════════════════════════════════════════════════════
+       v4.0 - SUBTLE EFFECTS
+       ═══════════════════════════════════════════════════════════════════ */
+    .glow-green {
+        box-shadow: var(--shadow-lg);
+    }
+    
+    .glow-gold {
+        box-shadow: var(--shadow-lg);
+    }
+    
+    .pulse-glow {
+        /* Removed for cleaner monochrome aesthetic */
+    }
+    
+    /* ═══════════════════════════════════════════════════════════════════
+       SCROLLBAR - Minimal
+       ═══════════════════════════════════════════════════════════════════ */
+    ::-webkit-scrollbar {
+        width: 8px;
+        height: 8px;
+    }
+    
+    ::-webkit-scrollbar-track {
+        background: var(--mono-gray-100);
+        border-radius: 4px;
+    }
+    
+    ::-webkit-scrollbar-thumb {
+        background: var(--mono-gray-300);
+        border-radius: 4px;
+    }
+    
+    ::-webkit-scrollbar-thumb:hover {
+        background: var(--mono-gray-400);
+    }
+    
+    /* ═══════════════════════════════════════════════════════════════════
+       SELECTION
+       ═══════════════════════════════════════════════════════════════════ */
+    ::selection {
+        background: var(--mono-charcoal);
+        color: var(--mono-pure-white);
+    }
+</style>
+"""
+
+def inject_custom_css():
+    """Inject ultra-modern monochrome CSS styling with Quicksand font"""
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
 
 inject_custom_css()
 
@@ -1493,6 +1528,13 @@ def toggle_favorite(prompt_id: str):
             entry['favorited'] = not entry['favorited']
             break
 
+def resolve_selection(label: str, options: Dict[str, str], registry: Dict[str, Any]) -> Tuple[Optional[str], Any]:
+    """Map a selector label to (registry key, entry), or (None, None) when nothing is selected"""
+    key = options.get(label)
+    if key is None:
+        return None, None
+    return key, registry[key]
+
 def get_risk_badge(risk_level: str) -> str:
     """Get HTML badge for risk level"""
     risk_map = {
@@ -2276,7 +2318,7 @@ def render_smart_builder():
         )
         
         # Framework selector
-        framework_options = ["Auto-detect"] + [f"{fw.acronym} - {fw.name}" for fw in ALL_FRAMEWORKS.values()]
+        framework_options = ["Auto-detect"] + list(FRAMEWORK_OPTIONS)
         selected_fw = st.selectbox("Base Framework", framework_options, key="builder_fw_select")
         
         # Optimization Mode Selector - Enhanced with new modes
@@ -2449,10 +2491,12 @@ def render_smart_builder():
         score_color = "🟢" if quality_score >= 70 else "🟡" if quality_score >= 40 else "🔴"
         st.markdown(f"### Prompt Quality: {score_color} {int(quality_score)}/100")
         
-        # Preview panel
+        # Preview panel (the preview echoes user input, so escape it before
+        # it goes into raw HTML)
+        preview_html = html.escape(preview_text, quote=False).replace(chr(10), '<br>')
         st.markdown(f"""
         <div class="preview-panel">
-            <div class="content">{preview_text.replace(chr(10), '<br>')}</div>
+            <div class="content">{preview_html}</div>
         </div>
         """, unsafe_allow_html=True)
         
@@ -2681,7 +2725,7 @@ def render_analytics_dashboard():
     with col4:
         st.markdown(f"""
         <div class="analytics-card">
-            <div class="analytics-value">{len(list(OptimizationMode))}</div>
+            <div class="analytics-value">{N_OPTIMIZATION_MODES}</div>
             <div class="analytics-label">AI Modes Available</div>
         </div>
         """, unsafe_allow_html=True)
@@ -3153,7 +3197,8 @@ def render_mode_comparison():
     selected_mode = st.selectbox(
         "Select a mode to view details:",
         options=list(mode_details.keys()),
-        format_func=lambda x: mode_details[x]["name"]
+        format_func=lambda x: mode_details[x]["name"],
+        key="mode_compare_select"
     )
     
     if selected_mode:
@@ -3275,38 +3320,37 @@ def render_template_gallery():
 # COMPONENTS
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# Static part of the hero banner; render_header() only appends the session
+# productivity badge. Streamlit re-executes this script on every rerun, so the
+# string is still rebuilt per run (a single cheap f-string).
+TOTAL_RESOURCES = (
+    N_FRAMEWORKS + N_COURTS + N_LEGISLATION + N_GUIDELINES + N_PRACTICE_PROMPTS +
+    N_DOCUMENT_TEMPLATES + N_WORKFLOWS + len(QUICK_TEMPLATES)
+)
+HEADER_HTML_HEAD = f"""<div class="hero-header">
+    <h1>⚖️ SA Legal Prompting Elite</h1>
+    <p class="subtitle">World-Class AI Prompting Platform for South African Legal Professionals</p>
+    <div class="stats-container">
+        <span class="stats-badge">AI Assistant</span>
+        <span class="stats-badge">Smart Builder</span>
+        <span class="stats-badge">{N_OPTIMIZATION_MODES} AI Modes</span>
+        <span class="stats-badge">{N_FRAMEWORKS} Frameworks</span>
+        <span class="stats-badge">{N_COURTS} Courts</span>
+        <span class="stats-badge">{N_LEGISLATION} Statutes</span>
+        <span class="stats-badge">{N_PRACTICE_PROMPTS + len(QUICK_TEMPLATES)} Templates</span>
+        <span class="stats-badge gold">{TOTAL_RESOURCES}+ Resources</span>
+        <span class="stats-badge gold">"""
+HEADER_HTML_TAIL = """</span>
+    </div>
+</div>"""
+
 def render_header():
     """Render the hero header - Ultra Modern Monochrome Edition"""
-    total_resources = (
-        len(ALL_FRAMEWORKS) + len(ALL_SPECIALIST_COURTS) + len(ALL_LEGISLATION) + 
-        len(ALL_GUIDELINES) + len(ALL_PRACTICE_PROMPTS) + len(ALL_DOCUMENT_TEMPLATES) + 
-        len(ALL_WORKFLOWS) + len(QUICK_TEMPLATES)
-    )
-    
     # Calculate session productivity
     session_prompts = st.session_state.prompt_count
     productivity = "🔥 On Fire" if session_prompts > 10 else "⚡ Active" if session_prompts > 5 else "✨ Ready"
     
-    # Count optimization modes
-    num_modes = len(list(OptimizationMode))
-    
-    st.markdown(f"""
-    <div class="hero-header">
-        <h1>⚖️ SA Legal Prompting Elite</h1>
-        <p class="subtitle">World-Class AI Prompting Platform for South African Legal Professionals</p>
-        <div class="stats-container">
-            <span class="stats-badge">AI Assistant</span>
-            <span class="stats-badge">Smart Builder</span>
-            <span class="stats-badge">{num_modes} AI Modes</span>
-            <span class="stats-badge">{len(ALL_FRAMEWORKS)} Frameworks</span>
-            <span class="stats-badge">{len(ALL_SPECIALIST_COURTS)} Courts</span>
-            <span class="stats-badge">{len(ALL_LEGISLATION)} Statutes</span>
-            <span class="stats-badge">{len(ALL_PRACTICE_PROMPTS) + len(QUICK_TEMPLATES)} Templates</span>
-            <span class="stats-badge gold">{total_resources}+ Resources</span>
-            <span class="stats-badge gold">{productivity}</span>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(HEADER_HTML_HEAD + productivity + HEADER_HTML_TAIL, unsafe_allow_html=True)
 
 def render_sidebar():
     """Render the sidebar with navigation and tools - Ultra Modern Monochrome"""
@@ -3504,6 +3548,202 @@ def render_prompt_output(prompt: str, source: str = "Generated Prompt"):
             add_to_history(prompt, source, {'favorited': True})
             st.toast("⭐ Added to favorites!")
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# CACHED PROMPT BUILDERS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+# Streamlit re-runs the whole script on every widget change (and re-clicking
+# Generate with the same text is common); registry entries never change, so
+# prompts are memoised on (registry key, user text). The script is executed
+# into a fresh module on every rerun, so a functools cache here would start
+# empty each time; st.cache_data keeps the entries for the whole process.
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def cached_framework_prompt(fw_key: str, user_context: str) -> str:
+    """Build the framework prompt for a framework key and user context"""
+    fw = ALL_FRAMEWORKS[fw_key]
+    prompt = f"""# {fw.name} ({fw.acronym}) Prompt
+
+## Context
+{user_context}
+
+## Framework Application
+"""
+    for comp in fw.components:
+        prompt += f"\n### {comp.letter} - {comp.component}\n"
+        prompt += f"*{comp.description}*\n"
+        prompt += f"[Apply this to your context]\n"
+    
+    prompt += f"""
+## SA-Specific Requirements
+- Use SAFLII neutral citation format
+- Reference SA legislation by Act number
+- Apply Constitutional Court methodology where relevant
+- Consider ubuntu and transformative constitutionalism principles
+- Verify all citations independently
+
+## SA Legal Adaptations for {fw.acronym}
+"""
+    for adaptation in fw.sa_adaptations:
+        prompt += f"• {adaptation}\n"
+    return prompt
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def cached_court_guidance(court_key: str) -> str:
+    """Prompt guidance for a specialist court"""
+    return generate_court_prompt_guidance(ALL_SPECIALIST_COURTS[court_key])
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def cached_legislation_prompt(leg_key: str, question: str) -> str:
+    """Legislation prompt for a legislation key and question"""
+    return generate_legislation_prompt(ALL_LEGISLATION[leg_key], question)
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def cached_practice_prompt(p_key: str, user_input: str) -> str:
+    """Practice prompt for a practice prompt key and case details"""
+    return generate_practice_prompt(ALL_PRACTICE_PROMPTS[p_key], user_input)
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def cached_document_prompt(d_key: str, doc_details: str) -> str:
+    """Document drafting prompt for a template key and document details"""
+    return generate_document_prompt(ALL_DOCUMENT_TEMPLATES[d_key], doc_details)
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def cached_step_prompt(wf_key: str, step_number: int, user_context: str) -> str:
+    """Workflow step prompt with the user's context appended (if any)"""
+    full_prompt = get_step_prompt(ALL_WORKFLOWS[wf_key], step_number)
+    if user_context:
+        full_prompt += f"\n\n---\n## Your Context\n{user_context}"
+    return full_prompt
+
+def bullet_markdown(items: Sequence[str], marker: str = "•") -> str:
+    """Render a list as one markdown block (one paragraph per item)"""
+    return "\n\n".join(f"{marker} {item}" for item in items)
+
+# Section-card markup, formatted once per registry entry by the cached builders
+# below (st.cache_data, so the cards survive reruns).
+# Field values are HTML-escaped before substitution.
+FRAMEWORK_CARD_TEMPLATE = """<div class="section-card">
+    <span class="framework-acronym">{acronym}</span>
+    <h3>{name}</h3>
+    <p>{description}</p>
+</div>"""
+COURT_SAFLII_CARD_TEMPLATE = """<div class="section-card">
+    <h3>📍 SAFLII Code</h3>
+    <p style="font-size: 1.5rem; font-weight: bold; color: #007A4D;">{saflii_code}</p>
+</div>"""
+COURT_LEGISLATION_CARD_TEMPLATE = """<div class="section-card gold-accent">
+    <h3>📜 Establishing Legislation</h3>
+    <p>{establishing_legislation}</p>
+</div>"""
+COURT_APPEAL_CARD_TEMPLATE = """<div class="section-card red-accent">
+    <h3>⬆️ Appeal Route</h3>
+    <p>{appeal_route}</p>
+</div>"""
+LEGISLATION_CARD_TEMPLATE = """<div class="section-card">
+    <h3>{full_title}</h3>
+    <p><strong>Act Number:</strong> {act_number}</p>
+    <p>{purpose}</p>
+</div>"""
+TITLE_CARD_TEMPLATE = """<div class="section-card">
+    <h3>{title}</h3>
+    <p>{description}</p>
+</div>"""
+PRACTICE_CARD_TEMPLATE = """<div class="section-card">
+    <h3>{title}</h3>
+    <p><strong>Practice Area:</strong> {practice_area}</p>
+    <p><strong>Type:</strong> {prompt_type}</p>
+    <p>{description}</p>
+</div>"""
+DOCUMENT_CARD_TEMPLATE = """<div class="section-card">
+    <h3>{title}</h3>
+    <p><strong>Category:</strong> {category}</p>
+    <p><strong>Est. Time:</strong> {time_estimate}</p>
+    <p>{description}</p>
+</div>"""
+WORKFLOW_CARD_TEMPLATE = """<div class="section-card">
+    <h3>{title}</h3>
+    <p><strong>Category:</strong> {category}</p>
+    <p><strong>Complexity:</strong> {complexity}</p>
+    <p><strong>Total Time:</strong> {total_time}</p>
+    <p>{description}</p>
+</div>"""
+
+def render_card(template: str, **fields: str) -> str:
+    """Fill a card template with HTML-escaped field values (element text only)"""
+    return template.format(**{name: html.escape(str(value), quote=False) for name, value in fields.items()})
+
+@st.cache_data(show_spinner=False)
+def framework_card_html(fw_key: str) -> str:
+    """Header card for a framework"""
+    fw = ALL_FRAMEWORKS[fw_key]
+    return render_card(FRAMEWORK_CARD_TEMPLATE, acronym=fw.acronym, name=fw.name, description=fw.description)
+
+@st.cache_data(show_spinner=False)
+def court_cards_html(court_key: str) -> Tuple[str, str, str]:
+    """SAFLII code, establishing legislation and appeal route cards for a court"""
+    court = ALL_SPECIALIST_COURTS[court_key]
+    return (
+        render_card(COURT_SAFLII_CARD_TEMPLATE, saflii_code=court.saflii_code),
+        render_card(COURT_LEGISLATION_CARD_TEMPLATE, establishing_legislation=court.establishing_legislation),
+        render_card(COURT_APPEAL_CARD_TEMPLATE, appeal_route=court.appeal_route),
+    )
+
+@st.cache_data(show_spinner=False)
+def legislation_card_html(leg_key: str) -> str:
+    """Header card for a piece of legislation"""
+    leg = ALL_LEGISLATION[leg_key]
+    return render_card(LEGISLATION_CARD_TEMPLATE, full_title=leg.full_title, act_number=leg.act_number, purpose=leg.purpose)
+
+@st.cache_data(show_spinner=False)
+def guideline_card_html(g_key: str) -> str:
+    """Header card for an ethical guideline"""
+    guideline = ALL_GUIDELINES[g_key]
+    return render_card(TITLE_CARD_TEMPLATE, title=guideline.title, description=guideline.description)
+
+@st.cache_data(show_spinner=False)
+def scenario_card_html(scenario_name: str) -> str:
+    """Card for an AI use scenario"""
+    scenario = AI_USE_SCENARIOS_BY_NAME[scenario_name]
+    return render_card(TITLE_CARD_TEMPLATE, title=scenario.scenario, description=scenario.recommended_approach)
+
+@st.cache_data(show_spinner=False)
+def practice_card_html(p_key: str) -> str:
+    """Header card for a practice area prompt"""
+    practice_prompt = ALL_PRACTICE_PROMPTS[p_key]
+    return render_card(
+        PRACTICE_CARD_TEMPLATE,
+        title=practice_prompt.title,
+        practice_area=practice_prompt.practice_area.value,
+        prompt_type=practice_prompt.prompt_type.value,
+        description=practice_prompt.description,
+    )
+
+@st.cache_data(show_spinner=False)
+def document_card_html(d_key: str) -> str:
+    """Header card for a document template"""
+    doc = ALL_DOCUMENT_TEMPLATES[d_key]
+    return render_card(
+        DOCUMENT_CARD_TEMPLATE,
+        title=doc.title,
+        category=doc.category.value,
+        time_estimate=doc.time_estimate,
+        description=doc.description,
+    )
+
+@st.cache_data(show_spinner=False)
+def workflow_card_html(wf_key: str) -> str:
+    """Header card for a workflow"""
+    workflow = ALL_WORKFLOWS[wf_key]
+    return render_card(
+        WORKFLOW_CARD_TEMPLATE,
+        title=workflow.title,
+        category=workflow.category.value,
+        complexity=workflow.complexity,
+        total_time=workflow.total_estimated_time,
+        description=workflow.description,
+    )
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # TAB CONTENT RENDERERS
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -3514,8 +3754,7 @@ def render_frameworks_tab():
     st.markdown("Select a proven framework to structure your legal AI prompts for optimal results.")
     
     # Category filter
-    categories = list(set(fw.category.value for fw in ALL_FRAMEWORKS.values()))
-    selected_category = st.selectbox("Filter by Category", ["All"] + sorted(categories), key="fw_category")
+    selected_category = st.selectbox("Filter by Category", ("All",) + FRAMEWORK_CATEGORY_LABELS, key="fw_category")
     
     # Framework selection
     col1, col2 = st.columns([1, 2])
@@ -3524,7 +3763,8 @@ def render_frameworks_tab():
         st.markdown("### Available Frameworks")
         frameworks = ALL_FRAMEWORKS
         if selected_category != "All":
-            frameworks = {k: v for k, v in ALL_FRAMEWORKS.items() if v.category.value == selected_category}
+            # Registry keys are the acronyms; StrEnum keys match the plain label
+            frameworks = {fw.acronym: fw for fw in FRAMEWORKS_BY_CATEGORY[selected_category]}
         
         for key, fw in frameworks.items():
             difficulty_color = {"Beginner": "🟢", "Intermediate": "🟡", "Advanced": "🔴"}.get(fw.difficulty, "⚪")
@@ -3539,13 +3779,7 @@ def render_frameworks_tab():
         if st.session_state.selected_framework and st.session_state.selected_framework in ALL_FRAMEWORKS:
             fw = ALL_FRAMEWORKS[st.session_state.selected_framework]
             
-            st.markdown(f"""
-            <div class="section-card">
-                <span class="framework-acronym">{fw.acronym}</span>
-                <h3>{fw.name}</h3>
-                <p>{fw.description}</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(framework_card_html(st.session_state.selected_framework), unsafe_allow_html=True)
             
             # Framework details
             col_a, col_b, col_c = st.columns(3)
@@ -3560,15 +3794,14 @@ def render_frameworks_tab():
             if st.session_state.show_tips:
                 with st.expander("Framework Components", expanded=True):
                     for comp in fw.components:
-                        st.markdown(f"**{comp.get('letter', '')} - {comp.get('component', '')}**")
-                        st.caption(comp.get('description', ''))
-                        if comp.get('example'):
-                            st.info(f"Example: {comp['example'][:150]}...")
+                        st.markdown(f"**{comp.letter} - {comp.component}**")
+                        st.caption(comp.description)
+                        if comp.example:
+                            st.info(f"Example: {comp.example[:150]}...")
             
             # SA Adaptations
             with st.expander("SA Legal Adaptations"):
-                for adaptation in fw.sa_adaptations:
-                    st.markdown(f"• {adaptation}")
+                st.markdown(bullet_markdown(fw.sa_adaptations))
             
             # Generate prompt
             st.markdown("### Generate Your Prompt")
@@ -3581,32 +3814,7 @@ def render_frameworks_tab():
             
             if st.button("🚀 Generate Framework Prompt", type="primary", key="generate_fw"):
                 if user_context:
-                    # Generate prompt using framework structure
-                    prompt = f"""# {fw.name} ({fw.acronym}) Prompt
-
-## Context
-{user_context}
-
-## Framework Application
-"""
-                    for comp in fw.components:
-                        prompt += f"\n### {comp.get('letter', '')} - {comp.get('component', '')}\n"
-                        prompt += f"*{comp.get('description', '')}*\n"
-                        prompt += f"[Apply this to your context]\n"
-                    
-                    prompt += f"""
-## SA-Specific Requirements
-- Use SAFLII neutral citation format
-- Reference SA legislation by Act number
-- Apply Constitutional Court methodology where relevant
-- Consider ubuntu and transformative constitutionalism principles
-- Verify all citations independently
-
-## SA Legal Adaptations for {fw.acronym}
-"""
-                    for adaptation in fw.sa_adaptations:
-                        prompt += f"• {adaptation}\n"
-                    
+                    prompt = cached_framework_prompt(st.session_state.selected_framework, user_context)
                     st.markdown("### 📋 Generated Prompt")
                     render_prompt_output(prompt, f"Framework: {fw.acronym}")
                 else:
@@ -3624,44 +3832,29 @@ def render_courts_tab():
     st.markdown("Comprehensive guidance for appearances before South Africa's specialist courts.")
     
     # Court category filter
-    categories = list(set(court.category.value for court in ALL_SPECIALIST_COURTS.values()))
-    selected_category = st.selectbox("Filter by Category", ["All"] + sorted(categories), key="court_category")
+    selected_category = st.selectbox("Filter by Category", ("All",) + COURT_CATEGORY_LABELS, key="court_category")
     
     # Court selection
-    courts = ALL_SPECIALIST_COURTS
+    court_names = COURT_OPTIONS
     if selected_category != "All":
-        courts = {k: v for k, v in ALL_SPECIALIST_COURTS.items() if v.category.value == selected_category}
-    
-    court_names = {f"{c.name} ({c.saflii_code})": key for key, c in courts.items()}
+        court_names = {
+            label: key for label, key in COURT_OPTIONS.items()
+            if ALL_SPECIALIST_COURTS[key].category.value == selected_category
+        }
     selected_court = st.selectbox("🏛️ Select Court", options=[""] + list(court_names.keys()), key="court_select")
     
-    if selected_court and selected_court in court_names:
-        court_key = court_names[selected_court]
-        court = ALL_SPECIALIST_COURTS[court_key]
+    court_key, court = resolve_selection(selected_court, COURT_OPTIONS, ALL_SPECIALIST_COURTS)
+    if court is not None:
         
         # Court info cards
         col1, col2, col3 = st.columns(3)
+        saflii_card, legislation_card, appeal_card = court_cards_html(court_key)
         with col1:
-            st.markdown(f"""
-            <div class="section-card">
-                <h3>📍 SAFLII Code</h3>
-                <p style="font-size: 1.5rem; font-weight: bold; color: #007A4D;">{court.saflii_code}</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(saflii_card, unsafe_allow_html=True)
         with col2:
-            st.markdown(f"""
-            <div class="section-card gold-accent">
-                <h3>📜 Establishing Legislation</h3>
-                <p>{court.establishing_legislation}</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(legislation_card, unsafe_allow_html=True)
         with col3:
-            st.markdown(f"""
-            <div class="section-card red-accent">
-                <h3>⬆️ Appeal Route</h3>
-                <p>{court.appeal_route}</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(appeal_card, unsafe_allow_html=True)
         
         # Jurisdiction details
         with st.expander("Jurisdiction Details", expanded=True):
@@ -3674,8 +3867,7 @@ def render_courts_tab():
             practice_areas = getattr(court, 'key_practice_areas', None)
             if practice_areas:
                 st.markdown("**Key Practice Areas:**")
-                for area in practice_areas:
-                    st.markdown(f"• {area}")
+                st.markdown(bullet_markdown(practice_areas))
             
             # Display any additional court info
             court_cat = getattr(court, 'category', None)
@@ -3685,7 +3877,7 @@ def render_courts_tab():
         
         # Generate court prompt guidance
         st.markdown("### 📋 Prompt Guidance for This Court")
-        prompt_guidance = generate_court_prompt_guidance(court)
+        prompt_guidance = cached_court_guidance(court_key)
         render_prompt_output(prompt_guidance, f"Court: {court.name}")
 
 def render_legislation_tab():
@@ -3694,20 +3886,12 @@ def render_legislation_tab():
     st.markdown("Access structured prompts for South Africa's most important statutes.")
     
     # Legislation selection
-    leg_names = {f"{leg.short_title} ({leg.act_number})": key for key, leg in ALL_LEGISLATION.items()}
-    selected_leg = st.selectbox("📜 Select Legislation", options=[""] + sorted(list(leg_names.keys())), key="leg_select")
+    selected_leg = st.selectbox("📜 Select Legislation", options=("",) + LEGISLATION_LABELS, key="leg_select")
     
-    if selected_leg and selected_leg in leg_names:
-        leg_key = leg_names[selected_leg]
-        leg = ALL_LEGISLATION[leg_key]
+    leg_key, leg = resolve_selection(selected_leg, LEGISLATION_OPTIONS, ALL_LEGISLATION)
+    if leg is not None:
         
-        st.markdown(f"""
-        <div class="section-card">
-            <h3>{leg.full_title}</h3>
-            <p><strong>Act Number:</strong> {leg.act_number}</p>
-            <p>{leg.purpose}</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(legislation_card_html(leg_key), unsafe_allow_html=True)
         
         # Key provisions
         with st.expander("Key Provisions", expanded=True):
@@ -3729,7 +3913,7 @@ def render_legislation_tab():
         
         if st.button("🚀 Generate Legislation Prompt", type="primary", key="generate_leg"):
             if leg_question:
-                prompt = generate_legislation_prompt(leg, leg_question)
+                prompt = cached_legislation_prompt(leg_key, leg_question)
                 st.markdown("### 📋 Generated Prompt")
                 render_prompt_output(prompt, f"Legislation: {leg.short_title}")
             else:
@@ -3744,48 +3928,32 @@ def render_ethics_tab():
     
     with col1:
         st.markdown("### Ethical Guidelines")
-        guideline_names = {g.title: key for key, g in ALL_GUIDELINES.items()}
-        selected_guideline = st.selectbox("Select Guideline", options=[""] + list(guideline_names.keys()), key="ethics_select")
+        selected_guideline = st.selectbox("Select Guideline", options=["", *GUIDELINE_OPTIONS], key="ethics_select")
         
-        if selected_guideline and selected_guideline in guideline_names:
-            g_key = guideline_names[selected_guideline]
-            guideline = ALL_GUIDELINES[g_key]
+        g_key, guideline = resolve_selection(selected_guideline, GUIDELINE_OPTIONS, ALL_GUIDELINES)
+        if guideline is not None:
             
-            st.markdown(f"""
-            <div class="section-card">
-                <h3>{guideline.title}</h3>
-                <p>{guideline.description}</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(guideline_card_html(g_key), unsafe_allow_html=True)
             
             if hasattr(guideline, 'requirements'):
                 with st.expander("Requirements"):
-                    for req in guideline.requirements[:5]:
-                        st.markdown(f"• {req}")
+                    st.markdown(bullet_markdown(guideline.requirements[:5]))
     
     with col2:
         st.markdown("### AI Use Risk Assessment")
-        scenario_names = [s.scenario for s in AI_USE_SCENARIOS]
-        selected_scenario = st.selectbox("Select Scenario", options=[""] + scenario_names, key="scenario_select")
+        selected_scenario = st.selectbox("Select Scenario", options=["", *AI_USE_SCENARIOS_BY_NAME], key="scenario_select")
         
         if selected_scenario:
-            scenario = next((s for s in AI_USE_SCENARIOS if s.scenario == selected_scenario), None)
-            if scenario:
-                # Risk assessment
-                risk_val = scenario.risk_level.value if hasattr(scenario.risk_level, 'value') else str(scenario.risk_level)
-                st.markdown(get_risk_badge(risk_val), unsafe_allow_html=True)
-                
-                st.markdown(f"""
-                <div class="section-card">
-                    <h3>{scenario.scenario}</h3>
-                    <p>{scenario.recommended_approach}</p>
-                </div>
-                """, unsafe_allow_html=True)
-                
-                if hasattr(scenario, 'safeguards_required'):
-                    with st.expander("Safeguards Required"):
-                        for sf in scenario.safeguards_required:
-                            st.markdown(f"✓ {sf}")
+            # Options are exactly the scenario names, so the lookup cannot miss
+            scenario = AI_USE_SCENARIOS_BY_NAME[selected_scenario]
+            # Risk assessment
+            st.markdown(get_risk_badge(scenario.risk_level), unsafe_allow_html=True)
+            
+            st.markdown(scenario_card_html(scenario.scenario), unsafe_allow_html=True)
+            
+            if hasattr(scenario, 'safeguards_required'):
+                with st.expander("Safeguards Required"):
+                    st.markdown(bullet_markdown(scenario.safeguards_required, "✓"))
     
     # Ethics checklist generator
     st.markdown("---")
@@ -3854,32 +4022,24 @@ def render_practice_tab():
     st.markdown("Specialized prompts tailored for each South African legal practice area.")
     
     # Practice area filter
-    areas = list(set(p.practice_area.value for p in ALL_PRACTICE_PROMPTS.values()))
-    selected_area = st.selectbox("Filter by Practice Area", ["All"] + sorted(areas), key="practice_area")
+    selected_area = st.selectbox("Filter by Practice Area", ("All",) + PRACTICE_AREA_LABELS, key="practice_area")
     
     # Filter prompts
-    prompts = ALL_PRACTICE_PROMPTS
+    prompt_labels = PRACTICE_PROMPT_LABELS
     if selected_area != "All":
-        prompts = {k: v for k, v in ALL_PRACTICE_PROMPTS.items() if v.practice_area.value == selected_area}
-    
-    prompt_names = {p.title: key for key, p in prompts.items()}
-    selected_prompt = st.selectbox("📋 Select Prompt Template", options=[""] + sorted(list(prompt_names.keys())), key="practice_select")
+        prompt_labels = tuple(
+            label for label in PRACTICE_PROMPT_LABELS
+            if ALL_PRACTICE_PROMPTS[PRACTICE_PROMPT_OPTIONS[label]].practice_area.value == selected_area
+        )
+    selected_prompt = st.selectbox("📋 Select Prompt Template", options=("",) + prompt_labels, key="practice_select")
     
-    if selected_prompt and selected_prompt in prompt_names:
-        p_key = prompt_names[selected_prompt]
-        practice_prompt = ALL_PRACTICE_PROMPTS[p_key]
+    p_key, practice_prompt = resolve_selection(selected_prompt, PRACTICE_PROMPT_OPTIONS, ALL_PRACTICE_PROMPTS)
+    if practice_prompt is not None:
         
         col1, col2 = st.columns([2, 1])
         
         with col1:
-            st.markdown(f"""
-            <div class="section-card">
-                <h3>{practice_prompt.title}</h3>
-                <p><strong>Practice Area:</strong> {practice_prompt.practice_area.value}</p>
-                <p><strong>Type:</strong> {practice_prompt.prompt_type.value}</p>
-                <p>{practice_prompt.description}</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(practice_card_html(p_key), unsafe_allow_html=True)
         
         with col2:
             if st.session_state.show_tips:
@@ -3891,12 +4051,10 @@ def render_practice_tab():
         col_a, col_b = st.columns(2)
         with col_a:
             with st.expander("📜 Key Legislation"):
-                for leg in practice_prompt.key_legislation:
-                    st.markdown(f"• {leg}")
+                st.markdown(bullet_markdown(practice_prompt.key_legislation))
         with col_b:
             with st.expander("⚖️ Key Cases"):
-                for case in practice_prompt.key_cases[:5]:
-                    st.markdown(f"• {case}")
+                st.markdown(bullet_markdown(practice_prompt.key_cases[:5]))
         
         # Generate practice prompt
         st.markdown("### 📝 Generate Your Prompt")
@@ -3909,7 +4067,7 @@ def render_practice_tab():
         
         if st.button("🚀 Generate Practice Prompt", type="primary", key="generate_practice"):
             if user_input:
-                prompt = generate_practice_prompt(practice_prompt, user_input)
+                prompt = cached_practice_prompt(p_key, user_input)
                 st.markdown("### 📋 Generated Prompt")
                 render_prompt_output(prompt, f"Practice: {practice_prompt.title}")
             else:
@@ -3921,34 +4079,23 @@ def render_documents_tab():
     st.markdown("AI-assisted document drafting templates for South African legal practice.")
     
     # Category filter
-    categories = list(set(d.category.value for d in ALL_DOCUMENT_TEMPLATES.values()))
-    selected_category = st.selectbox("Filter by Category", ["All"] + sorted(categories), key="doc_category")
+    selected_category = st.selectbox("Filter by Category", ("All",) + DOCUMENT_CATEGORY_LABELS, key="doc_category")
     
     # Filter documents
-    docs = ALL_DOCUMENT_TEMPLATES
+    doc_labels = DOCUMENT_TEMPLATE_LABELS
     if selected_category != "All":
-        docs = {k: v for k, v in ALL_DOCUMENT_TEMPLATES.items() if v.category.value == selected_category}
+        # Titles are the selector labels; StrEnum keys match the plain label
+        doc_labels = tuple(sorted(d.title for d in DOCUMENT_TEMPLATES_BY_CATEGORY[selected_category]))
+    selected_doc = st.selectbox("📄 Select Document Template", options=("",) + doc_labels, key="doc_select")
     
-    doc_names = {d.title: key for key, d in docs.items()}
-    selected_doc = st.selectbox("📄 Select Document Template", options=[""] + sorted(list(doc_names.keys())), key="doc_select")
-    
-    if selected_doc and selected_doc in doc_names:
-        d_key = doc_names[selected_doc]
-        doc = ALL_DOCUMENT_TEMPLATES[d_key]
+    d_key, doc = resolve_selection(selected_doc, DOCUMENT_TEMPLATE_OPTIONS, ALL_DOCUMENT_TEMPLATES)
+    if doc is not None:
         
-        st.markdown(f"""
-        <div class="section-card">
-            <h3>{doc.title}</h3>
-            <p><strong>Category:</strong> {doc.category.value}</p>
-            <p><strong>Est. Time:</strong> {doc.time_estimate}</p>
-            <p>{doc.description}</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(document_card_html(d_key), unsafe_allow_html=True)
         
         # Use cases
         with st.expander("🎯 Use Cases"):
-            for use_case in doc.use_cases:
-                st.markdown(f"• {use_case}")
+            st.markdown(bullet_markdown(doc.use_cases))
         
         # Document structure
         with st.expander("📑 Document Structure", expanded=True):
@@ -3979,7 +4126,7 @@ def render_documents_tab():
         
         if st.button("🚀 Generate Document Prompt", type="primary", key="generate_doc"):
             if doc_details:
-                prompt = generate_document_prompt(doc, doc_details)
+                prompt = cached_document_prompt(d_key, doc_details)
                 st.markdown("### 📋 Generated Prompt")
                 render_prompt_output(prompt, f"Document: {doc.title}")
             else:
@@ -3991,42 +4138,37 @@ def render_workflows_tab():
     st.markdown("Multi-step AI-assisted workflows for complex legal matters.")
     
     # Category filter
-    categories = list(set(w.category.value for w in ALL_WORKFLOWS.values()))
-    selected_category = st.selectbox("Filter by Category", ["All"] + sorted(categories), key="wf_category")
+    selected_category = st.selectbox("Filter by Category", ("All",) + WORKFLOW_CATEGORY_LABELS, key="wf_category")
     
     # Filter workflows
-    workflows = ALL_WORKFLOWS
+    wf_labels = WORKFLOW_LABELS
     if selected_category != "All":
-        workflows = {k: v for k, v in ALL_WORKFLOWS.items() if v.category.value == selected_category}
-    
-    wf_names = {w.title: key for key, w in workflows.items()}
-    selected_wf = st.selectbox("🔄 Select Workflow", options=[""] + sorted(list(wf_names.keys())), key="wf_select")
+        wf_labels = tuple(
+            label for label in WORKFLOW_LABELS
+            if ALL_WORKFLOWS[WORKFLOW_OPTIONS[label]].category.value == selected_category
+        )
+    selected_wf = st.selectbox("🔄 Select Workflow", options=("",) + wf_labels, key="wf_select")
     
-    if selected_wf and selected_wf in wf_names:
-        wf_key = wf_names[selected_wf]
-        workflow = ALL_WORKFLOWS[wf_key]
+    wf_key, workflow = resolve_selection(selected_wf, WORKFLOW_OPTIONS, ALL_WORKFLOWS)
+    if workflow is not None:
         
-        st.markdown(f"""
-        <div class="section-card">
-            <h3>{workflow.title}</h3>
-            <p><strong>Category:</strong> {workflow.category.value}</p>
-            <p><strong>Complexity:</strong> {workflow.complexity}</p>
-            <p><strong>Total Time:</strong> {workflow.total_estimated_time}</p>
-            <p>{workflow.description}</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(workflow_card_html(wf_key), unsafe_allow_html=True)
         
         # Workflow steps
         st.markdown("### 📋 Workflow Steps")
         
-        # Step selection slider
+        # Step selection slider (keyed per workflow so a shorter workflow
+        # never inherits an out-of-range step from the previous selection).
+        # The chosen step is remembered per workflow in session state and
+        # restored when the user comes back to this workflow.
         current_step = st.slider(
             "Select Step",
             min_value=1,
-            max_value=len(workflow.steps),
-            value=1,
-            key="wf_step_slider"
+            max_value=workflow.n_steps,
+            value=st.session_state.workflow_steps.get(wf_key, 1),
+            key=f"wf_step_slider_{wf_key}"
         )
+        st.session_state.workflow_steps[wf_key] = current_step
         
         # Display steps with progress
         for i, step in enumerate(workflow.steps):
@@ -4056,11 +4198,7 @@ def render_workflows_tab():
                     )
                     
                     if st.button("🚀 Generate Step Prompt", key=f"gen_step_{i}"):
-                        # Get base prompt and append user context
-                        base_prompt = get_step_prompt(workflow, step.step_number)
-                        full_prompt = base_prompt
-                        if user_context:
-                            full_prompt += f"\n\n---\n## Your Context\n{user_context}"
+                        full_prompt = cached_step_prompt(wf_key, step.step_number, user_context)
                         render_prompt_output(full_prompt, f"Workflow: {workflow.title} - Step {step.step_number}")
                 
                 # Human actions
@@ -4196,9 +4334,61 @@ def render_reference_tab():
         render_documents_tab()
 
 
+# Input widgets inside the main sections. Only the active section is rendered,
+# and Streamlit drops the state of any widget that is not rendered in a run, so
+# these keys are re-assigned at the start of every run to keep what the user
+# typed or picked when they switch sections and come back. Buttons cannot be
+# set through session state, and the prompt output boxes mirror current_prompt,
+# so neither is listed. The workflow step sliders keep their own store
+# (workflow_steps).
+SECTION_WIDGET_KEYS = frozenset({
+    # Build
+    "build_subtab_radio", "builder_mode_toggle", "quick_practice_area", "quick_context",
+    "builder_preset", "builder_fw_select", "builder_opt_mode", "builder_output_format",
+    "builder_role", "builder_context", "builder_task", "builder_constraints",
+    "builder_output", "builder_examples", "gallery_filter", "mode_compare_select",
+    # Reference
+    "reference_subtab_radio", "fw_category", "fw_context", "court_category", "court_select",
+    "leg_select", "leg_question", "ethics_select", "scenario_select", "ethics_context",
+    "practice_area", "practice_select", "practice_input", "doc_category", "doc_select", "doc_input",
+    # Workflows
+    "wf_category", "wf_select",
+})
+# Per-step workflow widgets: step context boxes and action/verification checkboxes
+SECTION_WIDGET_PREFIXES = ("action_", "verify_")
+
+def is_section_widget_key(key: str) -> bool:
+    """True for section widget keys whose state must survive switching sections"""
+    return (
+        key in SECTION_WIDGET_KEYS
+        or key.startswith(SECTION_WIDGET_PREFIXES)
+        or (key.startswith("wf_step_") and key.endswith("_context"))
+    )
+
+def persist_section_widgets():
+    """Carry section widget values over runs in which their section is hidden"""
+    for key in [k for k in st.session_state if is_section_widget_key(k)]:
+        st.session_state[key] = st.session_state[key]
+
+# Footer content only depends on registry sizes. Streamlit re-executes this
+# script on every rerun, so it is rebuilt per run like the header banner.
+FOOTER_HTML = f"""<div style="text-align: center; padding: 2.5rem 1rem; opacity: 0.6;">
+    <p style="margin: 0; font-weight: 600; font-size: 0.9rem;">SA Legal Prompting Elite Platform</p>
+    <p style="margin: 0.5rem 0 0 0; font-size: 0.8rem;">World-Class AI Prompting for South African Legal Professionals</p>
+    <p style="font-size: 0.75rem; margin-top: 0.75rem; color: #888;">
+        v4.4.0 Advanced AI Edition • {N_OPTIMIZATION_MODES} Optimization Modes • {N_FRAMEWORKS} Frameworks
+    </p>
+    <p style="font-size: 0.7rem; margin-top: 0.75rem; letter-spacing: 0.05em;">
+        © 2024-2026 • Built for Excellence • Made in South Africa 🇿🇦
+    </p>
+</div>"""
+
 def main():
     """Main application entry point - v4.1 Enhanced UX Edition"""
     
+    # Keep inputs of hidden sections (must run before any widget is created)
+    persist_section_widgets()
+    
     # Render sidebar
     render_sidebar()
     
@@ -4211,17 +4401,19 @@ def main():
     # Render header
     render_header()
     
-    # v4.1 - Consolidated tabs (5 main tabs for better UX)
-    tab_home, tab_build, tab_reference, tab_workflows, tab_analytics = st.tabs([
-        "🏠 Home",
-        "🔨 Build", 
-        "📚 Reference",
-        "🔄 Workflows",
-        "📊 Analytics"
-    ])
+    # v4.1 - Consolidated sections (5 main sections for better UX). A
+    # horizontal radio rather than st.tabs: tabs execute every panel on each
+    # rerun, while the radio only renders the active section.
+    selected_section = st.radio(
+        "Section",
+        ["🏠 Home", "🔨 Build", "📚 Reference", "🔄 Workflows", "📊 Analytics"],
+        horizontal=True,
+        key="main_nav_radio",
+        label_visibility="collapsed"
+    )
     
     # HOME TAB - AI Chat Assistant + Quick Templates
-    with tab_home:
+    if selected_section == "🏠 Home":
         home_col1, home_col2 = st.columns([2, 1], vertical_alignment="top")
         with home_col1:
             render_ai_chat()
@@ -4248,11 +4440,12 @@ def main():
                     st.rerun()
     
     # BUILD TAB - Smart Prompt Builder + Templates Gallery + Mode Comparison
-    with tab_build:
+    elif selected_section == "🔨 Build":
         build_subtab = st.radio(
             "Build Mode",
             ["Smart Builder", "Template Gallery", "Mode Comparison"],
             horizontal=True,
+            key="build_subtab_radio",
             label_visibility="collapsed"
         )
         st.markdown("---")
@@ -4265,15 +4458,15 @@ def main():
             render_mode_comparison()
     
     # REFERENCE TAB - Consolidated with sub-navigation
-    with tab_reference:
+    elif selected_section == "📚 Reference":
         render_reference_tab()
     
     # WORKFLOWS TAB
-    with tab_workflows:
+    elif selected_section == "🔄 Workflows":
         render_workflows_tab()
     
     # ANALYTICS TAB
-    with tab_analytics:
+    elif selected_section == "📊 Analytics":
         render_analytics_dashboard()
     
     # v4.0 - Keyboard shortcuts hint
@@ -4288,18 +4481,7 @@ def main():
     
     # Footer - Clean Monochrome with version info
     st.markdown("---")
-    st.markdown(f"""
-    <div style="text-align: center; padding: 2.5rem 1rem; opacity: 0.6;">
-        <p style="margin: 0; font-weight: 600; font-size: 0.9rem;">SA Legal Prompting Elite Platform</p>
-        <p style="margin: 0.5rem 0 0 0; font-size: 0.8rem;">World-Class AI Prompting for South African Legal Professionals</p>
-        <p style="font-size: 0.75rem; margin-top: 0.75rem; color: #888;">
-            v4.4.0 Advanced AI Edition • {len(list(OptimizationMode))} Optimization Modes • {len(ALL_FRAMEWORKS)} Frameworks
-        </p>
-        <p style="font-size: 0.7rem; margin-top: 0.75rem; letter-spacing: 0.05em;">
-            © 2024-2026 • Built for Excellence • Made in South Africa 🇿🇦
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(FOOTER_HTML, unsafe_allow_html=True)
 
 if __name__ == "__main__":
     main()
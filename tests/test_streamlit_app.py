@@ -0,0 +1,67 @@
+"""
+AppTest checks for streamlit_app.py section navigation
+"""
+
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+APP_PATH = str(Path(__file__).resolve().parent.parent / "streamlit_app.py")
+
+
+def _started_app() -> AppTest:
+    """Run the app once with onboarding already completed"""
+    at = AppTest.from_file(APP_PATH, default_timeout=60)
+    at.session_state["onboarded"] = True
+    at.run()
+    return at
+
+
+def _switch_section(at: AppTest, section: str) -> None:
+    at.radio(key="main_nav_radio").set_value(section).run()
+    assert not at.exception
+
+
+def test_build_input_survives_switching_sections():
+    at = _started_app()
+    _switch_section(at, "🔨 Build")
+    at.text_area(key="quick_context").input("MY ROLE TEXT").run()
+
+    _switch_section(at, "📚 Reference")
+    _switch_section(at, "🔨 Build")
+
+    assert at.text_area(key="quick_context").value == "MY ROLE TEXT"
+
+
+def test_reference_selection_survives_switching_sections():
+    at = _started_app()
+    _switch_section(at, "📚 Reference")
+    at.radio(key="reference_subtab_radio").set_value("Documents").run()
+    doc_select = at.selectbox(key="doc_select")
+    chosen = doc_select.options[1]
+    doc_select.set_value(chosen).run()
+    at.text_area(key="doc_input").input("Lease for Unit 4").run()
+
+    _switch_section(at, "🔄 Workflows")
+    _switch_section(at, "📚 Reference")
+
+    assert at.radio(key="reference_subtab_radio").value == "Documents"
+    assert at.selectbox(key="doc_select").value == chosen
+    assert at.text_area(key="doc_input").value == "Lease for Unit 4"
+
+
+def test_workflow_step_survives_switching_sections():
+    at = _started_app()
+    _switch_section(at, "🔄 Workflows")
+    wf_select = at.selectbox(key="wf_select")
+    wf_select.set_value(wf_select.options[1]).run()
+    slider = next(s for s in at.slider if s.key.startswith("wf_step_slider_"))
+    slider.set_value(2).run()
+    at.text_area(key="wf_step_1_context").input("Step two notes").run()
+
+    _switch_section(at, "🏠 Home")
+    _switch_section(at, "🔄 Workflows")
+
+    slider = next(s for s in at.slider if s.key.startswith("wf_step_slider_"))
+    assert slider.value == 2
+    assert at.text_area(key="wf_step_1_context").value == "Step two notes"